@@ -13,7 +13,8 @@ from fastapi import APIRouter, HTTPException, Query, Path
 from pydantic import BaseModel, Field
 
 from src.database.connection import get_session
-from src.database.models import GridCellModel, GridMetricsModel, BusinessModel
+from src.database.models import GridCellModel, GridMetricsModel
+from src.database.queries import BUSINESSES_BY_GRID_CAT
 
 logger = logging.getLogger("startsmart.api.grid_detail")
 
@@ -337,15 +338,10 @@ async def get_grid_detail(
             
             # If no competitors from JSON, try to get from businesses table
             if not competitors and metrics:
-                businesses = (
-                    session.query(BusinessModel)
-                    .filter(
-                        BusinessModel.grid_id == grid_id,
-                        BusinessModel.category == category.value
-                    )
-                    .limit(10)
-                    .all()
-                )
+                businesses = session.execute(
+                    BUSINESSES_BY_GRID_CAT,
+                    {"grid_id": grid_id, "category": category.value, "limit": 10}
+                ).scalars().all()
                 competitors = [
                     Competitor(
                         name=b.name,
@@ -96,7 +96,7 @@ async def list_neighborhoods() -> List[NeighborhoodResponse]:
             results = (
                 session.query(
                     GridCellModel.neighborhood,
-                    func.count(GridCellModel.grid_id).label("grid_count")
+                    func.count().label("grid_count")
                 )
                 .group_by(GridCellModel.neighborhood)
                 .order_by(GridCellModel.neighborhood)
@@ -189,7 +189,7 @@ async def get_llm_recommendation(
     try:
         logger.info(f"LLM recommendation request: lat={lat}, lon={lon}")
         
-        result = pipeline.recommend(
+        result = await pipeline.arecommend(
             lat=lat,
             lon=lon,
             grid_id=grid_id,
@@ -238,7 +238,7 @@ async def get_fast_recommendation(
     try:
         logger.info(f"Fast recommendation request: lat={lat}, lon={lon}")
         
-        result = pipeline.recommend(
+        result = await pipeline.arecommend(
             lat=lat,
             lon=lon,
             grid_id=grid_id,
@@ -282,7 +282,7 @@ async def get_debug_recommendation(
     try:
         pipeline_mode = PipelineMode.FULL if mode == "full" else PipelineMode.FAST
         
-        result = pipeline.recommend(
+        result = await pipeline.arecommend(
             lat=lat,
             lon=lon,
             grid_id=grid_id,
@@ -356,18 +356,20 @@ async def get_batch_recommendations(
         
         pipeline_mode = PipelineMode.FULL if mode == "full" else PipelineMode.FAST
         
-        results = []
-        for loc in locations:
-            result = pipeline.recommend(
-                lat=loc.lat,
-                lon=loc.lon,
-                grid_id=loc.grid_id,
-                radius_meters=loc.radius_meters or 500,
-                mode=pipeline_mode
-            )
-            results.append(result.to_api_response())
+        results = await pipeline.arecommend_batch(
+            [
+                {
+                    "lat": loc.lat,
+                    "lon": loc.lon,
+                    "grid_id": loc.grid_id,
+                    "radius_meters": loc.radius_meters or 500
+                }
+                for loc in locations
+            ],
+            mode=pipeline_mode
+        )
         
-        return results
+        return [result.to_api_response() for result in results]
         
     except Exception as e:
         logger.error(f"Batch recommendation error: {e}")
@@ -13,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from src.database.connection import get_session
 from src.database.models import GridCellModel, GridMetricsModel
+from src.database.queries import TOP_METRICS_BY_NEIGHBORHOOD_CAT
 
 logger = logging.getLogger("startsmart.api.recommendations")
 
@@ -188,18 +189,14 @@ async def get_recommendations(
                 )
             
             # Query top grids by GOS
-            results = (
-                session.query(GridCellModel, GridMetricsModel)
-                .join(
-                    GridMetricsModel,
-                    (GridCellModel.grid_id == GridMetricsModel.grid_id) &
-                    (GridMetricsModel.category == category.value)
-                )
-                .filter(GridCellModel.neighborhood == neighborhood)
-                .order_by(GridMetricsModel.gos.desc())
-                .limit(limit)
-                .all()
-            )
+            results = session.execute(
+                TOP_METRICS_BY_NEIGHBORHOOD_CAT,
+                {
+                    "neighborhood": neighborhood,
+                    "category": category.value,
+                    "limit": limit,
+                }
+            ).all()
             
             if not results:
                 # Return empty recommendations if no scored grids
@@ -0,0 +1,101 @@
+"""
+Session I/O Lint Check
+
+Flags external HTTP/API calls made inside `with get_session():` blocks.
+A session holds a pool connection for its whole lifetime, so network I/O
+(Google Places, Groq, plain HTTP) must happen before the session is opened.
+
+Usage:
+    python backend/scripts/check_session_io.py            # scan src/, api/, scripts/
+    python backend/scripts/check_session_io.py path/to.py # scan specific files
+
+Exit code is 1 if any violation is found.
+"""
+
+import ast
+import sys
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Context managers that open a database session
+SESSION_FACTORIES = {"get_session", "get_write_session"}
+
+# Module prefixes whose calls are network I/O
+IO_MODULES = ("requests.", "httpx.", "urllib.request.")
+
+# Client methods that hit an external API (Google Places, adapters)
+IO_METHODS = {"places_nearby", "fetch_businesses"}
+
+# Call-name suffixes that hit an external API (Groq/OpenAI-style clients)
+IO_SUFFIXES = ("chat.completions.create",)
+
+
+def _dotted_name(node: ast.AST) -> str:
+    """Return 'a.b.c' for a Name/Attribute chain, '' otherwise."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return ""
+
+
+def _opens_session(node: ast.With) -> bool:
+    for item in node.items:
+        call = item.context_expr
+        if isinstance(call, ast.Call) and _dotted_name(call.func).split(".")[-1] in SESSION_FACTORIES:
+            return True
+    return False
+
+
+def _is_io_call(call: ast.Call) -> bool:
+    name = _dotted_name(call.func)
+    if name.startswith(IO_MODULES) or name.endswith(IO_SUFFIXES):
+        return True
+    return isinstance(call.func, ast.Attribute) and call.func.attr in IO_METHODS
+
+
+def find_violations(source: str, filename: str = "<string>") -> Iterator[Tuple[int, str]]:
+    """Yield (line, call name) for every I/O call inside a session block."""
+    tree = ast.parse(source, filename=filename)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.With) and _opens_session(node):
+            for stmt in node.body:
+                for inner in ast.walk(stmt):
+                    if isinstance(inner, ast.Call) and _is_io_call(inner):
+                        yield inner.lineno, _dotted_name(inner.func) or "<call>"
+
+
+def main(paths: List[str]) -> int:
+    if paths:
+        files = [Path(p) for p in paths]
+    else:
+        files = [
+            f for d in ("src", "api", "scripts")
+            for f in sorted((BACKEND_DIR / d).rglob("*.py"))
+        ]
+
+    violations = 0
+    for path in files:
+        try:
+            source = path.read_text(encoding="utf-8")
+        except OSError as e:
+            print(f"⚠️  Could not read {path}: {e}")
+            continue
+        for lineno, name in find_violations(source, str(path)):
+            print(f"{path}:{lineno}: external call '{name}' inside a database session")
+            violations += 1
+
+    if violations:
+        print(f"\n❌ {violations} external call(s) made while holding a DB session")
+        return 1
+    print("✅ No external calls inside database sessions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
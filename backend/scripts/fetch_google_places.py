@@ -45,9 +45,10 @@ except ImportError:
     print("Note: Install tqdm for better progress bars (pip install tqdm)")
 
 from src.adapters import GooglePlacesAdapter, create_adapter
-from src.database.connection import get_session
+from src.database.connection import get_session, get_write_session
+from src.database.views import refresh_grid_category_metrics
 from src.database.models import GridCellModel, BusinessModel
-from src.services.geospatial_service import assign_grid_id
+from src.services.geospatial_service import init_geospatial_service
 from src.utils.logger import get_logger
 
 
@@ -289,6 +290,10 @@ def fetch_and_populate(
     print(f"Dry-run mode: {dry_run}")
     print()
     
+    # Load the grid index once up front; the adapter assigns a grid_id
+    # to every fetched business
+    init_geospatial_service()
+    
     # Create adapter
     try:
         if api_key:
@@ -343,7 +348,7 @@ def fetch_and_populate(
             
             # Save to database (if not dry-run)
             if not dry_run:
-                with get_session() as session:
+                with get_write_session() as session:
                     for business in businesses:
                         action, success = save_business_to_db(business, session)
                         
@@ -368,6 +373,12 @@ def fetch_and_populate(
             if not HAS_TQDM:
                 print(f"ERROR: {str(e)[:50]}")
     
+    # Refresh precomputed aggregates once per ingestion run
+    if not dry_run:
+        with get_write_session() as session:
+            refresh_grid_category_metrics(session)
+            session.commit()
+    
     # Calculate duration
     stats["duration"] = time.time() - start_time
     
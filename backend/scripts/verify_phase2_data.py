@@ -33,7 +33,7 @@ def main():
             session.query(
             BusinessModel.grid_id,
             BusinessModel.category,
-            func.count(BusinessModel.business_id).label('count')
+            func.count().label('count')
         )
         .group_by(BusinessModel.grid_id, BusinessModel.category)
         .order_by(BusinessModel.grid_id, BusinessModel.category)
@@ -50,7 +50,7 @@ def main():
     else:
         print("⚠️  No businesses found in database")
     
-    total_businesses = session.query(func.count(BusinessModel.business_id)).scalar()
+    total_businesses = session.query(func.count()).select_from(BusinessModel).scalar()
     print(f"\n{'TOTAL BUSINESSES:':<45} {total_businesses:>10}")
     
     # 2. Social posts per grid and post type
@@ -60,7 +60,7 @@ def main():
         session.query(
             SocialPostModel.grid_id,
             SocialPostModel.post_type,
-            func.count(SocialPostModel.post_id).label('count')
+            func.count().label('count')
         )
         .group_by(SocialPostModel.grid_id, SocialPostModel.post_type)
         .order_by(SocialPostModel.grid_id, SocialPostModel.post_type)
@@ -76,7 +76,7 @@ def main():
     else:
         print("⚠️  No social posts found in database")
     
-    total_posts = session.query(func.count(SocialPostModel.post_id)).scalar()
+    total_posts = session.query(func.count()).select_from(SocialPostModel).scalar()
     print(f"\n{'TOTAL SOCIAL POSTS:':<45} {total_posts:>10}")
     
     # 3. Grids with zero businesses
@@ -102,7 +102,7 @@ def main():
     print("-" * 70)
     
     # Total grids
-    total_grids = session.query(func.count(GridCellModel.grid_id)).scalar()
+    total_grids = session.query(func.count()).select_from(GridCellModel).scalar()
     print(f"Total grid cells: {total_grids}")
     
     # Grids with businesses
@@ -88,26 +88,29 @@ from src.adapters import create_adapter
 adapter = create_adapter()
 
 # Get all grids in a neighborhood
+# (read bounds first, then call the API with the session closed)
 with get_session() as session:
     grids = session.query(GridCellModel).filter_by(
         neighborhood="DHA Phase 2"
     ).all()
-    
-    all_businesses = []
-    for grid in grids:
-        bounds = {
+    grid_bounds = [
+        (grid.grid_id, {
             "lat_north": float(grid.lat_north),
             "lat_south": float(grid.lat_south),
             "lon_east": float(grid.lon_east),
             "lon_west": float(grid.lon_west)
-        }
-        
-        print(f"Fetching businesses for {grid.grid_id}...")
-        businesses = adapter.fetch_businesses(category="Gym", bounds=bounds)
-        all_businesses.extend(businesses)
-        print(f"  Found {len(businesses)} businesses")
-    
-    print(f"\nTotal: {len(all_businesses)} businesses across {len(grids)} grids")
+        })
+        for grid in grids
+    ]
+
+all_businesses = []
+for grid_id, bounds in grid_bounds:
+    print(f"Fetching businesses for {grid_id}...")
+    businesses = adapter.fetch_businesses(category="Gym", bounds=bounds)
+    all_businesses.extend(businesses)
+    print(f"  Found {len(businesses)} businesses")
+
+print(f"\nTotal: {len(all_businesses)} businesses across {len(grid_bounds)} grids")
 
 
 # ============================================================================
@@ -7,6 +7,8 @@ operations should go through the session factory provided here.
 Components:
     - connection: SQLAlchemy engine and session management
     - models: ORM models matching contracts/database_schema.sql
+    - queries: precompiled Core statements for hot API queries
+    - views: grid_category_metrics materialized view DDL and refresh
 
 Usage:
     from src.database import get_session
@@ -19,6 +21,7 @@ Usage:
 # Import database connection components
 from .connection import (
     get_session,
+    get_write_session,
     get_session_direct,
     engine,
     Base,
@@ -35,6 +38,7 @@ from .models import (
     SocialPostModel,
     GridMetricsModel,
     UserFeedbackModel,
+    GridCategoryMetricsView,
     get_all_models,
     get_model_by_table_name,
 )
@@ -42,6 +46,7 @@ from .models import (
 __all__ = [
     # Connection management
     "get_session",
+    "get_write_session",
     "get_session_direct",
     "engine",
     "Base",
@@ -56,6 +61,7 @@ __all__ = [
     "SocialPostModel",
     "GridMetricsModel",
     "UserFeedbackModel",
+    "GridCategoryMetricsView",
     # Helper functions
     "get_all_models",
     "get_model_by_table_name",
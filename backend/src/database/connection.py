@@ -34,8 +34,13 @@ Base = declarative_base()
 class MockSession:
     """Mock session that does nothing - database operations are disabled."""
     
+    def __init__(self, expire_on_commit: bool = False):
+        # Mirrors sessionmaker(expire_on_commit=...) so callers can tell
+        # read sessions from write sessions.
+        self.expire_on_commit = expire_on_commit
+    
     def execute(self, *args, **kwargs):
-        return None
+        return MockResult()
     
     def query(self, *args, **kwargs):
         return MockQuery()
@@ -90,6 +95,31 @@ class MockQuery:
         return self
 
 
+class MockResult:
+    """Mock result of session.execute() that returns empty results."""
+    
+    def scalars(self):
+        return self
+    
+    def yield_per(self, *args, **kwargs):
+        return self
+    
+    def __iter__(self):
+        return iter(())
+    
+    def scalar(self):
+        return None
+    
+    def all(self):
+        return []
+    
+    def first(self):
+        return None
+    
+    def fetchone(self):
+        return None
+
+
 class MockEngine:
     """Mock engine that does nothing."""
     
@@ -105,13 +135,39 @@ class MockEngine:
 engine = MockEngine()
 
 
+# Session scope rule:
+# `with get_session()` / `with get_write_session()` must wrap ONLY the
+# database work. Never call Google Places, Groq or any other external
+# HTTP API inside the block - fetch first, then open a session for the
+# upsert. Holding a pooled connection across a 200-800ms network call
+# starves other requests. scripts/check_session_io.py enforces this.
+#
+# Session factories:
+# - Read sessions use expire_on_commit=False so objects loaded before a
+#   commit can still be serialized without a re-SELECT per attribute.
+# - Write sessions keep the SQLAlchemy default (expire_on_commit=True) so
+#   mutated rows are reloaded after commit.
+
 @contextmanager
 def get_session() -> Generator[MockSession, None, None]:
     """
-    Provides a mock database session.
+    Provides a mock read-only database session (expire_on_commit=False).
+    Database is disabled - this is a no-op.
+    """
+    session = MockSession(expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        pass
+
+
+@contextmanager
+def get_write_session() -> Generator[MockSession, None, None]:
+    """
+    Provides a mock database session for mutating operations (expire_on_commit=True).
     Database is disabled - this is a no-op.
     """
-    session = MockSession()
+    session = MockSession(expire_on_commit=True)
     try:
         yield session
     finally:
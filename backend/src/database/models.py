@@ -8,6 +8,7 @@ CRITICAL RULES:
 - Column names and types MUST match SQL schema exactly
 - Grid IDs are strings (e.g., "DHA-Phase2-Cell-07"), not integers
 - Use DECIMAL for precise numeric values (ratings, scores)
+- Use DOUBLE PRECISION (Double) for coordinates: hardware FP, 8 bytes/value
 - All models have to_dict() for JSON serialization
 - All models have from_pydantic() for Pydantic conversion
 
@@ -24,11 +25,11 @@ from typing import Optional, Dict, Any
 from decimal import Decimal
 
 from sqlalchemy import (
-    Column, String, Integer, Float, DateTime, Boolean, Text,
-    ForeignKey, Index, CheckConstraint, DECIMAL, func
+    Column, String, Integer, Float, Double, DateTime, Boolean, Text,
+    ForeignKey, Index, CheckConstraint, DECIMAL, MetaData, Table, func
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 from src.database.connection import Base
 
@@ -53,12 +54,12 @@ class GridCellModel(Base):
     # Columns (match database_schema.sql exactly)
     grid_id = Column(String(50), primary_key=True)
     neighborhood = Column(String(100), nullable=False)
-    lat_center = Column(DECIMAL(10, 7), nullable=False)
-    lon_center = Column(DECIMAL(10, 7), nullable=False)
-    lat_north = Column(DECIMAL(10, 7), nullable=False)
-    lat_south = Column(DECIMAL(10, 7), nullable=False)
-    lon_east = Column(DECIMAL(10, 7), nullable=False)
-    lon_west = Column(DECIMAL(10, 7), nullable=False)
+    lat_center = Column(Double, nullable=False)
+    lon_center = Column(Double, nullable=False)
+    lat_north = Column(Double, nullable=False)
+    lat_south = Column(Double, nullable=False)
+    lon_east = Column(Double, nullable=False)
+    lon_west = Column(Double, nullable=False)
     area_km2 = Column(DECIMAL(5, 2), default=0.5)
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -78,7 +79,7 @@ class GridCellModel(Base):
         return (
             f"<GridCell(grid_id='{self.grid_id}', "
             f"neighborhood='{self.neighborhood}', "
-            f"center=({float(self.lat_center)}, {float(self.lon_center)}))>"
+            f"center=({self.lat_center}, {self.lon_center}))>"
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -86,12 +87,12 @@ class GridCellModel(Base):
         return {
             "grid_id": self.grid_id,
             "neighborhood": self.neighborhood,
-            "lat_center": float(self.lat_center),
-            "lon_center": float(self.lon_center),
-            "lat_north": float(self.lat_north),
-            "lat_south": float(self.lat_south),
-            "lon_east": float(self.lon_east),
-            "lon_west": float(self.lon_west),
+            "lat_center": self.lat_center,
+            "lon_center": self.lon_center,
+            "lat_north": self.lat_north,
+            "lat_south": self.lat_south,
+            "lon_east": self.lon_east,
+            "lon_west": self.lon_west,
             "area_km2": float(self.area_km2),
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
@@ -110,12 +111,12 @@ class GridCellModel(Base):
         return cls(
             grid_id=pydantic_model.grid_id,
             neighborhood=pydantic_model.neighborhood,
-            lat_center=Decimal(str(pydantic_model.lat_center)),
-            lon_center=Decimal(str(pydantic_model.lon_center)),
-            lat_north=Decimal(str(pydantic_model.lat_north)),
-            lat_south=Decimal(str(pydantic_model.lat_south)),
-            lon_east=Decimal(str(pydantic_model.lon_east)),
-            lon_west=Decimal(str(pydantic_model.lon_west)),
+            lat_center=pydantic_model.lat_center,
+            lon_center=pydantic_model.lon_center,
+            lat_north=pydantic_model.lat_north,
+            lat_south=pydantic_model.lat_south,
+            lon_east=pydantic_model.lon_east,
+            lon_west=pydantic_model.lon_west,
             area_km2=Decimal(str(pydantic_model.area_km2)),
             created_at=pydantic_model.created_at,
         )
@@ -142,8 +143,8 @@ class BusinessModel(Base):
     # Columns (match database_schema.sql exactly)
     business_id = Column(String(100), primary_key=True)
     name = Column(String(255), nullable=False)
-    lat = Column(DECIMAL(10, 7), nullable=False)
-    lon = Column(DECIMAL(10, 7), nullable=False)
+    lat = Column(Double, nullable=False)
+    lon = Column(Double, nullable=False)
     category = Column(String(50), nullable=False)  # 'Gym', 'Cafe', etc.
     rating = Column(DECIMAL(2, 1), nullable=True)  # 0.0 to 5.0
     review_count = Column(Integer, default=0)
@@ -157,8 +158,12 @@ class BusinessModel(Base):
     # Indexes
     __table_args__ = (
         Index('idx_business_category', 'category'),
-        Index('idx_business_grid_category', 'grid_id', 'category'),
-        Index('idx_business_location', 'lat', 'lon'),
+        # Covering index: per-grid aggregates (COUNT/AVG(rating)/SUM(review_count))
+        # become index-only scans on PostgreSQL
+        Index('idx_business_grid_category', 'grid_id', 'category',
+              postgresql_include=['rating', 'review_count']),
+        # BRIN: tiny summary index for the grid-bbox (lat/lon range) pattern
+        Index('idx_business_location', 'lat', 'lon', postgresql_using='brin'),
         Index('idx_business_source', 'source'),
     )
     
@@ -176,8 +181,8 @@ class BusinessModel(Base):
         return {
             "business_id": self.business_id,
             "name": self.name,
-            "lat": float(self.lat),
-            "lon": float(self.lon),
+            "lat": self.lat,
+            "lon": self.lon,
             "category": self.category,
             "rating": float(self.rating) if self.rating is not None else None,
             "review_count": self.review_count,
@@ -200,8 +205,8 @@ class BusinessModel(Base):
         return cls(
             business_id=pydantic_model.business_id,
             name=pydantic_model.name,
-            lat=Decimal(str(pydantic_model.lat)),
-            lon=Decimal(str(pydantic_model.lon)),
+            lat=pydantic_model.lat,
+            lon=pydantic_model.lon,
             category=pydantic_model.category.value if hasattr(pydantic_model.category, 'value') else pydantic_model.category,
             rating=Decimal(str(pydantic_model.rating)) if pydantic_model.rating is not None else None,
             review_count=pydantic_model.review_count,
@@ -234,8 +239,8 @@ class SocialPostModel(Base):
     source = Column(String(50), nullable=False)  # 'instagram', 'reddit', 'simulated'
     text = Column(Text, nullable=True)
     timestamp = Column(DateTime, nullable=True)
-    lat = Column(DECIMAL(10, 7), nullable=True)
-    lon = Column(DECIMAL(10, 7), nullable=True)
+    lat = Column(Double, nullable=True)
+    lon = Column(Double, nullable=True)
     grid_id = Column(String(50), ForeignKey('grid_cells.grid_id', ondelete='SET NULL'), nullable=True)
     post_type = Column(String(50), nullable=True)  # 'demand', 'complaint', 'mention'
     engagement_score = Column(Integer, default=0)
@@ -248,8 +253,12 @@ class SocialPostModel(Base):
     # Indexes
     __table_args__ = (
         Index('idx_post_grid_type', 'grid_id', 'post_type'),
+        # Matches the aggregator filter: grid_id + source + post_type IN (...)
+        Index('idx_social_grid_type', 'grid_id', 'source', 'post_type'),
         Index('idx_post_source', 'source'),
-        Index('idx_post_timestamp', 'timestamp'),
+        # BRIN: posts are append-mostly and only range-scanned by time
+        Index('idx_post_timestamp', 'timestamp', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
         Index('idx_post_simulated', 'is_simulated'),
         # Partial index for non-null locations (PostgreSQL specific)
         Index('idx_post_location', 'lat', 'lon', postgresql_where=(Column('lat').isnot(None))),
@@ -271,8 +280,8 @@ class SocialPostModel(Base):
             "source": self.source,
             "text": self.text,
             "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "lat": float(self.lat) if self.lat is not None else None,
-            "lon": float(self.lon) if self.lon is not None else None,
+            "lat": self.lat,
+            "lon": self.lon,
             "grid_id": self.grid_id,
             "post_type": self.post_type,
             "engagement_score": self.engagement_score,
@@ -296,8 +305,8 @@ class SocialPostModel(Base):
             source=pydantic_model.source.value if hasattr(pydantic_model.source, 'value') else pydantic_model.source,
             text=pydantic_model.text,
             timestamp=pydantic_model.timestamp,
-            lat=Decimal(str(pydantic_model.lat)) if pydantic_model.lat is not None else None,
-            lon=Decimal(str(pydantic_model.lon)) if pydantic_model.lon is not None else None,
+            lat=pydantic_model.lat,
+            lon=pydantic_model.lon,
             grid_id=pydantic_model.grid_id,
             post_type=pydantic_model.post_type.value if pydantic_model.post_type and hasattr(pydantic_model.post_type, 'value') else pydantic_model.post_type,
             engagement_score=pydantic_model.engagement_score,
@@ -309,6 +318,22 @@ class SocialPostModel(Base):
 # Grid Metrics Model
 # ============================================================================
 
+def _json_items(value) -> list:
+    """
+    Return the item list stored in a JSONB payload.
+    
+    Accepts both the bare-list format written by the scoring pipeline and
+    the wrapped format (e.g. {"posts": [...]}, {"businesses": [...]}).
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        for item in value.values():
+            if isinstance(item, list):
+                return item
+    return []
+
+
 class GridMetricsModel(Base):
     """
     ORM model for grid_metrics table.
@@ -336,6 +361,9 @@ class GridMetricsModel(Base):
     confidence = Column(DECIMAL(4, 3), nullable=True)  # 0.000 to 1.000
     top_posts_json = Column(JSONB, nullable=True)  # Top 3 posts with text + links
     competitors_json = Column(JSONB, nullable=True)  # List of nearby businesses
+    # Denormalized from the JSONB columns above (kept in sync by _sync_json_columns)
+    top_post_1_text = Column(Text, nullable=True)
+    competitor_count = Column(Integer, default=0)
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
@@ -347,9 +375,13 @@ class GridMetricsModel(Base):
         Index('idx_metrics_category_gos', 'category', 'gos', postgresql_ops={'gos': 'DESC'}),
         Index('idx_metrics_grid', 'grid_id'),
         Index('idx_metrics_last_updated', 'last_updated'),
-        # GIN indexes for JSONB columns (PostgreSQL specific)
-        Index('idx_metrics_top_posts', 'top_posts_json', postgresql_using='gin'),
-        Index('idx_metrics_competitors', 'competitors_json', postgresql_using='gin'),
+        # GIN indexes for JSONB columns (PostgreSQL specific).
+        # jsonb_path_ops only supports @> containment (no ? / ?& key lookups),
+        # which is the only operator we query with; the index is 2-3x smaller.
+        Index('idx_metrics_top_posts', 'top_posts_json', postgresql_using='gin',
+              postgresql_ops={'top_posts_json': 'jsonb_path_ops'}),
+        Index('idx_metrics_competitors', 'competitors_json', postgresql_using='gin',
+              postgresql_ops={'competitors_json': 'jsonb_path_ops'}),
         # Unique constraint
         {'extend_existing': True},  # Allow re-definition during testing
     )
@@ -363,6 +395,17 @@ class GridMetricsModel(Base):
             f"confidence={float(self.confidence) if self.confidence else None})>"
         )
     
+    @validates('top_posts_json', 'competitors_json')
+    def _sync_json_columns(self, key, value):
+        """Keep the typed hot-path columns in sync whenever a JSONB column is set."""
+        items = _json_items(value)
+        if key == 'top_posts_json':
+            first = items[0] if items else None
+            self.top_post_1_text = first.get('text') if isinstance(first, dict) else None
+        else:
+            self.competitor_count = len(items)
+        return value
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -376,6 +419,8 @@ class GridMetricsModel(Base):
             "confidence": float(self.confidence) if self.confidence is not None else None,
             "top_posts_json": self.top_posts_json,
             "competitors_json": self.competitors_json,
+            "top_post_1_text": self.top_post_1_text,
+            "competitor_count": self.competitor_count,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
         }
     
@@ -488,6 +533,47 @@ class UserFeedbackModel(Base):
         )
 
 
+# ============================================================================
+# Grid Category Metrics View (read-only)
+# ============================================================================
+
+# Views are registered on their own MetaData so Base.metadata.create_all()
+# never creates them as tables. DDL lives in src/database/views.py.
+view_metadata = MetaData()
+
+
+class GridCategoryMetricsView(Base):
+    """
+    Read-only ORM mapping for the grid_category_metrics materialized view.
+    
+    Precomputed raw metrics per (grid_id, category); every grid cell has a
+    zero-filled row for every category. Refreshed after ingestion via
+    src.database.views.refresh_grid_category_metrics().
+    
+    View: grid_category_metrics
+    Key: (grid_id, category)
+    """
+    
+    __table__ = Table(
+        "grid_category_metrics",
+        view_metadata,
+        Column("grid_id", String(50), primary_key=True),
+        Column("category", String(50), primary_key=True),
+        Column("business_count", Integer),
+        Column("instagram_volume", Integer),
+        Column("reddit_mentions", Integer),
+        Column("avg_rating", Float),
+        Column("total_reviews", Integer),
+    )
+    
+    def __repr__(self) -> str:
+        return (
+            f"<GridCategoryMetrics(grid_id='{self.grid_id}', "
+            f"category='{self.category}', "
+            f"businesses={self.business_count})>"
+        )
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -513,6 +599,16 @@ def get_all_models():
     ]
 
 
+# Table name -> ORM model class (built once at import)
+_MODEL_BY_TABLE = {
+    'grid_cells': GridCellModel,
+    'businesses': BusinessModel,
+    'social_posts': SocialPostModel,
+    'grid_metrics': GridMetricsModel,
+    'user_feedback': UserFeedbackModel,
+}
+
+
 def get_model_by_table_name(table_name: str):
     """
     Get ORM model class by table name.
@@ -523,14 +619,7 @@ def get_model_by_table_name(table_name: str):
     Returns:
         ORM model class or None if not found
     """
-    model_map = {
-        'grid_cells': GridCellModel,
-        'businesses': BusinessModel,
-        'social_posts': SocialPostModel,
-        'grid_metrics': GridMetricsModel,
-        'user_feedback': UserFeedbackModel,
-    }
-    return model_map.get(table_name)
+    return _MODEL_BY_TABLE.get(table_name)
 
 
 # ============================================================================
@@ -543,6 +632,7 @@ __all__ = [
     'SocialPostModel',
     'GridMetricsModel',
     'UserFeedbackModel',
+    'GridCategoryMetricsView',
     'get_all_models',
     'get_model_by_table_name',
 ]
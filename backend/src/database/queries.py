@@ -0,0 +1,54 @@
+"""
+Precompiled Hot-Path Queries
+
+Module-level SQLAlchemy Core statements for the handful of queries that run
+on every API request. Parameters are expressed with bindparam() so each
+statement has a single, stable shape: SQLAlchemy compiles it once and
+serves later executions from the engine's compiled_cache.
+
+Usage:
+    from src.database.queries import BUSINESSES_BY_GRID_CAT
+
+    with get_session() as session:
+        businesses = session.execute(
+            BUSINESSES_BY_GRID_CAT,
+            {"grid_id": "DHA-Phase2-Cell-07", "category": "Gym", "limit": 10},
+        ).scalars().all()
+"""
+
+from sqlalchemy import bindparam, select
+
+from src.database.models import BusinessModel, GridCellModel, GridMetricsModel
+
+
+# Businesses in a grid for a category, best-rated first.
+# Params: grid_id, category, limit
+BUSINESSES_BY_GRID_CAT = (
+    select(BusinessModel)
+    .where(
+        BusinessModel.grid_id == bindparam("grid_id"),
+        BusinessModel.category == bindparam("category"),
+    )
+    .order_by(BusinessModel.rating.desc().nullslast())
+    .limit(bindparam("limit"))
+)
+
+# Top-N (grid cell, metrics) pairs in a neighborhood by GOS.
+# Params: neighborhood, category, limit
+TOP_METRICS_BY_NEIGHBORHOOD_CAT = (
+    select(GridCellModel, GridMetricsModel)
+    .join(
+        GridMetricsModel,
+        (GridCellModel.grid_id == GridMetricsModel.grid_id)
+        & (GridMetricsModel.category == bindparam("category")),
+    )
+    .where(GridCellModel.neighborhood == bindparam("neighborhood"))
+    .order_by(GridMetricsModel.gos.desc())
+    .limit(bindparam("limit"))
+)
+
+
+__all__ = [
+    "BUSINESSES_BY_GRID_CAT",
+    "TOP_METRICS_BY_NEIGHBORHOOD_CAT",
+]
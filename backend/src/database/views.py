@@ -0,0 +1,147 @@
+"""
+Materialized Views
+
+Precomputed aggregates that back the hot read paths of the scoring engine.
+
+grid_category_metrics:
+    One row per (grid_id, category) with business_count, instagram_volume,
+    reddit_mentions, avg_rating and total_reviews. Every grid cell gets a
+    row for every category (zero-filled), so readers never need to
+    LEFT JOIN against grid_cells themselves.
+
+The underlying businesses/social_posts tables change only on ingestion, so
+the view is refreshed once after each ingestion run instead of recomputing
+COUNT/AVG/SUM on every request.
+
+Creation:
+    contracts/database_schema.sql is the only creator of the materialized
+    view in deployed databases (create_all_tables() does not create it).
+    create_grid_category_metrics_view() builds the same view for databases
+    set up without that file, e.g. the SQLite fixtures in tests.
+
+Refresh:
+    - scripts/fetch_google_places.py refreshes after business ingestion
+    - scoring_service.score_all_grids() refreshes before it reads the view
+    - Anything that loads social_posts rows (the view counts them too) must
+      call refresh_grid_category_metrics() after committing them
+
+Usage:
+    from src.database.views import refresh_grid_category_metrics
+
+    with get_write_session() as session:
+        refresh_grid_category_metrics(session)
+"""
+
+from sqlalchemy import text
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+GRID_CATEGORY_METRICS_VIEW = "grid_category_metrics"
+
+# Categories that always get a row, even before any business is ingested
+VIEW_CATEGORIES = ("Gym", "Cafe")
+
+_CATEGORY_UNION = " UNION ".join(f"SELECT '{c}' AS category" for c in VIEW_CATEGORIES)
+
+# Portable SELECT (PostgreSQL, SQLite >= 3.30): FILTER + LEFT JOIN + COALESCE
+GRID_CATEGORY_METRICS_SELECT = f"""
+SELECT
+    g.grid_id AS grid_id,
+    c.category AS category,
+    COALESCE(b.business_count, 0) AS business_count,
+    COALESCE(p.instagram_volume, 0) AS instagram_volume,
+    COALESCE(p.reddit_mentions, 0) AS reddit_mentions,
+    b.avg_rating AS avg_rating,
+    COALESCE(b.total_reviews, 0) AS total_reviews
+FROM grid_cells g
+CROSS JOIN (
+    {_CATEGORY_UNION}
+    UNION SELECT DISTINCT category FROM businesses
+) c
+LEFT JOIN (
+    SELECT
+        grid_id,
+        category,
+        COUNT(*) AS business_count,
+        AVG(rating) AS avg_rating,
+        SUM(review_count) FILTER (WHERE rating IS NOT NULL) AS total_reviews
+    FROM businesses
+    WHERE grid_id IS NOT NULL
+    GROUP BY grid_id, category
+) b ON b.grid_id = g.grid_id AND b.category = c.category
+LEFT JOIN (
+    SELECT
+        grid_id,
+        COUNT(*) FILTER (WHERE post_type = 'mention') AS instagram_volume,
+        COUNT(*) FILTER (WHERE post_type IN ('demand', 'complaint')) AS reddit_mentions
+    FROM social_posts
+    WHERE source = 'simulated' AND grid_id IS NOT NULL
+    GROUP BY grid_id
+) p ON p.grid_id = g.grid_id
+"""
+
+
+def _dialect_name(connection) -> str:
+    """Return the dialect name for a Connection or Session ('' if unbound)."""
+    dialect = getattr(connection, "dialect", None)
+    if dialect is None:
+        dialect = getattr(getattr(connection, "bind", None), "dialect", None)
+    return dialect.name if dialect is not None else ""
+
+
+def create_grid_category_metrics_view(connection) -> None:
+    """
+    Create the grid_category_metrics view.
+
+    PostgreSQL gets a MATERIALIZED VIEW with a UNIQUE (grid_id, category)
+    index, which is required for REFRESH ... CONCURRENTLY. Other dialects
+    (SQLite in tests) get a plain VIEW over the same SELECT.
+
+    Args:
+        connection: SQLAlchemy Connection or Session
+    """
+    if _dialect_name(connection) == "postgresql":
+        connection.execute(text(
+            f"CREATE MATERIALIZED VIEW IF NOT EXISTS {GRID_CATEGORY_METRICS_VIEW} AS "
+            f"{GRID_CATEGORY_METRICS_SELECT}"
+        ))
+        connection.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS idx_grid_category_metrics_key "
+            f"ON {GRID_CATEGORY_METRICS_VIEW} (grid_id, category)"
+        ))
+    else:
+        connection.execute(text(
+            f"CREATE VIEW IF NOT EXISTS {GRID_CATEGORY_METRICS_VIEW} AS "
+            f"{GRID_CATEGORY_METRICS_SELECT}"
+        ))
+
+
+def refresh_grid_category_metrics(session, concurrently: bool = True) -> None:
+    """
+    Refresh grid_category_metrics after new businesses/posts are ingested.
+
+    CONCURRENTLY keeps the view readable during the refresh. Non-PostgreSQL
+    backends use a plain view, which is always current, so this is a no-op.
+
+    Args:
+        session: SQLAlchemy session (write session)
+        concurrently: Use REFRESH ... CONCURRENTLY (default: True)
+    """
+    if _dialect_name(session) != "postgresql":
+        logger.debug("Skipping materialized view refresh (not PostgreSQL)")
+        return
+
+    mode = "CONCURRENTLY " if concurrently else ""
+    session.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{GRID_CATEGORY_METRICS_VIEW}"))
+    logger.info(f"Refreshed materialized view {GRID_CATEGORY_METRICS_VIEW}")
+
+
+__all__ = [
+    "GRID_CATEGORY_METRICS_VIEW",
+    "GRID_CATEGORY_METRICS_SELECT",
+    "create_grid_category_metrics_view",
+    "refresh_grid_category_metrics",
+]
@@ -15,13 +15,17 @@ Available Services:
 from src.services.geospatial_service import (
     GeospatialService,
     get_geospatial_service,
+    init_geospatial_service,
     assign_grid_id,
+    assign_grid_ids,
     get_grid_bounds,
 )
 
 __all__ = [
     "GeospatialService",
     "get_geospatial_service",
+    "init_geospatial_service",
     "assign_grid_id",
+    "assign_grid_ids",
     "get_grid_bounds",
 ]
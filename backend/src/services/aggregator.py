@@ -5,17 +5,28 @@ This module computes raw metrics per grid × category by aggregating data from:
 - businesses table: competitor counts, ratings, reviews
 - social_posts table: Instagram-like mentions, Reddit-like demand signals
 
+Reads are served from the grid_category_metrics materialized view
+(src/database/views.py), which precomputes these aggregates and is refreshed
+after ingestion. aggregate_all_grids_bulk() computes the same metrics live
+from the base tables.
+
 Phase 2 - Analytics & Scoring Engine
 """
 
 from typing import Dict, List, Optional
+import logging
 import time
 
+import numpy as np
+
 # Import database components
 try:
-    from sqlalchemy import func
+    from sqlalchemy import Float, bindparam, cast, func, select
+    from sqlalchemy.util import LRUCache
     from src.database.connection import get_session
-    from src.database.models import BusinessModel, SocialPostModel, GridCellModel
+    from src.database.models import (
+        BusinessModel, SocialPostModel, GridCellModel, GridCategoryMetricsView
+    )
     from src.utils.logger import get_logger
     
     logger = get_logger(__name__)
@@ -26,14 +37,165 @@ except ModuleNotFoundError:
     backend_dir = Path(__file__).parent.parent.parent
     sys.path.insert(0, str(backend_dir))
     
-    from sqlalchemy import func
+    from sqlalchemy import Float, bindparam, cast, func, select
+    from sqlalchemy.util import LRUCache
     from src.database.connection import get_session
-    from src.database.models import BusinessModel, SocialPostModel, GridCellModel
+    from src.database.models import (
+        BusinessModel, SocialPostModel, GridCellModel, GridCategoryMetricsView
+    )
     from src.utils.logger import get_logger
     
     logger = get_logger(__name__)
 
 
+# Compiled SQL for the aggregator's fixed query shapes. Statements are built
+# once at import time with bindparam() placeholders, so every call reuses the
+# same compiled form instead of re-rendering SQL per grid.
+_COMPILED_CACHE = LRUCache(500)
+_EXECUTION_OPTIONS = {"compiled_cache": _COMPILED_CACHE}
+
+# Core table handles: aggregates return plain rows, so the hot path skips
+# the ORM mapper, identity map and unit-of-work bookkeeping entirely.
+_metrics_view = GridCategoryMetricsView.__table__
+_businesses = BusinessModel.__table__
+_social_posts = SocialPostModel.__table__
+_grid_cells = GridCellModel.__table__
+
+# Raw counter columns, their max_values keys and normalized keys (same order)
+COUNT_KEYS = ("business_count", "instagram_volume", "reddit_mentions")
+MAX_KEYS = ("max_business_count", "max_instagram_volume", "max_reddit_mentions")
+NORMALIZED_KEYS = ("supply_norm", "demand_instagram_norm", "demand_reddit_norm")
+
+# Rows fetched per round trip when streaming view rows
+AGGREGATION_BATCH_SIZE = 500
+
+# Params: grid_id, category
+_GRID_CATEGORY_METRICS = (
+    select(_metrics_view)
+    .where(
+        _metrics_view.c.grid_id == bindparam("grid_id"),
+        _metrics_view.c.category == bindparam("category")
+    )
+)
+
+# Params: category
+_ALL_GRID_METRICS = (
+    select(_metrics_view)
+    .where(_metrics_view.c.category == bindparam("category"))
+    .order_by(_metrics_view.c.grid_id)
+)
+
+def _window_max(column):
+    """MAX(column) OVER () with the 0 → 1 fallback used for normalization."""
+    return func.coalesce(func.nullif(func.max(column).over(), 0), 1)
+
+
+# View rows plus normalized values computed in SQL with window functions
+# (aggregate_all_grids_normalized). Params: category
+_NORMALIZED_GRID_METRICS = (
+    select(
+        _metrics_view,
+        _window_max(_metrics_view.c.business_count).label("max_business_count"),
+        _window_max(_metrics_view.c.instagram_volume).label("max_instagram_volume"),
+        _window_max(_metrics_view.c.reddit_mentions).label("max_reddit_mentions"),
+        (
+            cast(_metrics_view.c.business_count, Float)
+            / _window_max(_metrics_view.c.business_count)
+        ).label("supply_norm"),
+        (
+            cast(_metrics_view.c.instagram_volume, Float)
+            / _window_max(_metrics_view.c.instagram_volume)
+        ).label("demand_instagram_norm"),
+        (
+            cast(_metrics_view.c.reddit_mentions, Float)
+            / _window_max(_metrics_view.c.reddit_mentions)
+        ).label("demand_reddit_norm")
+    )
+    .where(_metrics_view.c.category == bindparam("category"))
+    .order_by(_metrics_view.c.grid_id)
+)
+
+# Live grid × category matrix from the base tables (aggregate_all_grids_bulk).
+# Params: category
+#
+# 1. Business-side metrics in one scan: count plus rating stats
+#    restricted to rated businesses via FILTER
+_business_agg = (
+    select(
+        _businesses.c.grid_id,
+        func.count().label("business_count"),
+        func.avg(_businesses.c.rating).label("avg_rating"),
+        func.sum(_businesses.c.review_count).filter(
+            _businesses.c.rating.isnot(None)
+        ).label("total_reviews")
+    )
+    .where(_businesses.c.category == bindparam("category"))
+    .group_by(_businesses.c.grid_id)
+    .subquery("business_agg")
+)
+
+# 2. Social-side metrics in one scan:
+#    mention posts → Instagram volume, demand + complaint → Reddit mentions
+_social_agg = (
+    select(
+        _social_posts.c.grid_id,
+        func.count().filter(
+            _social_posts.c.post_type == 'mention'
+        ).label("instagram_volume"),
+        func.count().filter(
+            _social_posts.c.post_type.in_(['demand', 'complaint'])
+        ).label("reddit_mentions")
+    )
+    .where(
+        _social_posts.c.source == 'simulated',
+        _social_posts.c.post_type.in_(['mention', 'demand', 'complaint'])
+    )
+    .group_by(_social_posts.c.grid_id)
+    .subquery("social_agg")
+)
+
+# 3. One round trip for the whole grid matrix
+_LIVE_GRID_METRICS = (
+    select(
+        _grid_cells.c.grid_id,
+        func.coalesce(_business_agg.c.business_count, 0).label("business_count"),
+        func.coalesce(_social_agg.c.instagram_volume, 0).label("instagram_volume"),
+        func.coalesce(_social_agg.c.reddit_mentions, 0).label("reddit_mentions"),
+        _business_agg.c.avg_rating,
+        func.coalesce(_business_agg.c.total_reviews, 0).label("total_reviews")
+    )
+    .select_from(
+        _grid_cells
+        .outerjoin(_business_agg, _business_agg.c.grid_id == _grid_cells.c.grid_id)
+        .outerjoin(_social_agg, _social_agg.c.grid_id == _grid_cells.c.grid_id)
+    )
+    .order_by(_grid_cells.c.grid_id)
+)
+
+
+def _view_row_to_metrics(row, grid_id: str, category: str) -> Dict:
+    """Convert a grid_category_metrics row (or None) to a metrics dict."""
+    if row is None:
+        return {
+            "grid_id": grid_id,
+            "category": category,
+            "business_count": 0,
+            "instagram_volume": 0,
+            "reddit_mentions": 0,
+            "avg_rating": None,
+            "total_reviews": 0
+        }
+    return {
+        "grid_id": grid_id,
+        "category": category,
+        "business_count": row.business_count or 0,
+        "instagram_volume": row.instagram_volume or 0,
+        "reddit_mentions": row.reddit_mentions or 0,
+        "avg_rating": float(row.avg_rating) if row.avg_rating else None,
+        "total_reviews": int(row.total_reviews) if row.total_reviews else 0
+    }
+
+
 def aggregate_grid_metrics(grid_id: str, category: str) -> Dict:
     """
     Compute raw metrics for a single grid × category combination.
@@ -59,60 +221,23 @@ def aggregate_grid_metrics(grid_id: str, category: str) -> Dict:
         >>> print(f"Business count: {metrics['business_count']}")
         Business count: 0
     """
-    logger.info(f"Aggregating metrics for grid_id={grid_id}, category={category}")
+    # Per-grid call: debug level, since callers may invoke this once per grid
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Aggregating metrics for grid_id={grid_id}, category={category}")
     
     with get_session() as session:
-        # 1. Business count
-        business_count = (
-            session.query(func.count(BusinessModel.business_id))
-            .filter(
-                BusinessModel.grid_id == grid_id,
-                BusinessModel.category == category
-            )
-            .scalar()
-        )
-        
-        # 2. Instagram volume (mention posts)
-        # For MVP: simulated posts with post_type='mention' treated as Instagram-like
-        instagram_volume = (
-            session.query(func.count(SocialPostModel.post_id))
-            .filter(
-                SocialPostModel.grid_id == grid_id,
-                SocialPostModel.source == 'simulated',
-                SocialPostModel.post_type == 'mention'
-            )
-            .scalar()
-        )
-        
-        # 3. Reddit mentions (demand + complaint posts)
-        # These represent explicit demand signals
-        reddit_mentions = (
-            session.query(func.count(SocialPostModel.post_id))
-            .filter(
-                SocialPostModel.grid_id == grid_id,
-                SocialPostModel.source == 'simulated',
-                SocialPostModel.post_type.in_(['demand', 'complaint'])
-            )
-            .scalar()
-        )
-        
-        # 4. Average rating and total reviews
-        # Only include businesses with non-null ratings
-        rating_stats = (
-            session.query(
-                func.avg(BusinessModel.rating).label('avg_rating'),
-                func.sum(BusinessModel.review_count).label('total_reviews')
-            )
-            .filter(
-                BusinessModel.grid_id == grid_id,
-                BusinessModel.category == category,
-                BusinessModel.rating.isnot(None)
-            )
-            .first()
-        )
-        
-        avg_rating = float(rating_stats.avg_rating) if rating_stats.avg_rating else None
-        total_reviews = int(rating_stats.total_reviews) if rating_stats.total_reviews else 0
+        # Precomputed row from the grid_category_metrics view
+        row = session.execute(
+            _GRID_CATEGORY_METRICS,
+            {"grid_id": grid_id, "category": category},
+            execution_options=_EXECUTION_OPTIONS
+        ).first()
+    
+    metrics = _view_row_to_metrics(row, grid_id, category)
+    business_count = metrics["business_count"]
+    instagram_volume = metrics["instagram_volume"]
+    reddit_mentions = metrics["reddit_mentions"]
+    avg_rating = metrics["avg_rating"]
     
     # Log warnings for edge cases
     if business_count == 0:
@@ -121,27 +246,45 @@ def aggregate_grid_metrics(grid_id: str, category: str) -> Dict:
     if instagram_volume == 0 and reddit_mentions == 0:
         logger.warning(f"Grid {grid_id} has ZERO social posts")
     
-    metrics = {
-        "grid_id": grid_id,
-        "category": category,
-        "business_count": business_count or 0,
-        "instagram_volume": instagram_volume or 0,
-        "reddit_mentions": reddit_mentions or 0,
-        "avg_rating": avg_rating,
-        "total_reviews": total_reviews
-    }
-    
-    logger.debug(
-        f"Metrics for {grid_id}: "
-        f"businesses={business_count}, "
-        f"instagram={instagram_volume}, "
-        f"reddit={reddit_mentions}, "
-        f"rating={avg_rating if avg_rating is not None else 'N/A'}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Metrics for {grid_id}: "
+            f"businesses={business_count}, "
+            f"instagram={instagram_volume}, "
+            f"reddit={reddit_mentions}, "
+            f"rating={avg_rating if avg_rating is not None else 'N/A'}"
+        )
     
     return metrics
 
 
+def aggregate_all_grids_bulk(category: str) -> List[Dict]:
+    """
+    Compute raw metrics for every grid cell live from the base tables.
+    
+    Bypasses the grid_category_metrics view (use when ingested data has not
+    been refreshed into the view yet). A single statement LEFT OUTER JOINs
+    grid_cells to the grouped business and social-post aggregates
+    (conditional aggregation via FILTER), so grids with no matching rows
+    appear naturally with zero counts.
+    
+    Args:
+        category: Business category (e.g., "Gym", "Cafe")
+    
+    Returns:
+        List of metric dictionaries (same shape as aggregate_grid_metrics),
+        ordered by grid_id.
+    """
+    with get_session() as session:
+        rows = session.execute(
+            _LIVE_GRID_METRICS,
+            {"category": category},
+            execution_options=_EXECUTION_OPTIONS
+        ).all()
+    
+    return [_view_row_to_metrics(row, row.grid_id, category) for row in rows]
+
+
 def aggregate_all_grids(category: str) -> tuple[List[Dict], Dict]:
     """
     Compute metrics for all grid cells in a given category.
@@ -165,37 +308,43 @@ def aggregate_all_grids(category: str) -> tuple[List[Dict], Dict]:
     logger.info(f"Starting aggregation for all grids, category={category}")
     start_time = time.time()
     
-    # Get all grid IDs from grid_cells table
-    with get_session() as session:
-        grid_ids = (
-            session.query(GridCellModel.grid_id)
-            .order_by(GridCellModel.grid_id)
-            .all()
-        )
-    
-    grid_id_list = [row.grid_id for row in grid_ids]
-    logger.info(f"Found {len(grid_id_list)} grid cells to process")
-    
-    # Aggregate metrics for each grid
     all_metrics = []
     grids_with_zero_businesses = []
     grids_with_zero_posts = []
+    totals = [0, 0, 0]  # business_count, instagram_volume, reddit_mentions
+    maxes = [0, 0, 0]
     
-    for grid_id in grid_id_list:
-        metrics = aggregate_grid_metrics(grid_id, category)
-        all_metrics.append(metrics)
-        
-        # Track edge cases
-        if metrics['business_count'] == 0:
-            grids_with_zero_businesses.append(grid_id)
+    # Single pass over the view rows, streamed in batches: build the metrics
+    # and track edge cases, summary totals and max values as we go
+    with get_session() as session:
+        result = session.execute(
+            _ALL_GRID_METRICS,
+            {"category": category},
+            execution_options=_EXECUTION_OPTIONS
+        ).yield_per(AGGREGATION_BATCH_SIZE)
         
-        if metrics['instagram_volume'] == 0 and metrics['reddit_mentions'] == 0:
-            grids_with_zero_posts.append(grid_id)
-    
-    # Summary statistics
-    total_businesses = sum(m['business_count'] for m in all_metrics)
-    total_instagram = sum(m['instagram_volume'] for m in all_metrics)
-    total_reddit = sum(m['reddit_mentions'] for m in all_metrics)
+        for row in result:
+            metrics = _view_row_to_metrics(row, row.grid_id, category)
+            all_metrics.append(metrics)
+            
+            counts = (
+                metrics['business_count'],
+                metrics['instagram_volume'],
+                metrics['reddit_mentions']
+            )
+            for i, count in enumerate(counts):
+                totals[i] += count
+                if count > maxes[i]:
+                    maxes[i] = count
+            
+            # Track edge cases
+            if counts[0] == 0:
+                grids_with_zero_businesses.append(metrics['grid_id'])
+            
+            if counts[1] == 0 and counts[2] == 0:
+                grids_with_zero_posts.append(metrics['grid_id'])
+    
+    total_businesses, total_instagram, total_reddit = totals
     
     elapsed_time = time.time() - start_time
     
@@ -221,12 +370,67 @@ def aggregate_all_grids(category: str) -> tuple[List[Dict], Dict]:
             f"{', '.join(grids_with_zero_posts)}"
         )
     
-    # Compute max values for normalization
-    max_values = compute_max_values(all_metrics)
+    # Max values for normalization (tracked during the pass above)
+    if not all_metrics:
+        logger.warning(f"No grid cells found for category={category}")
+    max_values = _build_max_values(maxes)
     
     return all_metrics, max_values
 
 
+def _counts_array(metrics_list: List[Dict]) -> np.ndarray:
+    """Stack the raw counter columns of metrics_list into an (N, 3) int64 array."""
+    return np.array(
+        [[m.get(key, 0) for key in COUNT_KEYS] for m in metrics_list],
+        dtype=np.int64
+    ).reshape(-1, len(COUNT_KEYS))
+
+
+def aggregate_all_grids_normalized(category: str) -> tuple[List[Dict], Dict]:
+    """
+    Compute raw and normalized metrics for all grids in one SQL statement.
+    
+    Max values and normalization (count / MAX(count) OVER ()) are computed
+    by the database, so no Python-side max or normalization pass is needed.
+    
+    Args:
+        category: Business category (e.g., "Gym", "Cafe")
+    
+    Returns:
+        Tuple of (metrics_list, max_values):
+        - metrics_list: List of metric dictionaries (same shape as
+          aggregate_grid_metrics) plus supply_norm, demand_instagram_norm
+          and demand_reddit_norm, ordered by grid_id
+        - max_values: Same shape as compute_max_values()
+    
+    Example:
+        >>> metrics_list, max_vals = aggregate_all_grids_normalized("Gym")
+        >>> print(f"Supply normalized: {metrics_list[0]['supply_norm']:.2f}")
+        Supply normalized: 0.00
+    """
+    with get_session() as session:
+        rows = session.execute(
+            _NORMALIZED_GRID_METRICS,
+            {"category": category},
+            execution_options=_EXECUTION_OPTIONS
+        ).all()
+    
+    metrics_list = []
+    for row in rows:
+        metrics = _view_row_to_metrics(row, row.grid_id, category)
+        for key in NORMALIZED_KEYS:
+            metrics[key] = float(getattr(row, key))
+        metrics_list.append(metrics)
+    
+    if rows:
+        max_values = {key: float(getattr(rows[0], key)) for key in MAX_KEYS}
+    else:
+        logger.warning(f"No grid cells found for category={category}")
+        max_values = dict.fromkeys(MAX_KEYS, 1.0)
+    
+    return metrics_list, max_values
+
+
 def compute_max_values(metrics_list: List[Dict]) -> Dict:
     """
     Calculate maximum values across all grids for normalization.
@@ -255,15 +459,16 @@ def compute_max_values(metrics_list: List[Dict]) -> Dict:
             "max_reddit_mentions": 1.0
         }
     
-    max_business = max(m['business_count'] for m in metrics_list)
-    max_instagram = max(m['instagram_volume'] for m in metrics_list)
-    max_reddit = max(m['reddit_mentions'] for m in metrics_list)
-    
+    # One (N, 3) array and a single column-wise max instead of three passes
+    return _build_max_values(_counts_array(metrics_list).max(axis=0).tolist())
+
+
+def _build_max_values(maxes: List[float]) -> Dict:
+    """Build the max_values dict from per-column maxima (COUNT_KEYS order)."""
     # Handle edge case: if max is 0, use 1 to avoid division by zero
     max_values = {
-        "max_business_count": float(max_business) if max_business > 0 else 1.0,
-        "max_instagram_volume": float(max_instagram) if max_instagram > 0 else 1.0,
-        "max_reddit_mentions": float(max_reddit) if max_reddit > 0 else 1.0
+        key: float(value) if value > 0 else 1.0
+        for key, value in zip(MAX_KEYS, maxes)
     }
     
     logger.info(
@@ -320,16 +525,42 @@ def normalize_metrics(metrics: Dict, max_values: Dict) -> Dict:
         "demand_reddit_norm": reddit_mentions / max_reddit
     }
     
-    logger.debug(
-        f"Normalized {metrics.get('grid_id', 'unknown')}: "
-        f"supply={normalized['supply_norm']:.2f}, "
-        f"instagram={normalized['demand_instagram_norm']:.2f}, "
-        f"reddit={normalized['demand_reddit_norm']:.2f}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Normalized {metrics.get('grid_id', 'unknown')}: "
+            f"supply={normalized['supply_norm']:.2f}, "
+            f"instagram={normalized['demand_instagram_norm']:.2f}, "
+            f"reddit={normalized['demand_reddit_norm']:.2f}"
+        )
     
     return normalized
 
 
+def normalize_all(metrics_list: List[Dict], max_values: Dict) -> np.ndarray:
+    """
+    Normalize every grid's metrics in one vectorized operation.
+    
+    Vectorized equivalent of calling normalize_metrics() per grid.
+    
+    Args:
+        metrics_list: List of metric dictionaries from aggregate_all_grids()
+        max_values: Max values across all grids (from compute_max_values)
+    
+    Returns:
+        (N, 3) float array with columns in NORMALIZED_KEYS order
+        (supply_norm, demand_instagram_norm, demand_reddit_norm), rows in
+        metrics_list order. All values are 0.0 to 1.0.
+    
+    Example:
+        >>> all_metrics, max_vals = aggregate_all_grids("Gym")
+        >>> normalized = normalize_all(all_metrics, max_vals)
+        >>> dict(zip(NORMALIZED_KEYS, normalized[0].tolist()))
+        {'supply_norm': 0.0, 'demand_instagram_norm': 0.5, 'demand_reddit_norm': 0.25}
+    """
+    maxes = np.array([max_values.get(key, 1.0) for key in MAX_KEYS], dtype=np.float64)
+    return _counts_array(metrics_list) / np.where(maxes > 0, maxes, 1.0)
+
+
 # CLI for testing
 if __name__ == "__main__":
     import sys
@@ -22,15 +22,24 @@ Usage:
 """
 
 import os
+import json
+import logging
 import math
+import hashlib
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from pathlib import Path
 
 import googlemaps
+import numpy as np
 from googlemaps.exceptions import ApiError, Timeout, TransportError
 
+from src.utils.ttl_cache import TTLCache, cache_dir_from_env, prune_expired_files
+
 from src.utils.logger import get_logger
 
 
@@ -74,6 +83,13 @@ DENSITY_POI_TYPES = {
     "residential": ["apartment", "residential"],
 }
 
+# Inverse index: POI type -> density bucket (O(1) classification per type)
+_TYPE_TO_BUCKET = {
+    poi_type: bucket
+    for bucket, poi_types in DENSITY_POI_TYPES.items()
+    for poi_type in poi_types
+}
+
 # Key amenities for distance features
 DISTANCE_AMENITIES = [
     "shopping_mall",
@@ -84,6 +100,33 @@ DISTANCE_AMENITIES = [
     "park",
 ]
 
+# Distance feature -> Google Places types that count as that amenity
+AMENITY_TYPES_BY_FEATURE = {
+    "distance_to_mall": {"shopping_mall"},
+    "distance_to_cinema": {"movie_theater"},
+    "distance_to_university": {"university"},
+    "distance_to_hospital": {"hospital"},
+    "distance_to_transit": {"transit_station", "bus_station", "subway_station"},
+    "distance_to_park": {"park"},
+}
+
+# Bit position of each distance feature, and place type -> feature bitmask
+_DISTANCE_FEATURES = tuple(AMENITY_TYPES_BY_FEATURE)
+_TYPE_TO_FEATURE_BITS = {
+    place_type: sum(
+        1 << bit
+        for bit, amenity_types in enumerate(AMENITY_TYPES_BY_FEATURE.values())
+        if place_type in amenity_types
+    )
+    for place_type in set().union(*AMENITY_TYPES_BY_FEATURE.values())
+}
+
+EARTH_RADIUS_M = 6371000  # Earth radius in meters
+
+# Distance bands for prompt formatting: < 100m, < 300m, < 500m, beyond
+DISTANCE_BREAKS = (100, 300, 500)
+DISTANCE_LABELS = ("very close", "close", "moderate", "far")
+
 # Income proxy thresholds
 INCOME_THRESHOLDS = {
     "high": {"avg_rating": 4.3, "premium_ratio": 0.4},
@@ -91,16 +134,134 @@ INCOME_THRESHOLDS = {
     "low": {"avg_rating": 0, "premium_ratio": 0},
 }
 
+# next_page_token becomes valid a short, variable time after it is issued
+# (INVALID_REQUEST until then): first wait, doubled on each retry
+PLACES_PAGE_TOKEN_DELAY = 0.5
+PLACES_PAGE_TOKEN_RETRIES = 4
+
+# Place types queried per BEV (one nearby search each, plus pagination)
+NEARBY_SEARCH_TYPES = (
+    "restaurant", "cafe", "gym", "school", "university",
+    "shopping_mall", "store", "hospital", "bank",
+    "transit_station", "park", "movie_theater", "bar",
+)
+
+# Concurrent nearby searches per BEVGenerator, shared by every generate_bev()
+# call in flight (network-bound, so threads suffice)
+NEARBY_SEARCH_WORKERS = 8
+
+# Places request budget across all search threads (each thread has its own
+# googlemaps.Client, whose QPS limiter is not thread-safe)
+PLACES_MAX_QPS = 48
+
+# Persistent cache for places_nearby responses (per lat/lon/radius/type),
+# under $PLACES_CACHE_DIR or the system temp dir (writable on serverless)
+PLACES_CACHE_DIR = cache_dir_from_env("PLACES_CACHE_DIR", "places_nearby")
+PLACES_CACHE_TTL_HOURS = 24 * 7
+PLACES_MEMORY_CACHE_SIZE = 2048  # Responses kept in-process (13 per BEV)
+
 # Search radius configurations
 DEFAULT_RADIUS = 500  # meters
 EXTENDED_RADIUS = 1000  # for distance calculations
 
 
+# ============================================================================
+# Geometry Helpers
+# ============================================================================
+
+def _haversine_from_center(
+    phi1: float,
+    cos_phi1: float,
+    lon1_rad: float,
+    lat2: float,
+    lon2: float
+) -> float:
+    """
+    Distance in meters from a pre-converted center to (lat2, lon2).
+    
+    Callers measuring many points from one center compute
+    phi1 = radians(lat1), cos_phi1 = cos(phi1) and lon1_rad = radians(lon1)
+    once and reuse them for every point.
+    """
+    phi2 = math.radians(lat2)
+    delta_phi = phi2 - phi1
+    delta_lambda = math.radians(lon2) - lon1_rad
+    
+    a = (math.sin(delta_phi / 2) ** 2 +
+         cos_phi1 * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a)))  # Clamp FP overshoot
+
+
+def _place_feature_bits(place_types) -> int:
+    """Bitmask of the distance features a place's types belong to."""
+    bits = 0
+    for place_type in place_types:
+        bits |= _TYPE_TO_FEATURE_BITS.get(place_type, 0)
+    return bits
+
+
+def _nearest_per_type(
+    center_lat: float,
+    center_lon: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    type_bits: np.ndarray
+) -> Dict[str, float]:
+    """
+    Haversine distance (meters) to the nearest place of each distance feature.
+    
+    type_bits holds one bitmask per place (bit i = _DISTANCE_FEATURES[i]).
+    Candidates are ranked by squared equirectangular distance (only argmin
+    matters) and the true haversine is computed for each winner only.
+    Features with no matching place are omitted.
+    """
+    phi1 = math.radians(center_lat)
+    cos_phi1 = math.cos(phi1)
+    lon1_rad = math.radians(center_lon)
+    
+    x = (lons - center_lon) * cos_phi1
+    y = lats - center_lat
+    d2 = x * x + y * y
+    
+    nearest: Dict[str, float] = {}
+    for bit, attr in enumerate(_DISTANCE_FEATURES):
+        mask = (type_bits & (1 << bit)) != 0
+        if mask.any():
+            idx = int(np.where(mask, d2, np.inf).argmin())
+            nearest[attr] = _haversine_from_center(phi1, cos_phi1, lon1_rad, lats[idx], lons[idx])
+    return nearest
+
+
+def _places_cache_key(lat: float, lon: float, radius: int, place_type: str) -> str:
+    """Cache key for a nearby search (coordinates rounded to ~11m)."""
+    raw = f"{lat:.4f}|{lon:.4f}|{radius}|{place_type}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+def _specialized_to_dict(cls):
+    """
+    Class decorator: generate a dict-literal to_dict() for a flat dataclass.
+    
+    The field list is read once here, so to_dict() is a single dict display
+    (no per-call reflection or recursion as in dataclasses.asdict()).
+    """
+    items = ", ".join(f"{f.name!r}: self.{f.name}" for f in fields(cls))
+    namespace: Dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = f"Return {cls.__name__} fields as a flat dictionary."
+    cls.to_dict = to_dict
+    return cls
+
+
+@_specialized_to_dict
+@dataclass(slots=True, frozen=True)
 class DensityFeatures:
     """Counts of various POI types in the area."""
     restaurants: int = 0
@@ -122,12 +283,10 @@ class DensityFeatures:
     transit_stations: int = 0
     gas_stations: int = 0
     residential: int = 0
-    
-    def to_dict(self) -> Dict[str, int]:
-        return asdict(self)
 
 
-@dataclass
+@_specialized_to_dict
+@dataclass(slots=True, frozen=True)
 class DistanceFeatures:
     """Distances to key amenities in meters."""
     distance_to_mall: float = -1  # -1 means not found
@@ -137,12 +296,10 @@ class DistanceFeatures:
     distance_to_transit: float = -1
     distance_to_park: float = -1
     distance_to_main_road: float = -1  # Estimated based on transit
-    
-    def to_dict(self) -> Dict[str, float]:
-        return asdict(self)
 
 
-@dataclass
+@_specialized_to_dict
+@dataclass(slots=True, frozen=True)
 class EconomicFeatures:
     """Economic proxy features derived from business data."""
     avg_business_rating: float = 0.0
@@ -153,12 +310,9 @@ class EconomicFeatures:
     premium_to_economy_ratio: float = 0.0
     income_proxy: str = "unknown"  # low/mid/high
     competition_density: float = 0.0  # businesses per 100m²
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BusinessEnvironmentVector:
     """
     Complete Business Environment Vector for a location.
@@ -183,72 +337,136 @@ class BusinessEnvironmentVector:
     
     def __post_init__(self):
         if not self.generated_at:
-            self.generated_at = datetime.utcnow().isoformat()
+            # Frozen dataclass: bypass __setattr__ for the one derived default
+            object.__setattr__(self, "generated_at", datetime.utcnow().isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to flat dictionary for API response."""
-        result = {
+        return {
             "grid_id": self.grid_id,
             "center_lat": self.center_lat,
             "center_lon": self.center_lon,
             "radius_meters": self.radius_meters,
             "generated_at": self.generated_at,
             "api_calls_used": self.api_calls_used,
+            **self.density.to_dict(),
+            **self.distance.to_dict(),
+            **self.economic.to_dict(),
         }
-        result.update(self.density.to_dict())
-        result.update(self.distance.to_dict())
-        result.update(self.economic.to_dict())
-        return result
     
     def to_prompt_format(self) -> str:
         """Format BEV for LLM prompt."""
-        lines = [
-            "[Business Environment Vector]",
-            f"Location: ({self.center_lat:.6f}, {self.center_lon:.6f})",
-            f"Analysis radius: {self.radius_meters}m",
-            "",
-            "=== Density Features ===",
-            f"Restaurants: {self.density.restaurants}",
-            f"Cafes: {self.density.cafes}",
-            f"Gyms: {self.density.gyms}",
-            f"Schools: {self.density.schools}",
-            f"Universities: {self.density.universities}",
-            f"Offices: {self.density.offices}",
-            f"Malls: {self.density.malls}",
-            f"Stores: {self.density.stores}",
-            f"Parks: {self.density.parks}",
-            f"Transit Stations: {self.density.transit_stations}",
-            f"Healthcare: {self.density.healthcare}",
-            f"Bars/Nightlife: {self.density.bars}",
-            "",
-            "=== Distance Features ===",
-            f"Distance to nearest mall: {self._format_distance(self.distance.distance_to_mall)}",
-            f"Distance to nearest cinema: {self._format_distance(self.distance.distance_to_cinema)}",
-            f"Distance to nearest university: {self._format_distance(self.distance.distance_to_university)}",
-            f"Distance to transit station: {self._format_distance(self.distance.distance_to_transit)}",
-            f"Distance to park: {self._format_distance(self.distance.distance_to_park)}",
-            "",
-            "=== Economic Indicators ===",
-            f"Average business rating: {self.economic.avg_business_rating:.2f}/5.0",
-            f"Average review count: {self.economic.avg_review_count:.0f}",
-            f"Total businesses in area: {self.economic.total_businesses}",
-            f"Premium to economy ratio: {self.economic.premium_to_economy_ratio:.2f}",
-            f"Income proxy: {self.economic.income_proxy}",
-            f"Competition density: {self.economic.competition_density:.2f} businesses per 100m²",
-        ]
-        return "\n".join(lines)
-    
-    def _format_distance(self, distance: float) -> str:
+        density = self.density
+        distance = self.distance
+        economic = self.economic
+        
+        mall = self._format_distance(distance.distance_to_mall)
+        cinema = self._format_distance(distance.distance_to_cinema)
+        university = self._format_distance(distance.distance_to_university)
+        transit = self._format_distance(distance.distance_to_transit)
+        park = self._format_distance(distance.distance_to_park)
+        
+        return f"""[Business Environment Vector]
+Location: ({self.center_lat:.6f}, {self.center_lon:.6f})
+Analysis radius: {self.radius_meters}m
+
+=== Density Features ===
+Restaurants: {density.restaurants}
+Cafes: {density.cafes}
+Gyms: {density.gyms}
+Schools: {density.schools}
+Universities: {density.universities}
+Offices: {density.offices}
+Malls: {density.malls}
+Stores: {density.stores}
+Parks: {density.parks}
+Transit Stations: {density.transit_stations}
+Healthcare: {density.healthcare}
+Bars/Nightlife: {density.bars}
+
+=== Distance Features ===
+Distance to nearest mall: {mall}
+Distance to nearest cinema: {cinema}
+Distance to nearest university: {university}
+Distance to transit station: {transit}
+Distance to park: {park}
+
+=== Economic Indicators ===
+Average business rating: {economic.avg_business_rating:.2f}/5.0
+Average review count: {economic.avg_review_count:.0f}
+Total businesses in area: {economic.total_businesses}
+Premium to economy ratio: {economic.premium_to_economy_ratio:.2f}
+Income proxy: {economic.income_proxy}
+Competition density: {economic.competition_density:.2f} businesses per 100m²"""
+    
+    @staticmethod
+    def _format_distance(distance: float) -> str:
         if distance < 0:
             return "Not found within search radius"
-        elif distance < 100:
-            return f"{distance:.0f}m (very close)"
-        elif distance < 300:
-            return f"{distance:.0f}m (close)"
-        elif distance < 500:
-            return f"{distance:.0f}m (moderate)"
-        else:
-            return f"{distance:.0f}m (far)"
+        label = DISTANCE_LABELS[bisect_right(DISTANCE_BREAKS, distance)]
+        return f"{distance:.0f}m ({label})"
+
+
+@dataclass(slots=True, frozen=True)
+class PlaceColumns:
+    """
+    Nearby places as parallel columns (struct-of-arrays).
+    
+    Built once per BEV from the raw Places API dicts so the density,
+    distance and economic passes read flat arrays instead of re-walking
+    nested dicts. Row i of every column describes the same place.
+    """
+    lats: np.ndarray          # float64, NaN when the place has no location
+    lons: np.ndarray          # float64, NaN when the place has no location
+    ratings: np.ndarray       # float64, NaN when missing/zero
+    reviews: np.ndarray       # int64, 0 when missing
+    price_levels: np.ndarray  # int8, -1 when missing
+    feature_bits: np.ndarray  # uint8 distance-feature bitmask (see _DISTANCE_FEATURES)
+    types: List[frozenset]    # Place types per row
+    
+    def __len__(self) -> int:
+        return len(self.types)
+
+
+def _places_to_columns(places: List[Dict]) -> PlaceColumns:
+    """Parse Places API results once into a PlaceColumns."""
+    n = len(places)
+    lats = np.full(n, np.nan)
+    lons = np.full(n, np.nan)
+    ratings = np.full(n, np.nan)
+    reviews = np.zeros(n, dtype=np.int64)
+    price_levels = np.full(n, -1, dtype=np.int8)
+    feature_bits = np.zeros(n, dtype=np.uint8)
+    types = []
+    
+    for i, place in enumerate(places):
+        location = place.get("geometry", {}).get("location", {})
+        if location:
+            lats[i] = location.get("lat", 0)
+            lons[i] = location.get("lng", 0)
+        
+        rating = place.get("rating")
+        if rating:
+            ratings[i] = rating
+        reviews[i] = place.get("user_ratings_total") or 0
+        
+        price_level = place.get("price_level")
+        if price_level is not None:
+            price_levels[i] = price_level
+        
+        place_types = frozenset(place.get("types", ()))
+        feature_bits[i] = _place_feature_bits(place_types)
+        types.append(place_types)
+    
+    return PlaceColumns(
+        lats=lats,
+        lons=lons,
+        ratings=ratings,
+        reviews=reviews,
+        price_levels=price_levels,
+        feature_bits=feature_bits,
+        types=types,
+    )
 
 
 # ============================================================================
@@ -263,20 +481,29 @@ class BEVGenerator:
     features for location analysis.
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, use_cache: bool = True):
         """
         Initialize BEV generator.
         
         Args:
             api_key: Google Places API key. If None, reads from environment.
+            use_cache: Reuse cached nearby-search responses (in-process and
+                on disk under PLACES_CACHE_DIR, PLACES_CACHE_TTL_HOURS TTL)
         """
         self.api_key = api_key or os.getenv("GOOGLE_PLACES_API_KEY")
         if not self.api_key:
             raise ValueError("Google Places API key is required")
         
-        self.client = googlemaps.Client(key=self.api_key)
+        self._client_local = threading.local()
+        self._client()  # Fail fast on a malformed key
+        self._search_executor = ThreadPoolExecutor(
+            max_workers=NEARBY_SEARCH_WORKERS, thread_name_prefix="places"
+        )
         self.logger = get_logger(__name__)
-        self._api_calls = 0
+        self.use_cache = use_cache
+        self._memory_cache = TTLCache(PLACES_MEMORY_CACHE_SIZE, PLACES_CACHE_TTL_HOURS * 3600)
+        if use_cache:
+            prune_expired_files(PLACES_CACHE_DIR, PLACES_CACHE_TTL_HOURS * 3600)
         
         self.logger.info("BEVGenerator initialized")
     
@@ -299,26 +526,25 @@ class BEVGenerator:
         Returns:
             BusinessEnvironmentVector with all computed features
         """
-        self._api_calls = 0
-        
         self.logger.info(
             f"Generating BEV for ({center_lat:.6f}, {center_lon:.6f})",
             extra={"extra_fields": {"radius": radius_meters, "grid_id": grid_id}}
         )
         
-        # Fetch all nearby places
-        all_places = self._fetch_all_nearby_places(center_lat, center_lon, radius_meters)
+        # Fetch all nearby places, parsed once into columns
+        all_places, api_calls = self._fetch_all_nearby_places(center_lat, center_lon, radius_meters)
+        columns = _places_to_columns(all_places)
         
         # Compute density features
-        density = self._compute_density_features(all_places)
+        density = self._compute_density_features(columns)
         
         # Compute distance features
         distance = self._compute_distance_features(
-            center_lat, center_lon, all_places, radius_meters
+            center_lat, center_lon, columns, radius_meters
         )
         
         # Compute economic features
-        economic = self._compute_economic_features(all_places, radius_meters)
+        economic = self._compute_economic_features(columns, radius_meters)
         
         bev = BusinessEnvironmentVector(
             grid_id=grid_id,
@@ -328,14 +554,14 @@ class BEVGenerator:
             density=density,
             distance=distance,
             economic=economic,
-            api_calls_used=self._api_calls
+            api_calls_used=api_calls
         )
         
         self.logger.info(
             f"BEV generated successfully",
             extra={"extra_fields": {
                 "total_businesses": economic.total_businesses,
-                "api_calls": self._api_calls
+                "api_calls": api_calls
             }}
         )
         
@@ -376,34 +602,121 @@ class BEVGenerator:
         lat: float,
         lon: float,
         radius: int
-    ) -> List[Dict]:
-        """Fetch all nearby places using multiple type queries."""
+    ) -> Tuple[List[Dict], int]:
+        """
+        Fetch all nearby places using multiple type queries.
+        
+        The per-type searches are independent and network-bound, so they run
+        concurrently on the generator's shared thread pool (which also caps
+        Places calls across concurrent generate_bev() calls); results are
+        merged in NEARBY_SEARCH_TYPES order so de-duplication stays
+        deterministic.
+        Each search reports its own API call count, summed here, so no
+        counter is shared between threads or between generate_bev() calls.
+        
+        Returns:
+            Tuple of (unique places, api_calls_made)
+        """
         all_places = []
         seen_ids = set()
+        total_api_calls = 0
         
-        # Query for each POI type group
-        types_to_query = [
-            "restaurant", "cafe", "gym", "school", "university",
-            "shopping_mall", "store", "hospital", "bank",
-            "transit_station", "park", "movie_theater", "bar"
-        ]
-        
-        for place_type in types_to_query:
+        def search(place_type: str) -> Tuple[List[Dict], int]:
             try:
-                results = self._nearby_search(lat, lon, radius, place_type)
-                
-                for place in results:
-                    place_id = place.get("place_id")
-                    if place_id and place_id not in seen_ids:
-                        seen_ids.add(place_id)
-                        all_places.append(place)
-                        
+                return self._cached_nearby_search(lat, lon, radius, place_type)
             except Exception as e:
                 self.logger.warning(f"Error fetching {place_type}: {e}")
-                continue
+                return [], 0
+        
+        # Query for each POI type group
+        responses = list(self._search_executor.map(search, NEARBY_SEARCH_TYPES))
+        
+        for results, api_calls in responses:
+            total_api_calls += api_calls
+            
+            for place in results:
+                place_id = place.get("place_id")
+                if place_id and place_id not in seen_ids:
+                    seen_ids.add(place_id)
+                    all_places.append(place)
         
         self.logger.debug(f"Fetched {len(all_places)} unique places")
-        return all_places
+        return all_places, total_api_calls
+    
+    def _client(self) -> googlemaps.Client:
+        """
+        googlemaps.Client for the calling thread.
+        
+        Each search thread gets its own client (its QPS limiter and HTTP
+        session are not thread-safe), with an equal share of PLACES_MAX_QPS.
+        """
+        client = getattr(self._client_local, "client", None)
+        if client is None:
+            client = googlemaps.Client(
+                key=self.api_key,
+                queries_per_second=max(1, PLACES_MAX_QPS // NEARBY_SEARCH_WORKERS)
+            )
+            self._client_local.client = client
+        return client
+    
+    def _cached_nearby_search(
+        self,
+        lat: float,
+        lon: float,
+        radius: int,
+        place_type: str
+    ) -> Tuple[List[Dict], int]:
+        """
+        Nearby search with an in-process and on-disk response cache.
+        
+        Cache hits make no API calls. Empty responses are not cached, since
+        _nearby_search() also returns an empty list on API errors.
+        
+        Returns:
+            Tuple of (results, api_calls_made)
+        """
+        if not self.use_cache:
+            return self._nearby_search(lat, lon, radius, place_type)
+        
+        key = _places_cache_key(lat, lon, radius, place_type)
+        
+        results = self._memory_cache.get(key)
+        if results is not None:
+            return results, 0
+        
+        cache_file = PLACES_CACHE_DIR / f"{key}.json"
+        try:
+            cache_age_hours = (time.time() - cache_file.stat().st_mtime) / 3600
+            if cache_age_hours <= PLACES_CACHE_TTL_HOURS:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    results = json.load(f)
+                self._memory_cache.put(key, results, age_seconds=cache_age_hours * 3600)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Places cache hit: {place_type} ({cache_age_hours:.1f}h old)")
+                return results, 0
+            cache_file.unlink()  # Expired
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache entry: fetch fresh
+        
+        results, api_calls = self._nearby_search(lat, lon, radius, place_type)
+        
+        if results:
+            self._memory_cache.put(key, results)
+            try:
+                PLACES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, "w", encoding="utf-8") as f:
+                    json.dump(results, f)
+            except OSError as e:
+                self.logger.warning(f"Could not write places cache: {e}")
+        
+        return results, api_calls
+    
+    def clear_cache(self) -> None:
+        """Drop all cached nearby-search responses (in-process and on disk)."""
+        self._memory_cache.clear()
+        for cache_file in PLACES_CACHE_DIR.glob("*.json"):
+            cache_file.unlink(missing_ok=True)
+        self.logger.info("Places cache cleared")
     
     def _nearby_search(
         self,
@@ -411,30 +724,34 @@ class BEVGenerator:
         lon: float,
         radius: int,
         place_type: str
-    ) -> List[Dict]:
-        """Perform a single nearby search with pagination."""
+    ) -> Tuple[List[Dict], int]:
+        """
+        Perform a single nearby search with pagination.
+        
+        Runs on a worker thread, so it reports its API call count instead of
+        updating shared state.
+        
+        Returns:
+            Tuple of (results, api_calls_made)
+        """
         results = []
+        api_calls = 0
         
         try:
-            response = self.client.places_nearby(
+            response = self._client().places_nearby(
                 location=(lat, lon),
                 radius=radius,
                 type=place_type
             )
-            self._api_calls += 1
+            api_calls += 1
             
             results.extend(response.get("results", []))
             
             # Handle pagination (up to 2 more pages)
             page_count = 0
             while "next_page_token" in response and page_count < 2:
-                import time
-                time.sleep(2)  # Required delay for page token
-                
-                response = self.client.places_nearby(
-                    page_token=response["next_page_token"]
-                )
-                self._api_calls += 1
+                response, calls = self._fetch_next_page(response["next_page_token"])
+                api_calls += calls
                 results.extend(response.get("results", []))
                 page_count += 1
                 
@@ -443,133 +760,125 @@ class BEVGenerator:
         except Exception as e:
             self.logger.error(f"Unexpected error in nearby search: {e}")
         
-        return results
+        return results, api_calls
     
-    def _compute_density_features(self, places: List[Dict]) -> DensityFeatures:
-        """Count POIs by category."""
-        density = DensityFeatures()
+    def _fetch_next_page(self, page_token: str) -> Tuple[Dict, int]:
+        """
+        Fetch the next results page, backing off until the token is ready.
         
-        for place in places:
-            place_types = set(place.get("types", []))
+        Returns:
+            Tuple of (response, api_calls_made)
             
-            # Check each density category
-            for category, type_list in DENSITY_POI_TYPES.items():
-                if any(t in place_types for t in type_list):
-                    current = getattr(density, category, 0)
-                    setattr(density, category, current + 1)
-        
-        return density
+        Raises:
+            ApiError: If the token never becomes valid or the request fails
+        """
+        delay = PLACES_PAGE_TOKEN_DELAY
+        for attempt in range(1, PLACES_PAGE_TOKEN_RETRIES + 1):
+            time.sleep(delay)
+            try:
+                return self._client().places_nearby(page_token=page_token), attempt
+            except ApiError as e:
+                if e.status != "INVALID_REQUEST" or attempt == PLACES_PAGE_TOKEN_RETRIES:
+                    raise
+            delay *= 2
+    
+    def _compute_density_features(self, places: PlaceColumns) -> DensityFeatures:
+        """Count POIs by category."""
+        counts = dict.fromkeys(DENSITY_POI_TYPES, 0)
+        
+        for place_types in places.types:
+            # A place counts once per bucket, however many of its types match
+            buckets = {
+                _TYPE_TO_BUCKET[t] for t in place_types
+                if t in _TYPE_TO_BUCKET
+            }
+            for bucket in buckets:
+                counts[bucket] += 1
+        
+        return DensityFeatures(**counts)
     
     def _compute_distance_features(
         self,
         center_lat: float,
         center_lon: float,
-        places: List[Dict],
+        places: PlaceColumns,
         radius: int
     ) -> DistanceFeatures:
         """Calculate distances to nearest key amenities."""
-        distance = DistanceFeatures()
-        
-        # Type to attribute mapping
-        type_mapping = {
-            "shopping_mall": "distance_to_mall",
-            "movie_theater": "distance_to_cinema",
-            "university": "distance_to_university",
-            "hospital": "distance_to_hospital",
-            "transit_station": "distance_to_transit",
-            "bus_station": "distance_to_transit",
-            "subway_station": "distance_to_transit",
-            "park": "distance_to_park",
-        }
+        nearest: Dict[str, float] = {}
         
-        # Find nearest of each type
-        for place in places:
-            place_types = set(place.get("types", []))
-            geometry = place.get("geometry", {})
-            location = geometry.get("location", {})
-            
-            if not location:
-                continue
-            
-            place_lat = location.get("lat", 0)
-            place_lon = location.get("lng", 0)
-            dist = self._haversine_distance(
-                center_lat, center_lon, place_lat, place_lon
-            )
-            
-            for poi_type, attr in type_mapping.items():
-                if poi_type in place_types:
-                    current = getattr(distance, attr)
-                    if current < 0 or dist < current:
-                        setattr(distance, attr, round(dist, 1))
+        # Places with a location, in input order
+        located = ~np.isnan(places.lats)
+        if not located.any():
+            return DistanceFeatures()
+        
+        lats = places.lats[located]
+        lons = places.lons[located]
+        type_bits = places.feature_bits[located]
+        
+        # Single pass: nearest of each type
+        for attr, dist in _nearest_per_type(center_lat, center_lon, lats, lons, type_bits).items():
+            nearest[attr] = round(dist, 1)
         
         # Estimate main road distance from transit
-        if distance.distance_to_transit >= 0:
-            distance.distance_to_main_road = max(50, distance.distance_to_transit - 50)
+        if "distance_to_transit" in nearest:
+            nearest["distance_to_main_road"] = max(50, nearest["distance_to_transit"] - 50)
         
-        return distance
+        return DistanceFeatures(**nearest)
     
     def _compute_economic_features(
         self,
-        places: List[Dict],
+        places: PlaceColumns,
         radius: int
     ) -> EconomicFeatures:
         """Compute economic proxy features."""
-        economic = EconomicFeatures()
-        
-        ratings = []
-        review_counts = []
-        premium_count = 0
-        economy_count = 0
-        
-        for place in places:
-            rating = place.get("rating")
-            reviews = place.get("user_ratings_total", 0)
-            price_level = place.get("price_level")
-            
-            if rating:
-                ratings.append(rating)
-            if reviews:
-                review_counts.append(reviews)
-            
-            if price_level is not None:
-                if price_level >= 3:
-                    premium_count += 1
-                elif price_level <= 2:
-                    economy_count += 1
-        
-        economic.total_businesses = len(places)
-        
-        if ratings:
-            economic.avg_business_rating = round(sum(ratings) / len(ratings), 2)
-        
-        if review_counts:
-            economic.avg_review_count = round(sum(review_counts) / len(review_counts), 1)
-        
-        economic.premium_business_count = premium_count
-        economic.economy_business_count = economy_count
-        
+        ratings = places.ratings[~np.isnan(places.ratings)]
+        review_counts = places.reviews[places.reviews != 0]
+        premium_count = int(np.count_nonzero(places.price_levels >= 3))
+        economy_count = int(np.count_nonzero(
+            (places.price_levels >= 0) & (places.price_levels <= 2)
+        ))
+        
+        avg_business_rating = 0.0
+        if ratings.size:
+            avg_business_rating = round(float(ratings.mean()), 2)
+        
+        avg_review_count = 0.0
+        if review_counts.size:
+            avg_review_count = round(float(review_counts.mean()), 1)
+        
+        premium_to_economy_ratio = 0.0
         if economy_count > 0:
-            economic.premium_to_economy_ratio = round(premium_count / economy_count, 2)
+            premium_to_economy_ratio = round(premium_count / economy_count, 2)
         elif premium_count > 0:
-            economic.premium_to_economy_ratio = 2.0  # All premium
+            premium_to_economy_ratio = 2.0  # All premium
         
         # Determine income proxy
-        if (economic.avg_business_rating >= INCOME_THRESHOLDS["high"]["avg_rating"] and
-            economic.premium_to_economy_ratio >= INCOME_THRESHOLDS["high"]["premium_ratio"]):
-            economic.income_proxy = "high"
-        elif (economic.avg_business_rating >= INCOME_THRESHOLDS["mid"]["avg_rating"] and
-              economic.premium_to_economy_ratio >= INCOME_THRESHOLDS["mid"]["premium_ratio"]):
-            economic.income_proxy = "mid"
+        if (avg_business_rating >= INCOME_THRESHOLDS["high"]["avg_rating"] and
+            premium_to_economy_ratio >= INCOME_THRESHOLDS["high"]["premium_ratio"]):
+            income_proxy = "high"
+        elif (avg_business_rating >= INCOME_THRESHOLDS["mid"]["avg_rating"] and
+              premium_to_economy_ratio >= INCOME_THRESHOLDS["mid"]["premium_ratio"]):
+            income_proxy = "mid"
         else:
-            economic.income_proxy = "low"
+            income_proxy = "low"
         
         # Competition density (per 100m²)
+        competition_density = 0.0
         area_100m2 = (math.pi * radius * radius) / 100
         if area_100m2 > 0:
-            economic.competition_density = round(len(places) / area_100m2, 4)
-        
-        return economic
+            competition_density = round(len(places) / area_100m2, 4)
+        
+        return EconomicFeatures(
+            avg_business_rating=avg_business_rating,
+            avg_review_count=avg_review_count,
+            total_businesses=len(places),
+            premium_business_count=premium_count,
+            economy_business_count=economy_count,
+            premium_to_economy_ratio=premium_to_economy_ratio,
+            income_proxy=income_proxy,
+            competition_density=competition_density,
+        )
     
     def _haversine_distance(
         self,
@@ -579,19 +888,8 @@ class BEVGenerator:
         lon2: float
     ) -> float:
         """Calculate distance between two points in meters."""
-        R = 6371000  # Earth radius in meters
-        
         phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-        
-        a = (math.sin(delta_phi / 2) ** 2 +
-             math.cos(phi1) * math.cos(phi2) *
-             math.sin(delta_lambda / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c
+        return _haversine_from_center(phi1, math.cos(phi1), math.radians(lon1), lat2, lon2)
 
 
 # ============================================================================
@@ -5,7 +5,8 @@ Provides fast point-in-polygon grid assignment using Shapely and in-memory cachi
 
 Features:
 - Load grid boundaries from database on initialization
-- Cache as Shapely Polygon objects for fast lookups
+- Cache as Shapely Polygon objects plus NumPy bounds arrays for fast lookups
+- Uniform spatial-hash index for O(1) single-point assignment
 - assign_grid_id() for coordinate → grid_id mapping
 - Comprehensive validation and error handling
 - Performance optimized for frequent lookups
@@ -20,10 +21,12 @@ Usage:
         bounds = service.get_grid_bounds(grid_id)
 """
 
+import logging
+import threading
 from typing import Optional, Dict, List, Tuple
 from decimal import Decimal
-from shapely.geometry import Point, Polygon
-from shapely.errors import ShapelyError
+from shapely.geometry import Polygon, box
+import numpy as np
 
 from src.database.connection import get_session
 from src.database.models import GridCellModel
@@ -42,8 +45,26 @@ KARACHI_BOUNDS = {
     "lon_max": 67.4,
 }
 
+# Points per chunk in assign_grid_ids() (caps the points × grids matrix)
+ASSIGN_BATCH_SIZE = 4096
+
+# Columns load_grids() needs (projection query: plain rows, no ORM objects)
+GRID_COLUMNS = (
+    GridCellModel.grid_id,
+    GridCellModel.neighborhood,
+    GridCellModel.lat_center,
+    GridCellModel.lon_center,
+    GridCellModel.lat_north,
+    GridCellModel.lat_south,
+    GridCellModel.lon_east,
+    GridCellModel.lon_west,
+    GridCellModel.area_km2,
+)
+
 # Tolerance for coordinate precision (degrees)
-COORDINATE_PRECISION = 7  # Matches database DECIMAL(10,7)
+# Coordinates are stored as DOUBLE PRECISION; 7 decimals (~1 cm) is kept as
+# the significant precision, the same rounding micro-grid coordinates use
+COORDINATE_PRECISION = 7
 
 
 # ============================================================================
@@ -78,6 +99,20 @@ class GeospatialService:
         self.grids: Dict[str, Polygon] = {}
         self.grid_metadata: Dict[str, Dict] = {}
         self._grid_list: List[Tuple[str, Polygon]] = []  # For efficient iteration
+        # Axis-aligned grid bounds, one row per grid in _grid_list order:
+        # (lat_south, lat_north, lon_west, lon_east)
+        self._bounds = np.empty((0, 4), dtype=np.float64)
+        self._ids_np = np.empty(0, dtype=object)
+        # Uniform spatial hash over _bounds (see _build_cell_index()):
+        # (row, col) -> (lat_south, lat_north, lon_west, lon_east, grid_id)
+        # of every grid overlapping that hash cell
+        self._cells: Dict[Tuple[int, int], Tuple[Tuple, ...]] = {}
+        # Grid count per lower-cased neighborhood (see count_grids())
+        self._counts: Dict[str, int] = {}
+        self._lat0 = 0.0
+        self._lon0 = 0.0
+        self._inv_dlat = 0.0
+        self._inv_dlon = 0.0
         
         if auto_load:
             self.load_grids()
@@ -99,8 +134,8 @@ class GeospatialService:
         
         try:
             with get_session() as session:
-                # Query all grid cells
-                grid_cells = session.query(GridCellModel).all()
+                # Query all grid cells (column projection, no ORM hydration)
+                grid_cells = session.query(*GRID_COLUMNS).all()
                 
                 duration = time.time() - start_time
                 
@@ -120,6 +155,7 @@ class GeospatialService:
                 
                 # Convert to Shapely polygons
                 loaded_count = 0
+                bounds = []
                 for grid in grid_cells:
                     try:
                         polygon = self._create_polygon_from_grid(grid)
@@ -128,7 +164,7 @@ class GeospatialService:
                         self.grids[grid.grid_id] = polygon
                         
                         # Cache metadata
-                        self.grid_metadata[grid.grid_id] = {
+                        metadata = {
                             "grid_id": grid.grid_id,
                             "neighborhood": grid.neighborhood,
                             "lat_center": float(grid.lat_center),
@@ -139,6 +175,13 @@ class GeospatialService:
                             "lon_west": float(grid.lon_west),
                             "area_km2": float(grid.area_km2) if grid.area_km2 else 0.5,
                         }
+                        self.grid_metadata[grid.grid_id] = metadata
+                        neighborhood_key = grid.neighborhood.lower()
+                        self._counts[neighborhood_key] = self._counts.get(neighborhood_key, 0) + 1
+                        bounds.append((
+                            metadata["lat_south"], metadata["lat_north"],
+                            metadata["lon_west"], metadata["lon_east"],
+                        ))
                         
                         loaded_count += 1
                         
@@ -151,6 +194,12 @@ class GeospatialService:
                 # Create list for efficient iteration (avoid dict iteration overhead)
                 self._grid_list = list(self.grids.items())
                 
+                # Grids are rectangles: keep their bounds as one float64 array
+                # so lookups are vectorized comparisons instead of GEOS calls
+                self._bounds = np.array(bounds, dtype=np.float64).reshape(-1, 4)
+                self._ids_np = np.array([grid_id for grid_id, _ in self._grid_list], dtype=object)
+                self._build_cell_index()
+                
                 total_duration = time.time() - start_time
                 self.logger.info(
                     f"Loaded {loaded_count} grid cells in {total_duration:.3f}s",
@@ -166,12 +215,44 @@ class GeospatialService:
             self.logger.error(f"Failed to load grids from database: {e}")
             raise RuntimeError(f"Database error while loading grids: {e}")
     
-    def _create_polygon_from_grid(self, grid: GridCellModel) -> Polygon:
+    def _build_cell_index(self) -> None:
+        """
+        Build the uniform spatial hash used by assign_grid_id().
+        
+        Hash cells are sized to the median grid height/width and anchored at
+        the south-west corner of all grids, so each micro-grid maps to about
+        one hash cell. Every grid is registered in each hash cell its bounds
+        touch (in load order), so a lookup only bounds-tests the few grids in
+        the point's hash cell and still works for overlapping or unevenly
+        sized grids.
+        """
+        bounds = self._bounds
+        self._cells = {}
+        if not len(bounds):
+            return
+        
+        self._lat0 = float(bounds[:, 0].min())
+        self._lon0 = float(bounds[:, 2].min())
+        self._inv_dlat = 1.0 / float(np.median(bounds[:, 1] - bounds[:, 0]))
+        self._inv_dlon = 1.0 / float(np.median(bounds[:, 3] - bounds[:, 2]))
+        
+        rows = ((bounds[:, :2] - self._lat0) * self._inv_dlat).astype(np.int64)
+        cols = ((bounds[:, 2:] - self._lon0) * self._inv_dlon).astype(np.int64)
+        cells: Dict[Tuple[int, int], List[Tuple]] = {}
+        for entry, (row_min, row_max), (col_min, col_max) in zip(
+            zip(*bounds.T.tolist(), self._ids_np.tolist()), rows.tolist(), cols.tolist()
+        ):
+            for row in range(row_min, row_max + 1):
+                for col in range(col_min, col_max + 1):
+                    cells.setdefault((row, col), []).append(entry)
+        self._cells = {key: tuple(entries) for key, entries in cells.items()}
+    
+    def _create_polygon_from_grid(self, grid) -> Polygon:
         """
         Create a Shapely Polygon from grid boundary coordinates.
         
         Args:
-            grid: GridCellModel instance
+            grid: GridCellModel instance or GRID_COLUMNS row
             
         Returns:
             Shapely Polygon representing the grid boundary
@@ -180,22 +261,15 @@ class GeospatialService:
             ValueError: If coordinates are invalid
         """
         try:
-            # Grid is a rectangle defined by north/south/east/west bounds
-            # Create polygon vertices in counter-clockwise order
-            vertices = [
-                (float(grid.lon_west), float(grid.lat_north)),   # NW corner
-                (float(grid.lon_east), float(grid.lat_north)),   # NE corner
-                (float(grid.lon_east), float(grid.lat_south)),   # SE corner
-                (float(grid.lon_west), float(grid.lat_south)),   # SW corner
-                (float(grid.lon_west), float(grid.lat_north)),   # Close polygon
-            ]
-            
-            polygon = Polygon(vertices)
+            # Grid is a rectangle defined by north/south/east/west bounds;
+            # box() builds it directly, so only zero-area grids can be invalid
+            lon_west, lat_south = float(grid.lon_west), float(grid.lat_south)
+            lon_east, lat_north = float(grid.lon_east), float(grid.lat_north)
             
-            if not polygon.is_valid:
+            if lat_north == lat_south or lon_east == lon_west:
                 raise ValueError(f"Invalid polygon for grid {grid.grid_id}")
             
-            return polygon
+            return box(lon_west, lat_south, lon_east, lat_north)
             
         except (ValueError, TypeError, AttributeError) as e:
             raise ValueError(f"Invalid grid coordinates for {grid.grid_id}: {e}")
@@ -222,31 +296,30 @@ class GeospatialService:
             self.logger.error("No grids loaded. Call load_grids() first.")
             raise RuntimeError("Grid cache is empty. Service not initialized properly.")
         
-        # Create point
-        try:
-            point = Point(lon, lat)  # Note: Shapely uses (x, y) = (lon, lat)
-        except ShapelyError as e:
-            self.logger.error(f"Failed to create Point({lon}, {lat}): {e}")
-            raise ValueError(f"Invalid coordinates: {e}")
-        
-        # Check each grid (using cached list for performance)
-        for grid_id, polygon in self._grid_list:
-            try:
-                if polygon.contains(point):
-                    self.logger.debug(
-                        f"Point ({lat}, {lon}) assigned to grid {grid_id}",
-                        extra={"extra_fields": {
-                            "lat": lat,
-                            "lon": lon,
-                            "grid_id": grid_id
-                        }}
-                    )
-                    return grid_id
-            except ShapelyError as e:
-                self.logger.warning(
-                    f"Point-in-polygon check failed for grid {grid_id}: {e}"
+        # Hash the point to its spatial-hash cell, then bounds-test only the
+        # grids registered there. Strict comparisons match Polygon.contains():
+        # points on a grid boundary are not inside it. Candidates are in load
+        # order, so overlapping grids resolve to the first loaded one.
+        row = int((lat - self._lat0) * self._inv_dlat)
+        col = int((lon - self._lon0) * self._inv_dlon)
+        grid_id = None
+        for lat_south, lat_north, lon_west, lon_east, candidate in self._cells.get((row, col), ()):
+            if lat_south < lat < lat_north and lon_west < lon < lon_east:
+                grid_id = candidate
+                break
+        
+        if grid_id is not None:
+            # Hot path: skip message/extra construction unless DEBUG is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Point ({lat}, {lon}) assigned to grid {grid_id}",
+                    extra={"extra_fields": {
+                        "lat": lat,
+                        "lon": lon,
+                        "grid_id": grid_id
+                    }}
                 )
-                continue
+            return grid_id
         
         # Point not in any grid
         self.logger.warning(
@@ -259,6 +332,67 @@ class GeospatialService:
         )
         return None
     
+    def assign_grid_ids(self, lats, lons) -> np.ndarray:
+        """
+        Assign many coordinates to grid cells in one vectorized call.
+        
+        Same semantics as assign_grid_id() (strict bounds, first loaded grid
+        wins on overlap), but broadcasts the bbox test across all points.
+        Points are processed in chunks of ASSIGN_BATCH_SIZE to cap the
+        points × grids intermediate.
+        
+        Args:
+            lats: Sequence/array of latitudes
+            lons: Sequence/array of longitudes (same length as lats)
+            
+        Returns:
+            Object array of grid ID strings (None where no grid matches)
+            
+        Raises:
+            ValueError: If inputs differ in shape or contain invalid coordinates
+            RuntimeError: If grids are not loaded
+        """
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        lons = np.asarray(lons, dtype=np.float64).ravel()
+        
+        if lats.shape != lons.shape:
+            raise ValueError(
+                f"lats and lons must have the same length. Got {lats.size} and {lons.size}"
+            )
+        
+        if not (np.all(np.abs(lats) <= 90) and np.all(np.abs(lons) <= 180)):
+            raise ValueError("Latitudes must be within [-90, 90] and longitudes within [-180, 180]")
+        
+        if not self.grids:
+            self.logger.error("No grids loaded. Call load_grids() first.")
+            raise RuntimeError("Grid cache is empty. Service not initialized properly.")
+        
+        result = np.full(lats.size, None, dtype=object)
+        bounds = self._bounds
+        
+        for start in range(0, lats.size, ASSIGN_BATCH_SIZE):
+            lat = lats[start:start + ASSIGN_BATCH_SIZE, None]
+            lon = lons[start:start + ASSIGN_BATCH_SIZE, None]
+            
+            # (points, grids) membership matrix
+            inside = (
+                (bounds[None, :, 0] < lat) & (lat < bounds[None, :, 1]) &
+                (bounds[None, :, 2] < lon) & (lon < bounds[None, :, 3])
+            )
+            hit = inside.any(axis=1)
+            first = inside.argmax(axis=1)  # first True per row = first loaded grid
+            
+            chunk = result[start:start + ASSIGN_BATCH_SIZE]
+            chunk[hit] = self._ids_np[first[hit]]
+        
+        unassigned = int(np.count_nonzero(result == None))  # noqa: E711 (elementwise)
+        if unassigned:
+            self.logger.warning(
+                f"{unassigned} of {lats.size} points do not fall within any grid cell"
+            )
+        
+        return result
+    
     def get_grid_bounds(self, grid_id: str) -> Optional[Dict[str, float]]:
         """
         Get boundary coordinates for a grid cell.
@@ -316,6 +450,23 @@ class GeospatialService:
         else:
             return list(self.grids.keys())
     
+    def count_grids(self, neighborhood: Optional[str] = None) -> int:
+        """
+        Count grid IDs, optionally filtered by neighborhood.
+        
+        Same filter as list_grids(), but answered from counters kept at load
+        time instead of building the list.
+        
+        Args:
+            neighborhood: Filter by neighborhood name (case-insensitive)
+            
+        Returns:
+            Number of grids
+        """
+        if neighborhood:
+            return self._counts.get(neighborhood.lower(), 0)
+        return len(self.grids)
+    
     def get_neighborhoods(self) -> List[str]:
         """
         Get list of unique neighborhoods.
@@ -374,6 +525,10 @@ class GeospatialService:
         self.grids.clear()
         self.grid_metadata.clear()
         self._grid_list.clear()
+        self._bounds = np.empty((0, 4), dtype=np.float64)
+        self._ids_np = np.empty(0, dtype=object)
+        self._cells = {}
+        self._counts.clear()
         return self.load_grids()
     
     def is_initialized(self) -> bool:
@@ -408,15 +563,40 @@ class GeospatialService:
 # Module-Level Singleton (Optional Convenience)
 # ============================================================================
 
-# Global service instance (lazy-loaded)
+# Global service instance (preloaded via init_geospatial_service(), else lazy)
 _service_instance: Optional[GeospatialService] = None
+_service_lock = threading.Lock()
+
+
+def init_geospatial_service() -> GeospatialService:
+    """
+    Build the singleton geospatial service now, off the request path.
+    
+    Call once at startup (before the first lookup) so the grid load is not
+    paid by whichever caller happens to come first. Safe to call from
+    several threads: only one of them loads the grids.
+    
+    Returns:
+        GeospatialService instance
+        
+    Raises:
+        RuntimeError: If grids cannot be loaded from the database
+    """
+    global _service_instance
+    
+    with _service_lock:
+        if _service_instance is None:
+            _service_instance = GeospatialService(auto_load=True)
+    
+    return _service_instance
 
 
 def get_geospatial_service() -> GeospatialService:
     """
     Get the singleton geospatial service instance.
     
-    Lazy-loads the service on first call. Subsequent calls return cached instance.
+    Returns the instance built by init_geospatial_service(), or lazy-loads
+    it on first call if the service was not preloaded.
     
     Returns:
         GeospatialService instance
@@ -426,10 +606,8 @@ def get_geospatial_service() -> GeospatialService:
         >>> service = get_geospatial_service()
         >>> grid_id = service.assign_grid_id(24.8290, 67.0610)
     """
-    global _service_instance
-    
     if _service_instance is None:
-        _service_instance = GeospatialService(auto_load=True)
+        return init_geospatial_service()
     
     return _service_instance
 
@@ -454,6 +632,26 @@ def assign_grid_id(lat: float, lon: float) -> Optional[str]:
     return service.assign_grid_id(lat, lon)
 
 
+def assign_grid_ids(lats, lons) -> np.ndarray:
+    """
+    Convenience function to assign many grid IDs using singleton service.
+    
+    Args:
+        lats: Sequence/array of latitudes
+        lons: Sequence/array of longitudes
+        
+    Returns:
+        Object array of grid IDs (None where unassigned)
+        
+    Example:
+        >>> from src.services.geospatial_service import assign_grid_ids
+        >>> assign_grid_ids([24.8290, 24.7500], [67.0610, 67.0000])
+        array(['DHA-Phase2-Cell-07', None], dtype=object)
+    """
+    service = get_geospatial_service()
+    return service.assign_grid_ids(lats, lons)
+
+
 def get_grid_bounds(grid_id: str) -> Optional[Dict[str, float]]:
     """
     Convenience function to get grid bounds using singleton service.
@@ -499,7 +697,7 @@ if __name__ == "__main__":
         # List neighborhoods
         print("2. Available neighborhoods:")
         for neighborhood in service.get_neighborhoods():
-            grid_count = len(service.list_grids(neighborhood))
+            grid_count = service.count_grids(neighborhood)
             print(f"   - {neighborhood}: {grid_count} grids")
         print()
         
@@ -10,6 +10,7 @@ Features:
 - JSON response parsing
 - Fallback handling for API errors
 - Configurable model selection
+- In-process and on-disk cache of evaluations keyed by prompt hash
 
 Usage:
     from src.services.llm_evaluator import LLMEvaluator
@@ -17,19 +18,27 @@ Usage:
     evaluator = LLMEvaluator()
     result = evaluator.evaluate(bev)
     print(f"Gym Probability: {result['gym_probability']}")
+    
+    # Many BEVs concurrently (rate limited)
+    results = asyncio.run(evaluator.evaluate_batch_async(bevs))
 """
 
 import os
-import json
 import re
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import time
+import asyncio
+import hashlib
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, List, Optional
+from dataclasses import dataclass, asdict, replace
 
-from groq import Groq
+import httpx
+import orjson
+from groq import APITimeoutError, AsyncGroq, Groq, RateLimitError
 
 from src.services.bev_generator import BusinessEnvironmentVector
 from src.utils.logger import get_logger
+from src.utils.ttl_cache import TTLCache, cache_dir_from_env, prune_expired_files
 
 
 # ============================================================================
@@ -39,6 +48,33 @@ from src.utils.logger import get_logger
 # Groq model options (reasoning models)
 DEFAULT_MODEL = "llama-3.3-70b-versatile"  # Best reasoning
 FALLBACK_MODEL = "llama-3.1-8b-instant"    # Faster fallback
+FALLBACK_MAX_TOKENS = 700
+
+# Responses cut off at max_tokens are retried once with this budget
+TRUNCATION_RETRY_MAX_TOKENS = 1600
+
+# Primary-model failures that are retried once on FALLBACK_MODEL
+FALLBACK_ERRORS = (APITimeoutError, RateLimitError)
+
+# Bounded Groq calls: a stalled request fails fast into the fallback result
+# instead of tying up the caller (SDK retries back off between attempts)
+GROQ_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+GROQ_MAX_RETRIES = 3
+
+# Evaluation cache: identical prompts (same BEV, model, temperature) reuse
+# the stored result instead of calling Groq again. On disk under
+# $LLM_CACHE_DIR or the system temp dir (writable on serverless)
+LLM_CACHE_DIR = cache_dir_from_env("LLM_CACHE_DIR", "llm_evaluations")
+LLM_CACHE_TTL_HOURS = 24
+LLM_MEMORY_CACHE_SIZE = 1024  # Evaluations kept in-process
+
+# Message lists kept per BEV (retries, fallbacks, temperature sweeps)
+MESSAGES_CACHE_SIZE = 1024
+
+# Async request rate limit per evaluator (requests per minute), shared by
+# every async evaluation, and the batch in-flight cap
+DEFAULT_QPM = 500
+MAX_CONCURRENT_PER_QPS = 5  # In-flight requests allowed per request/second
 
 # Prompt templates
 SYSTEM_PROMPT = """You are an expert location analyst for business site selection in Karachi, Pakistan.
@@ -69,6 +105,20 @@ A probability of 0.4-0.7 indicates moderate suitability.
 A probability below 0.4 indicates poor suitability.
 """
 
+# Shared system message: every request starts with the same prefix
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Probability patterns for salvaging non-JSON responses
+_GYM_RE = re.compile(r'gym[_\s]?probability["\s:]+([0-9.]+)', re.IGNORECASE)
+_CAFE_RE = re.compile(r'cafe[_\s]?probability["\s:]+([0-9.]+)', re.IGNORECASE)
+
+# Probabilities are final once the model has emitted the character after them
+_STREAM_GYM_RE = re.compile(r'"gym_probability"\s*:\s*([0-9.]+)(?=[\s,}])')
+_STREAM_CAFE_RE = re.compile(r'"cafe_probability"\s*:\s*([0-9.]+)(?=[\s,}])')
+
+# Reasoning placeholder for results salvaged from non-JSON responses
+EXTRACTED_REASONING = "Extracted from non-standard response"
+
 USER_PROMPT_TEMPLATE = """{bev_data}
 
 [Task]
@@ -102,7 +152,8 @@ class LLMEvaluationResult:
     
     def __post_init__(self):
         if not self.evaluated_at:
-            self.evaluated_at = datetime.utcnow().isoformat()
+            # UTC ISO-8601 to the second; cheaper than datetime.utcnow().isoformat()
+            self.evaluated_at = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -119,6 +170,46 @@ class LLMEvaluationResult:
         }
 
 
+def _evaluation_cache_key(request: Dict[str, Any]) -> str:
+    """Cache key for a chat completion request (model, prompts, settings)."""
+    raw = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(raw).hexdigest()
+
+
+@lru_cache(maxsize=MESSAGES_CACHE_SIZE)
+def _build_messages(bev: BusinessEnvironmentVector) -> List[Dict[str, str]]:
+    """
+    Chat messages for a BEV, built once per (frozen, hashable) BEV.
+    
+    The system message is one shared object and always comes first, so
+    every request starts with the same byte-identical prefix that Groq's
+    prompt caching can reuse. The returned list is shared: do not mutate.
+    """
+    user_prompt = USER_PROMPT_TEMPLATE.format(bev_data=bev.to_prompt_format())
+    return [_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}]
+
+
+class _AsyncRateLimiter:
+    """
+    Spaces request starts at least 60/qpm seconds apart.
+    
+    Must be created and used within a single event loop.
+    """
+    
+    def __init__(self, qpm: int):
+        self.interval = 60.0 / qpm
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+    
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 # ============================================================================
 # LLM Evaluator Class
 # ============================================================================
@@ -134,7 +225,9 @@ class LLMEvaluator:
     def __init__(
         self,
         api_key: str = None,
-        model: str = DEFAULT_MODEL
+        model: str = DEFAULT_MODEL,
+        use_cache: bool = True,
+        qpm: int = DEFAULT_QPM
     ):
         """
         Initialize LLM evaluator.
@@ -142,13 +235,37 @@ class LLMEvaluator:
         Args:
             api_key: Groq API key. If None, reads from environment.
             model: Groq model to use.
+            use_cache: Reuse cached evaluations of identical prompts
+                (in-process and on disk under LLM_CACHE_DIR, LLM_CACHE_TTL_HOURS TTL)
+            qpm: Max async Groq requests per minute, across all callers
         """
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("GROQ_API_KEY is required")
         
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(
+            api_key=self.api_key,
+            timeout=GROQ_TIMEOUT,
+            max_retries=GROQ_MAX_RETRIES
+        )
+        self.async_client = AsyncGroq(
+            api_key=self.api_key,
+            timeout=GROQ_TIMEOUT,
+            max_retries=GROQ_MAX_RETRIES
+        )
         self.model = model
+        self.use_cache = use_cache
+        # Raw LLM text is debug-only: it roughly doubles each cached result
+        self.keep_raw = os.getenv("LLM_KEEP_RAW", "0") == "1"
+        self._memory_cache = TTLCache(LLM_MEMORY_CACHE_SIZE, LLM_CACHE_TTL_HOURS * 3600)
+        if use_cache:
+            prune_expired_files(LLM_CACHE_DIR, LLM_CACHE_TTL_HOURS * 3600)
+        # Uncached async requests in flight, so concurrent identical prompts
+        # share one Groq call (entries drop out as soon as the call finishes)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.qpm = qpm
+        self._limiter: Optional[_AsyncRateLimiter] = None
+        self._limiter_loop: Optional[asyncio.AbstractEventLoop] = None
         self.logger = get_logger(__name__)
         
         self.logger.info(
@@ -171,47 +288,421 @@ class LLMEvaluator:
         Returns:
             LLMEvaluationResult with probabilities and reasoning
         """
-        # Generate prompt
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            bev_data=bev.to_prompt_format()
-        )
+        request = self._build_request(bev, temperature)
+        cache_key = _evaluation_cache_key(request)
+        
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
         self.logger.debug(f"Sending prompt to {self.model}")
         
         try:
             # Call Groq API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=temperature,
-                max_tokens=1000,
-                response_format={"type": "json_object"}
-            )
+            try:
+                response = self.client.chat.completions.create(
+                    **request
+                )
+            except FALLBACK_ERRORS as e:
+                fallback_request = self._fallback_request(request, e)
+                response = self.client.chat.completions.create(**fallback_request)
+                # Not cached: the primary model should answer next time
+                return self._handle_response(response, FALLBACK_MODEL)
+            
+            retry_request = self._truncation_retry_request(request, response)
+            if retry_request is not None:
+                response = self.client.chat.completions.create(**retry_request)
+            
+            result = self._handle_response(response, self.model)
+            self._cache_put(cache_key, result)
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"LLM evaluation error: {e}")
+            return self._get_fallback_result(str(e))
+    
+    async def evaluate_async(
+        self,
+        bev: BusinessEnvironmentVector,
+        temperature: float = 0.3
+    ) -> LLMEvaluationResult:
+        """
+        Evaluate location suitability using the async Groq client.
+        
+        Same request and parsing as evaluate(), but awaits the network call
+        so many evaluations can be in flight at once. Concurrent calls with
+        an identical prompt share a single request.
+        
+        Args:
+            bev: Business Environment Vector
+            temperature: LLM temperature (lower = more deterministic)
+            
+        Returns:
+            LLMEvaluationResult with probabilities and reasoning
+        """
+        request = self._build_request(bev, temperature)
+        cache_key = _evaluation_cache_key(request)
+        
+        cached = await self._cache_get_async(cache_key)
+        if cached is not None:
+            return cached
+        
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            # Identical prompt already on the wire: share its answer
+            return self._copy_result(await asyncio.shield(pending))
+        
+        pending = asyncio.ensure_future(self._request_async(request, cache_key))
+        self._inflight[cache_key] = pending
+        pending.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(pending)
+    
+    async def _request_async(
+        self,
+        request: Dict[str, Any],
+        cache_key: str
+    ) -> LLMEvaluationResult:
+        """Send an uncached evaluation request (with model fallback and retry)."""
+        self.logger.debug(f"Sending prompt to {self.model} (async)")
+        
+        try:
+            try:
+                response = await self._create_async(
+                    **request
+                )
+            except FALLBACK_ERRORS as e:
+                fallback_request = self._fallback_request(request, e)
+                response = await self._create_async(**fallback_request)
+                # Not cached: the primary model should answer next time
+                return self._handle_response(response, FALLBACK_MODEL)
             
-            # Extract response
-            raw_response = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens if response.usage else 0
+            retry_request = self._truncation_retry_request(request, response)
+            if retry_request is not None:
+                response = await self._create_async(**retry_request)
             
-            # Parse JSON response
-            result = self._parse_response(raw_response, tokens_used)
+            result = self._handle_response(response, self.model)
+            await self._cache_put_async(cache_key, result)
+            return result
             
+        except Exception as e:
+            self.logger.error(f"LLM evaluation error: {e}")
+            return self._get_fallback_result(str(e))
+    
+    async def _create_async(self, **request):
+        """Async chat completion, spaced by the evaluator-wide qpm limit."""
+        loop = asyncio.get_running_loop()
+        if self._limiter_loop is not loop:
+            # The limiter's lock belongs to one event loop
+            self._limiter = _AsyncRateLimiter(self.qpm)
+            self._limiter_loop = loop
+        await self._limiter.wait()
+        return await self.async_client.chat.completions.create(**request)
+    
+    async def evaluate_stream_async(
+        self,
+        bev: BusinessEnvironmentVector,
+        temperature: float = 0.3
+    ) -> AsyncIterator[LLMEvaluationResult]:
+        """
+        Evaluate location suitability, yielding the scores before the reasoning.
+        
+        Streams the completion and yields a partial result (probabilities
+        only, empty reasoning/factors/risks) as soon as both probabilities
+        have arrived, then the complete result once the stream ends. Cache
+        hits, fallback-model answers and failures yield a single complete
+        result, as evaluate_async() would return.
+        
+        Args:
+            bev: Business Environment Vector
+            temperature: LLM temperature (lower = more deterministic)
+            
+        Yields:
+            LLMEvaluationResult (partial first, when streamed, then complete)
+        """
+        request = self._build_request(bev, temperature)
+        cache_key = _evaluation_cache_key(request)
+        
+        cached = await self._cache_get_async(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        self.logger.debug(f"Streaming prompt to {self.model}")
+        
+        try:
+            try:
+                stream = await self._create_async(
+                    **request, stream=True
+                )
+            except FALLBACK_ERRORS as e:
+                fallback_request = self._fallback_request(request, e)
+                response = await self._create_async(**fallback_request)
+                # Not cached: the primary model should answer next time
+                yield self._handle_response(response, FALLBACK_MODEL)
+                return
+            
+            text = ""
+            tokens_used = 0
+            partial_sent = False
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    text += chunk.choices[0].delta.content
+                x_groq = getattr(chunk, "x_groq", None)
+                usage = getattr(chunk, "usage", None) or getattr(x_groq, "usage", None)
+                if usage:
+                    tokens_used = usage.total_tokens
+                
+                if not partial_sent:
+                    gym_match = _STREAM_GYM_RE.search(text)
+                    cafe_match = gym_match and _STREAM_CAFE_RE.search(text)
+                    if cafe_match:
+                        partial_sent = True
+                        yield LLMEvaluationResult(
+                            gym_probability=self._clamp_probability(gym_match.group(1)),
+                            cafe_probability=self._clamp_probability(cafe_match.group(1)),
+                            gym_reasoning="",
+                            cafe_reasoning="",
+                            key_factors=[],
+                            risks=[],
+                            recommendation="",
+                            model_used=self.model,
+                        )
+            
+            result = self._parse_response(text, tokens_used)
             self.logger.info(
-                "LLM evaluation complete",
+                "LLM evaluation complete (streamed)",
                 extra={"extra_fields": {
                     "gym_prob": result.gym_probability,
                     "cafe_prob": result.cafe_probability,
+                    "model": self.model,
                     "tokens": tokens_used
                 }}
             )
-            
-            return result
+            await self._cache_put_async(cache_key, result)
+            yield result
             
         except Exception as e:
             self.logger.error(f"LLM evaluation error: {e}")
-            return self._get_fallback_result(str(e))
+            yield self._get_fallback_result(str(e))
+    
+    async def evaluate_batch_async(
+        self,
+        bevs: List[BusinessEnvironmentVector],
+        temperature: float = 0.3,
+        qpm: int = None
+    ) -> List[LLMEvaluationResult]:
+        """
+        Evaluate many BEVs concurrently within a requests-per-minute budget.
+        
+        Requests always go through the evaluator-wide qpm limit; a lower
+        qpm here spaces this batch further. At most MAX_CONCURRENT_PER_QPS
+        requests per second of budget are in flight. A failed evaluation
+        yields the fallback result in its slot.
+        
+        Args:
+            bevs: Business Environment Vectors to evaluate
+            temperature: LLM temperature (lower = more deterministic)
+            qpm: Maximum requests per minute for this batch (default: self.qpm)
+            
+        Returns:
+            One LLMEvaluationResult per BEV, in input order
+        """
+        if not bevs:
+            return []
+        
+        limiter = _AsyncRateLimiter(qpm) if qpm else None
+        semaphore = asyncio.Semaphore(max(1, (qpm or self.qpm) // 60 * MAX_CONCURRENT_PER_QPS))
+        
+        async def run(bev: BusinessEnvironmentVector) -> LLMEvaluationResult:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.wait()
+                return await self.evaluate_async(bev, temperature)
+        
+        results = await asyncio.gather(*(run(bev) for bev in bevs), return_exceptions=True)
+        
+        return [
+            self._get_fallback_result(str(result)) if isinstance(result, BaseException) else result
+            for result in results
+        ]
+    
+    def _cache_get(self, key: str) -> Optional[LLMEvaluationResult]:
+        """Return a copy of the cached evaluation for key, or None on a miss."""
+        if not self.use_cache:
+            return None
+        return self._memory_cache_get(key) or self._disk_cache_get(key)
+    
+    async def _cache_get_async(self, key: str) -> Optional[LLMEvaluationResult]:
+        """_cache_get() with the disk lookup moved off the event loop."""
+        if not self.use_cache:
+            return None
+        result = self._memory_cache_get(key)
+        if result is not None:
+            return result
+        return await asyncio.to_thread(self._disk_cache_get, key)
+    
+    @staticmethod
+    def _copy_result(result: LLMEvaluationResult) -> LLMEvaluationResult:
+        """Copy of result that shares no mutable state (lists included)."""
+        return replace(result, key_factors=list(result.key_factors), risks=list(result.risks))
+    
+    def _memory_cache_get(self, key: str) -> Optional[LLMEvaluationResult]:
+        """In-process cache lookup."""
+        result = self._memory_cache.get(key)
+        if result is not None:
+            return self._copy_result(result)  # Callers may mutate their copy
+        return None
+    
+    def _disk_cache_get(self, key: str) -> Optional[LLMEvaluationResult]:
+        """On-disk cache lookup (blocking); hits are kept in memory too."""
+        cache_file = LLM_CACHE_DIR / f"{key}.json"
+        try:
+            cache_age_hours = (time.time() - cache_file.stat().st_mtime) / 3600
+            if cache_age_hours <= LLM_CACHE_TTL_HOURS:
+                with open(cache_file, "rb") as f:
+                    result = LLMEvaluationResult(**orjson.loads(f.read()))
+                self._memory_cache.put(key, result, age_seconds=cache_age_hours * 3600)
+                self.logger.debug(f"LLM evaluation cache hit ({cache_age_hours:.1f}h old)")
+                return self._copy_result(result)
+            cache_file.unlink()  # Expired
+        except (OSError, ValueError, TypeError):
+            pass  # Missing, unreadable or outdated cache entry: evaluate fresh
+        
+        return None
+    
+    def _cache_put(self, key: str, result: LLMEvaluationResult) -> None:
+        """
+        Cache a successful evaluation.
+        
+        Results salvaged from non-JSON responses are not cached, so the next
+        call gets a chance at a clean answer.
+        """
+        if self._memory_cache_put(key, result):
+            self._disk_cache_put(key, result)
+    
+    async def _cache_put_async(self, key: str, result: LLMEvaluationResult) -> None:
+        """_cache_put() with the disk write moved off the event loop."""
+        if self._memory_cache_put(key, result):
+            await asyncio.to_thread(self._disk_cache_put, key, result)
+    
+    def _memory_cache_put(self, key: str, result: LLMEvaluationResult) -> bool:
+        """Keep a copy of result in memory; returns False if not cacheable."""
+        if not self.use_cache or result.gym_reasoning == EXTRACTED_REASONING:
+            return False
+        self._memory_cache.put(key, self._copy_result(result))  # Caller keeps its own
+        return True
+    
+    def _disk_cache_put(self, key: str, result: LLMEvaluationResult) -> None:
+        """Write result to the on-disk cache (blocking)."""
+        try:
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(LLM_CACHE_DIR / f"{key}.json", "wb") as f:
+                f.write(orjson.dumps(asdict(result)))
+        except OSError as e:
+            self.logger.warning(f"Could not write LLM evaluation cache: {e}")
+    
+    def clear_cache(self) -> None:
+        """Drop all cached evaluations (in-process and on disk)."""
+        self._memory_cache.clear()
+        for cache_file in LLM_CACHE_DIR.glob("*.json"):
+            cache_file.unlink(missing_ok=True)
+        self.logger.info("LLM evaluation cache cleared")
+    
+    def _build_request(
+        self,
+        bev: BusinessEnvironmentVector,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """Build chat completion arguments for a BEV."""
+        return {
+            "model": self.model,
+            "messages": _build_messages(bev),
+            "temperature": temperature,
+            "max_tokens": 1000,
+            "response_format": {"type": "json_object"},
+        }
+    
+    def _fallback_request(
+        self,
+        request: Dict[str, Any],
+        error: Exception
+    ) -> Dict[str, Any]:
+        """
+        Same request, retargeted at FALLBACK_MODEL with a smaller budget.
+        
+        Shared by every path that catches FALLBACK_ERRORS from the primary
+        model. Re-raises error when the evaluator already runs
+        FALLBACK_MODEL, since there is nothing smaller to fall back to.
+        """
+        if self.model == FALLBACK_MODEL:
+            raise error
+        self._log_fallback(error)
+        return {**request, "model": FALLBACK_MODEL, "max_tokens": FALLBACK_MAX_TOKENS}
+    
+    def _truncation_retry_request(
+        self,
+        request: Dict[str, Any],
+        response
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retry arguments if response was cut off at max_tokens, else None.
+        
+        Truncated JSON would only be salvaged by _extract_from_text(), so it
+        is retried once with TRUNCATION_RETRY_MAX_TOKENS at half the
+        temperature (more deterministic, usually more concise).
+        """
+        if response.choices[0].finish_reason != "length":
+            return None
+        
+        usage = response.usage
+        self.logger.warning(
+            f"LLM response truncated at max_tokens={request['max_tokens']}, "
+            f"retrying with {TRUNCATION_RETRY_MAX_TOKENS}",
+            extra={"extra_fields": {
+                "model": request["model"],
+                "max_tokens": request["max_tokens"],
+                "completion_tokens": usage.completion_tokens if usage else 0
+            }}
+        )
+        return {
+            **request,
+            "max_tokens": TRUNCATION_RETRY_MAX_TOKENS,
+            "temperature": request["temperature"] * 0.5,
+        }
+    
+    def _log_fallback(self, error: Exception) -> None:
+        """Log that the primary model failed and FALLBACK_MODEL is next."""
+        self.logger.warning(
+            f"{self.model} unavailable ({type(error).__name__}), retrying with {FALLBACK_MODEL}"
+        )
+    
+    def _handle_response(self, response, model: str) -> LLMEvaluationResult:
+        """Parse a chat completion from model into an LLMEvaluationResult."""
+        # Extract response
+        raw_response = response.choices[0].message.content
+        usage = response.usage
+        tokens_used = usage.total_tokens if usage else 0
+        
+        # Parse JSON response
+        result = self._parse_response(raw_response, tokens_used)
+        result.model_used = model  # Which tier served the response
+        
+        self.logger.info(
+            "LLM evaluation complete",
+            extra={"extra_fields": {
+                "gym_prob": result.gym_probability,
+                "cafe_prob": result.cafe_probability,
+                "model": model,
+                "tokens": tokens_used,
+                "prompt_tokens": usage.prompt_tokens if usage else 0,
+                "completion_tokens": usage.completion_tokens if usage else 0,
+                "cached_prompt_tokens": getattr(
+                    getattr(usage, "prompt_tokens_details", None), "cached_tokens", 0
+                ) or 0
+            }}
+        )
+        
+        return result
     
     def _parse_response(
         self,
@@ -221,7 +712,7 @@ class LLMEvaluator:
         """Parse LLM JSON response."""
         try:
             # Try to parse JSON
-            data = json.loads(raw_response)
+            data = orjson.loads(raw_response)
             
             return LLMEvaluationResult(
                 gym_probability=self._clamp_probability(data.get("gym_probability", 0.5)),
@@ -233,10 +724,10 @@ class LLMEvaluator:
                 recommendation=data.get("recommendation", "No recommendation"),
                 model_used=self.model,
                 tokens_used=tokens_used,
-                raw_response=raw_response
+                raw_response=raw_response if self.keep_raw else ""
             )
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.warning(f"JSON parse error: {e}")
             
             # Try to extract probabilities from text
@@ -252,8 +743,8 @@ class LLMEvaluator:
         cafe_prob = 0.5
         
         # Try to find probability patterns
-        gym_match = re.search(r'gym[_\s]?probability["\s:]+([0-9.]+)', text.lower())
-        cafe_match = re.search(r'cafe[_\s]?probability["\s:]+([0-9.]+)', text.lower())
+        gym_match = _GYM_RE.search(text)
+        cafe_match = _CAFE_RE.search(text)
         
         if gym_match:
             gym_prob = float(gym_match.group(1))
@@ -263,14 +754,14 @@ class LLMEvaluator:
         return LLMEvaluationResult(
             gym_probability=self._clamp_probability(gym_prob),
             cafe_probability=self._clamp_probability(cafe_prob),
-            gym_reasoning="Extracted from non-standard response",
-            cafe_reasoning="Extracted from non-standard response",
+            gym_reasoning=EXTRACTED_REASONING,
+            cafe_reasoning=EXTRACTED_REASONING,
             key_factors=[],
             risks=["Response parsing was imperfect"],
             recommendation="Please verify the analysis",
             model_used=self.model,
             tokens_used=tokens_used,
-            raw_response=text
+            raw_response=text if self.keep_raw else ""
         )
     
     def _get_fallback_result(self, error_msg: str) -> LLMEvaluationResult:
@@ -290,20 +781,15 @@ class LLMEvaluator:
     
     def _clamp_probability(self, value: float) -> float:
         """Ensure probability is in [0, 1] range."""
+        # Fast paths: JSON numbers are already float/int, skip the try frame
+        if isinstance(value, float) and 0.0 <= value <= 1.0:
+            return round(value, 3)
+        if isinstance(value, (int, float)):
+            return round(max(0.0, min(1.0, value)), 3)
         try:
             return round(max(0.0, min(1.0, float(value))), 3)
         except (ValueError, TypeError):
             return 0.5
-    
-    async def evaluate_async(
-        self,
-        bev: BusinessEnvironmentVector,
-        temperature: float = 0.3
-    ) -> LLMEvaluationResult:
-        """Async version of evaluate (for future use)."""
-        # For now, just call sync version
-        # Can be upgraded to async Groq client later
-        return self.evaluate(bev, temperature)
 
 
 # ============================================================================
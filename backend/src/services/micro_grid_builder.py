@@ -5,6 +5,7 @@ Generates high-resolution micro-grids (50-150 meters) for precise spatial analys
 
 Features:
 - Configurable cell size (default: 100 meters)
+- Columnar MicroGridTable output (MicroGrid objects built on demand)
 - Dynamic grid generation based on sector bounds
 - No overlap between cells
 - Grid ID format: {sector}-{row:03d}-{col:03d}
@@ -26,10 +27,12 @@ Usage:
 """
 
 import math
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+import numpy as np
+
 from src.utils.logger import get_logger
 
 
@@ -40,6 +43,11 @@ from src.utils.logger import get_logger
 # Earth's radius in meters (for coordinate calculations)
 EARTH_RADIUS_METERS = 6371000
 
+# Meters per degree: latitude (constant) and longitude at the equator
+# (scaled by cos(latitude) elsewhere)
+M_PER_DEG_LAT = 111111.0
+M_PER_DEG_LON_EQUATOR = 111320.0
+
 # Default configuration
 DEFAULT_CELL_SIZE_METERS = 100
 MIN_CELL_SIZE_METERS = 50
@@ -58,7 +66,7 @@ KARACHI_BOUNDS = {
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MicroGrid:
     """
     Represents a single micro-grid cell.
@@ -118,6 +126,116 @@ class MicroGrid:
         }
 
 
+class MicroGridTable:
+    """
+    A sector's micro-grids stored column-wise (struct-of-arrays).
+    
+    Holds one NumPy array per cell attribute instead of one MicroGrid
+    object per cell. Indexing or iterating materializes MicroGrid objects
+    on demand; to_db_records() streams database rows straight from the
+    columns. Coordinates are kept unrounded and rounded on output exactly
+    as MicroGrid fields are (7 decimals, area to 2).
+    
+    Attributes:
+        sector_id: Parent sector ID
+        neighborhood: Parent neighborhood ID
+        cell_size_m: Cell edge length in meters
+        created_at: Creation timestamp shared by all cells
+        row_index, col_index: Cell position arrays (int)
+        lat_north, lat_south, lon_east, lon_west: Bound arrays (float64)
+        lat_center, lon_center, area_m2: Derived arrays (float64)
+    """
+    
+    COLUMNS = (
+        "row_index", "col_index", "lat_center", "lon_center",
+        "lat_north", "lat_south", "lon_east", "lon_west", "area_m2",
+    )
+    
+    def __init__(
+        self,
+        sector_id: str,
+        neighborhood: str,
+        cell_size_m: int,
+        cells: Dict[str, np.ndarray],
+        created_at: str = None
+    ):
+        self.sector_id = sector_id
+        self.neighborhood = neighborhood
+        self.cell_size_m = cell_size_m
+        self.created_at = created_at or datetime.utcnow().isoformat()
+        for name in self.COLUMNS:
+            setattr(self, name, cells[name])
+        self.grid_id = np.array(
+            [
+                f"{sector_id}-{row:03d}-{col:03d}"
+                for row, col in zip(self.row_index.tolist(), self.col_index.tolist())
+            ],
+            dtype=object
+        )
+    
+    def __len__(self) -> int:
+        return len(self.grid_id)
+    
+    def __getitem__(self, i: int) -> MicroGrid:
+        if isinstance(i, slice):
+            raise TypeError("MicroGridTable does not support slicing; use list(table)[i]")
+        values = (getattr(self, name)[i].item() for name in self.COLUMNS)
+        return self._make_grid(self.grid_id[i], *values)
+    
+    def __iter__(self):
+        return (self._make_grid(*row) for row in self._columns())
+    
+    def _columns(self):
+        """Zip grid IDs with every column as plain Python values."""
+        return zip(self.grid_id, *(getattr(self, name).tolist() for name in self.COLUMNS))
+    
+    def _make_grid(self, grid_id, row, col, lat_center, lon_center,
+                   lat_north, lat_south, lon_east, lon_west, area_m2) -> MicroGrid:
+        # Positional, in MicroGrid field order (no kwargs dict per cell)
+        return MicroGrid(
+            grid_id,
+            self.sector_id,
+            self.neighborhood,
+            row,
+            col,
+            round(lat_center, 7),
+            round(lon_center, 7),
+            round(lat_north, 7),
+            round(lat_south, 7),
+            round(lon_east, 7),
+            round(lon_west, 7),
+            self.cell_size_m,
+            round(area_m2, 2),
+            self.created_at
+        )
+    
+    def to_db_records(self):
+        """
+        Yield database-compatible dicts (same keys as MicroGrid.to_db_dict()).
+        
+        Rows are zipped from the columns without building MicroGrid objects,
+        ready for a single executemany-style insert.
+        """
+        for (grid_id, row, col, lat_center, lon_center, lat_north, lat_south,
+                lon_east, lon_west, area_m2) in self._columns():
+            yield {
+                "grid_id": grid_id,
+                "parent_sector": self.sector_id,
+                "neighborhood": self.neighborhood,
+                "row_index": row,
+                "col_index": col,
+                "lat_center": round(lat_center, 7),
+                "lon_center": round(lon_center, 7),
+                "lat_north": round(lat_north, 7),
+                "lat_south": round(lat_south, 7),
+                "lon_east": round(lon_east, 7),
+                "lon_west": round(lon_west, 7),
+                "cell_size_m": self.cell_size_m,
+                "area_m2": round(area_m2, 2),
+                "created_at": self.created_at
+            }
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -134,10 +252,13 @@ def meters_to_lat_degrees(meters: float) -> float:
     Returns:
         Distance in latitude degrees
     """
-    return meters / 111111.0
+    return meters / M_PER_DEG_LAT
 
 
-def meters_to_lon_degrees(meters: float, latitude: float) -> float:
+def meters_to_lon_degrees(
+    meters: Union[float, np.ndarray],
+    latitude: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Convert meters to longitude degrees at a given latitude.
     
@@ -145,43 +266,116 @@ def meters_to_lon_degrees(meters: float, latitude: float) -> float:
     - At equator: ~111,321 meters
     - At 25° latitude (Karachi): ~100,900 meters
     
+    Accepts scalars or NumPy arrays (element-wise).
+    
     Args:
         meters: Distance in meters
         latitude: Reference latitude (affects conversion)
         
     Returns:
-        Distance in longitude degrees
+        Distance in longitude degrees (a plain float for scalar inputs)
     """
     # Longitude degrees shrink as latitude increases
-    lat_radians = math.radians(latitude)
-    meters_per_degree = 111320 * math.cos(lat_radians)
-    return meters / meters_per_degree
+    meters_per_degree = M_PER_DEG_LON_EQUATOR * np.cos(np.radians(latitude))
+    return _as_float_if_scalar(meters / meters_per_degree)
 
 
-def calculate_grid_area(lat_north: float, lat_south: float, 
-                        lon_east: float, lon_west: float) -> float:
+def calculate_grid_area(
+    lat_north: Union[float, np.ndarray],
+    lat_south: Union[float, np.ndarray],
+    lon_east: Union[float, np.ndarray],
+    lon_west: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate area of a grid cell in square meters.
     
     Uses Haversine-based approximation suitable for small areas.
+    Accepts scalars or NumPy arrays (element-wise, broadcasting).
     
     Args:
         lat_north, lat_south: Latitude bounds
         lon_east, lon_west: Longitude bounds
         
     Returns:
-        Area in square meters
+        Area in square meters (a plain float for scalar inputs)
     """
     # Calculate height in meters
     lat_diff = lat_north - lat_south
-    height_m = lat_diff * 111111
+    height_m = lat_diff * M_PER_DEG_LAT
     
     # Calculate width at center latitude
     center_lat = (lat_north + lat_south) / 2
     lon_diff = lon_east - lon_west
-    width_m = lon_diff * 111320 * math.cos(math.radians(center_lat))
+    width_m = lon_diff * M_PER_DEG_LON_EQUATOR * np.cos(np.radians(center_lat))
+    
+    return _as_float_if_scalar(np.abs(height_m * width_m))
+
+
+def _as_float_if_scalar(value):
+    """
+    Unwrap 0-d NumPy results to a plain float.
+    
+    Scalar inputs otherwise come back as numpy.float64, which orjson (the
+    API's response serializer) rejects.
+    """
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def build_grid_vectorized(
+    bounds: Dict[str, float],
+    cell_size_meters: int
+) -> Dict[str, np.ndarray]:
+    """
+    Compute every cell of a sector grid as flat NumPy columns.
+    
+    Same layout as MicroGridBuilder.generate_grids_for_sector(): rows
+    step north from lat_south, columns step east from lon_west, and the
+    last row/column may overhang the bounds by up to 10% of a step.
+    Cells are in row-major order (row, then col).
+    
+    Args:
+        bounds: Dictionary with lat_north, lat_south, lon_east, lon_west
+        cell_size_meters: Cell edge length in meters
+        
+    Returns:
+        Dict of equal-length arrays: row_index, col_index, lat_north,
+        lat_south, lon_east, lon_west, lat_center, lon_center, area_m2
+    """
+    lat_span = bounds["lat_north"] - bounds["lat_south"]
+    lon_span = bounds["lon_east"] - bounds["lon_west"]
+    
+    # Convert cell size to degrees once per sector (longitude step at the
+    # sector's center); no per-cell conversions
+    center_lat = (bounds["lat_north"] + bounds["lat_south"]) / 2
+    lat_step = cell_size_meters / M_PER_DEG_LAT
+    lon_step = cell_size_meters / (M_PER_DEG_LON_EQUATOR * math.cos(math.radians(center_lat)))
+    
+    num_rows = max(1, math.ceil(lat_span / lat_step))
+    num_cols = max(1, math.ceil(lon_span / lon_step))
+    
+    # Per-row and per-column edges, clamped to a slight overhang
+    row_south = bounds["lat_south"] + np.arange(num_rows) * lat_step
+    row_north = np.minimum(row_south + lat_step, bounds["lat_north"] + lat_step * 0.1)
+    col_west = bounds["lon_west"] + np.arange(num_cols) * lon_step
+    col_east = np.minimum(col_west + lon_step, bounds["lon_east"] + lon_step * 0.1)
     
-    return abs(height_m * width_m)
+    rows, cols = np.divmod(np.arange(num_rows * num_cols), num_cols)
+    lat_south = row_south[rows]
+    lat_north = row_north[rows]
+    lon_west = col_west[cols]
+    lon_east = col_east[cols]
+    
+    return {
+        "row_index": rows,
+        "col_index": cols,
+        "lat_north": lat_north,
+        "lat_south": lat_south,
+        "lon_east": lon_east,
+        "lon_west": lon_west,
+        "lat_center": (lat_north + lat_south) / 2,
+        "lon_center": (lon_east + lon_west) / 2,
+        "area_m2": calculate_grid_area(lat_north, lat_south, lon_east, lon_west),
+    }
 
 
 # ============================================================================
@@ -246,25 +440,10 @@ class MicroGridBuilder:
         Raises:
             ValueError: If bounds are invalid
         """
-        # Validate bounds
-        self._validate_bounds(bounds)
-        
-        # Extract neighborhood from sector_id if not provided
-        if neighborhood is None:
-            neighborhood = sector_id.split("-")[0] if "-" in sector_id else sector_id
-        
-        # Calculate grid dimensions
-        lat_span = bounds["lat_north"] - bounds["lat_south"]
-        lon_span = bounds["lon_east"] - bounds["lon_west"]
-        
-        # Convert cell size to degrees
-        center_lat = (bounds["lat_north"] + bounds["lat_south"]) / 2
-        lat_step = meters_to_lat_degrees(self.cell_size_meters)
-        lon_step = meters_to_lon_degrees(self.cell_size_meters, center_lat)
-        
-        # Calculate number of rows and columns
-        num_rows = max(1, math.ceil(lat_span / lat_step))
-        num_cols = max(1, math.ceil(lon_span / lon_step))
+        # Compute all cells as columns, then emit dataclasses
+        table = self.generate_table(sector_id, bounds, neighborhood)
+        num_rows = int(table.row_index[-1]) + 1
+        num_cols = int(table.col_index[-1]) + 1
         
         self.logger.info(
             f"Generating micro-grids for {sector_id}",
@@ -276,49 +455,7 @@ class MicroGridBuilder:
             }}
         )
         
-        # Generate grids
-        grids = []
-        timestamp = datetime.utcnow().isoformat()
-        
-        for row in range(num_rows):
-            for col in range(num_cols):
-                # Calculate cell bounds
-                lat_south = bounds["lat_south"] + row * lat_step
-                lat_north = lat_south + lat_step
-                lon_west = bounds["lon_west"] + col * lon_step
-                lon_east = lon_west + lon_step
-                
-                # Clamp to sector bounds (optional, can extend slightly)
-                lat_north = min(lat_north, bounds["lat_north"] + lat_step * 0.1)
-                lon_east = min(lon_east, bounds["lon_east"] + lon_step * 0.1)
-                
-                # Calculate center
-                lat_center = (lat_north + lat_south) / 2
-                lon_center = (lon_east + lon_west) / 2
-                
-                # Calculate area
-                area_m2 = calculate_grid_area(lat_north, lat_south, lon_east, lon_west)
-                
-                # Create grid ID
-                grid_id = f"{sector_id}-{row:03d}-{col:03d}"
-                
-                grid = MicroGrid(
-                    grid_id=grid_id,
-                    sector_id=sector_id,
-                    neighborhood=neighborhood,
-                    row_index=row,
-                    col_index=col,
-                    lat_center=round(lat_center, 7),
-                    lon_center=round(lon_center, 7),
-                    lat_north=round(lat_north, 7),
-                    lat_south=round(lat_south, 7),
-                    lon_east=round(lon_east, 7),
-                    lon_west=round(lon_west, 7),
-                    cell_size_m=self.cell_size_meters,
-                    area_m2=round(area_m2, 2),
-                    created_at=timestamp
-                )
-                grids.append(grid)
+        grids = list(table)
         
         self.logger.info(
             f"Generated {len(grids)} micro-grids for {sector_id}",
@@ -327,6 +464,81 @@ class MicroGridBuilder:
         
         return grids
     
+    def iter_grids_for_sector(
+        self,
+        sector_id: str,
+        bounds: Dict[str, float],
+        neighborhood: str = None
+    ) -> Iterator[MicroGrid]:
+        """
+        Yield a sector's micro-grids one at a time.
+        
+        Same cells, in the same order, as generate_grids_for_sector(), but
+        each MicroGrid is built only when consumed, so streaming writers never
+        hold the full object list (only the table's float columns).
+        
+        Args:
+            sector_id: Sector identifier (e.g., "Clifton-Block2")
+            bounds: Dictionary with lat_north, lat_south, lon_east, lon_west
+            neighborhood: Parent neighborhood ID (extracted from sector_id if None)
+            
+        Returns:
+            Iterator of MicroGrid objects
+            
+        Raises:
+            ValueError: If bounds are invalid (raised on call, not on first next())
+        """
+        return iter(self.generate_table(sector_id, bounds, neighborhood))
+    
+    def generate_arrays(self, bounds: Dict[str, float]) -> Dict[str, np.ndarray]:
+        """
+        Generate a sector's cells as columns (struct-of-arrays).
+        
+        Same cells as generate_grids_for_sector(), as bare columns without
+        IDs or metadata (see generate_table() for those).
+        
+        Args:
+            bounds: Dictionary with lat_north, lat_south, lon_east, lon_west
+            
+        Returns:
+            Dict of equal-length arrays (see build_grid_vectorized())
+            
+        Raises:
+            ValueError: If bounds are invalid
+        """
+        self._validate_bounds(bounds)
+        return build_grid_vectorized(bounds, self.cell_size_meters)
+    
+    def generate_table(
+        self,
+        sector_id: str,
+        bounds: Dict[str, float],
+        neighborhood: str = None
+    ) -> MicroGridTable:
+        """
+        Generate a sector's micro-grids as a columnar MicroGridTable.
+        
+        Same cells as generate_grids_for_sector(), without allocating a
+        MicroGrid per cell up front.
+        
+        Args:
+            sector_id: Sector identifier (e.g., "Clifton-Block2")
+            bounds: Dictionary with lat_north, lat_south, lon_east, lon_west
+            neighborhood: Parent neighborhood ID (extracted from sector_id if None)
+            
+        Returns:
+            MicroGridTable for the sector
+            
+        Raises:
+            ValueError: If bounds are invalid
+        """
+        # Extract neighborhood from sector_id if not provided
+        if neighborhood is None:
+            neighborhood = sector_id.split("-")[0] if "-" in sector_id else sector_id
+        
+        cells = self.generate_arrays(bounds)
+        return MicroGridTable(sector_id, neighborhood, self.cell_size_meters, cells)
+    
     def generate_grids_for_neighborhood(
         self,
         neighborhood_config: Dict
@@ -340,6 +552,25 @@ class MicroGridBuilder:
         Returns:
             Dictionary mapping sector_id to list of MicroGrid objects
         """
+        tables = self.generate_tables_for_neighborhood(neighborhood_config)
+        return {sector_id: list(table) for sector_id, table in tables.items()}
+    
+    def generate_tables_for_neighborhood(
+        self,
+        neighborhood_config: Dict
+    ) -> Dict[str, MicroGridTable]:
+        """
+        Generate all sectors of a neighborhood as columnar MicroGridTables.
+        
+        Same sectors and cells as generate_grids_for_neighborhood(), without
+        building a MicroGrid object per cell (the dominant cost per sector).
+        
+        Args:
+            neighborhood_config: Neighborhood configuration with sectors
+            
+        Returns:
+            Dictionary mapping sector_id to MicroGridTable
+        """
         neighborhood_id = neighborhood_config.get("id", "Unknown")
         sectors = neighborhood_config.get("sectors", [])
         
@@ -358,13 +589,13 @@ class MicroGridBuilder:
                 self.logger.warning(f"Skipping sector with missing id or bounds: {sector}")
                 continue
             
-            grids = self.generate_grids_for_sector(
+            table = self.generate_table(
                 sector_id=sector_id,
                 bounds=bounds,
                 neighborhood=neighborhood_id
             )
-            result[sector_id] = grids
-            total_grids += len(grids)
+            result[sector_id] = table
+            total_grids += len(table)
         
         self.logger.info(
             f"Generated micro-grids for {neighborhood_id}",
@@ -381,7 +612,9 @@ class MicroGridBuilder:
         Validate that grids don't overlap.
         
         Since we generate grids with fixed step sizes and no random placement,
-        overlaps should not occur. This method is for verification.
+        overlaps should not occur. This method is for verification, so it
+        makes no lattice assumptions: cells are binned by center into a
+        uniform hash and only cells in neighboring bins are compared.
         
         Args:
             grids: List of MicroGrid objects
@@ -389,20 +622,43 @@ class MicroGridBuilder:
         Returns:
             True if no overlaps, False otherwise
         """
-        from shapely.geometry import box
+        if len(grids) < 2:
+            return True
         
-        for i, grid1 in enumerate(grids):
-            poly1 = box(grid1.lon_west, grid1.lat_south, grid1.lon_east, grid1.lat_north)
-            
-            for grid2 in grids[i+1:]:
-                poly2 = box(grid2.lon_west, grid2.lat_south, grid2.lon_east, grid2.lat_north)
-                
-                # Check for overlap (intersection area > 0)
-                if poly1.intersects(poly2):
-                    intersection = poly1.intersection(poly2)
-                    if intersection.area > 1e-12:  # Small tolerance for floating point
+        bounds = np.array(
+            [(g.lat_south, g.lat_north, g.lon_west, g.lon_east) for g in grids],
+            dtype=np.float64
+        )
+        bin_lat = float((bounds[:, 1] - bounds[:, 0]).max())
+        bin_lon = float((bounds[:, 3] - bounds[:, 2]).max())
+        if bin_lat <= 0 or bin_lon <= 0:
+            return True  # Every cell is degenerate: nothing has area to overlap
+        
+        # Broad phase: bin cell centers on a uniform grid as large as the
+        # largest cell, so overlapping cells always land in neighboring bins
+        rows = np.floor((bounds[:, 0] + bounds[:, 1]) * 0.5 / bin_lat).astype(np.int64)
+        cols = np.floor((bounds[:, 2] + bounds[:, 3]) * 0.5 / bin_lon).astype(np.int64)
+        bins: Dict[Tuple[int, int], List[int]] = {}
+        for i, key in enumerate(zip(rows.tolist(), cols.tolist())):
+            bins.setdefault(key, []).append(i)
+        
+        # Narrow phase: exact rectangle intersection area per candidate pair
+        cells = bounds.tolist()
+        for i, (row, col) in enumerate(zip(rows.tolist(), cols.tolist())):
+            south1, north1, west1, east1 = cells[i]
+            for neighbor in (
+                (row + dr, col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+            ):
+                for j in bins.get(neighbor, ()):
+                    if j <= i:
+                        continue
+                    south2, north2, west2, east2 = cells[j]
+                    overlap_lat = min(north1, north2) - max(south1, south2)
+                    overlap_lon = min(east1, east2) - max(west1, west2)
+                    # Small tolerance for floating point
+                    if overlap_lat > 0 and overlap_lon > 0 and overlap_lat * overlap_lon > 1e-12:
                         self.logger.warning(
-                            f"Overlap detected between {grid1.grid_id} and {grid2.grid_id}"
+                            f"Overlap detected between {grids[i].grid_id} and {grids[j].grid_id}"
                         )
                         return False
         
@@ -410,27 +666,31 @@ class MicroGridBuilder:
     
     def calculate_coverage(
         self,
-        grids: List[MicroGrid],
+        grids: Union[List[MicroGrid], MicroGridTable],
         bounds: Dict[str, float]
     ) -> float:
         """
         Calculate what percentage of bounds is covered by grids.
         
         Args:
-            grids: List of MicroGrid objects
+            grids: List of MicroGrid objects or a MicroGridTable (summed
+                from its unrounded area column)
             bounds: Sector bounds dictionary
             
         Returns:
             Coverage percentage (0-100)
         """
         # Calculate total sector area
-        sector_area = calculate_grid_area(
+        sector_area = float(calculate_grid_area(
             bounds["lat_north"], bounds["lat_south"],
             bounds["lon_east"], bounds["lon_west"]
-        )
+        ))
         
         # Calculate total grid area (sum of all cells)
-        grid_area = sum(g.area_m2 for g in grids)
+        if isinstance(grids, MicroGridTable):
+            grid_area = float(grids.area_m2.sum())
+        else:
+            grid_area = sum(g.area_m2 for g in grids)
         
         coverage = (grid_area / sector_area) * 100 if sector_area > 0 else 0
         return round(coverage, 2)
@@ -467,33 +727,67 @@ class MicroGridBuilder:
         if not (KARACHI_BOUNDS["lon_min"] <= center_lon <= KARACHI_BOUNDS["lon_max"]):
             self.logger.warning(f"Longitude {center_lon} may be outside Karachi bounds")
     
-    def get_grid_summary(self, grids: List[MicroGrid]) -> Dict:
+    def get_grid_summary(self, grids: Union[List[MicroGrid], MicroGridTable]) -> Dict:
         """
         Get summary statistics for a list of grids.
         
+        A MicroGridTable is summarized with NumPy reductions over its
+        columns; its areas are unrounded, so totals may differ from the
+        list form in the last decimal places.
+        
         Args:
-            grids: List of MicroGrid objects
+            grids: List of MicroGrid objects or a MicroGridTable
             
         Returns:
             Dictionary with summary statistics
         """
-        if not grids:
+        if not len(grids):
             return {"total_grids": 0}
         
-        areas = [g.area_m2 for g in grids]
-        sectors = set(g.sector_id for g in grids)
+        if isinstance(grids, MicroGridTable):
+            total_area = float(grids.area_m2.sum())
+            return {
+                "total_grids": len(grids),
+                "sectors": [grids.sector_id],
+                "total_area_m2": total_area,
+                "total_area_km2": round(total_area / 1_000_000, 4),
+                "avg_area_m2": round(total_area / len(grids), 2),
+                "cell_size_m": grids.cell_size_m,
+                "min_row": int(grids.row_index.min()),
+                "max_row": int(grids.row_index.max()),
+                "min_col": int(grids.col_index.min()),
+                "max_col": int(grids.col_index.max())
+            }
+        
+        # Single pass over the objects for every statistic
+        total_area = 0
+        sectors = set()
+        min_row = max_row = grids[0].row_index
+        min_col = max_col = grids[0].col_index
+        for g in grids:
+            total_area += g.area_m2
+            sectors.add(g.sector_id)
+            row, col = g.row_index, g.col_index
+            if row < min_row:
+                min_row = row
+            elif row > max_row:
+                max_row = row
+            if col < min_col:
+                min_col = col
+            elif col > max_col:
+                max_col = col
         
         return {
             "total_grids": len(grids),
             "sectors": list(sectors),
-            "total_area_m2": sum(areas),
-            "total_area_km2": round(sum(areas) / 1_000_000, 4),
-            "avg_area_m2": round(sum(areas) / len(areas), 2),
+            "total_area_m2": total_area,
+            "total_area_km2": round(total_area / 1_000_000, 4),
+            "avg_area_m2": round(total_area / len(grids), 2),
             "cell_size_m": grids[0].cell_size_m,
-            "min_row": min(g.row_index for g in grids),
-            "max_row": max(g.row_index for g in grids),
-            "min_col": min(g.col_index for g in grids),
-            "max_col": max(g.col_index for g in grids)
+            "min_row": min_row,
+            "max_row": max_row,
+            "min_col": min_col,
+            "max_col": max_col
         }
 
 
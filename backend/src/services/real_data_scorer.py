@@ -25,10 +25,12 @@ Usage:
 """
 
 import math
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+import numpy as np
+
 from src.utils.logger import get_logger
 
 
@@ -63,11 +65,169 @@ MIN_SCORE = 0.0
 MAX_SCORE = 1.0
 
 
+# ============================================================================
+# Scoring Kernels
+# ============================================================================
+
+def _competition_strength(
+    avg_rating: Optional[float],
+    total_reviews: int,
+    inv_log_denom: float
+) -> float:
+    """
+    Competition strength (0-1) from plain scalars, unrounded.
+    
+    Numeric core of RealDataScorer._calculate_competition_strength(); see
+    that method for the formula. Takes no dicts so per-grid callers can
+    hoist config lookups out of their loops; inv_log_denom is
+    1 / log10(1 + review_threshold * 10) (see _category_constants()).
+    """
+    if avg_rating is None:
+        avg_rating = 3.0  # Assume average if unknown
+    
+    # 5.0 rating = 1.0 strength, 1.0 rating = 0.0 strength
+    rating_strength = max(0.0, min(1.0, (avg_rating - 1.0) / 4.0))
+    
+    # Log scale so very high review counts don't dominate
+    # 0 reviews = 0.0, 100 reviews = ~0.5, 1000 reviews = ~0.75
+    if total_reviews > 0:
+        review_strength = min(
+            1.0, math.log10(1 + total_reviews) * inv_log_denom
+        )
+    else:
+        review_strength = 0.0
+    
+    # Weight rating slightly more than reviews
+    return rating_strength * 0.6 + review_strength * 0.4
+
+
+def _opportunity_score(
+    business_count: int,
+    max_business_count: int,
+    competition_strength: float,
+    density_weight: float,
+    competition_weight: float,
+    weight_boost: float
+) -> float:
+    """
+    Opportunity score (0-1) from plain scalars.
+    
+    Numeric core of RealDataScorer.calculate_opportunity_score(); see that
+    method for the formula.
+    """
+    if business_count == 0:
+        return MAX_SCORE  # No competitors = high opportunity
+    
+    if max_business_count == 0:
+        max_business_count = 1
+    
+    density_inverse = 1.0 - business_count / max_business_count
+    score = (
+        density_inverse * density_weight +
+        (1.0 - competition_strength) * competition_weight
+    ) * weight_boost
+    
+    return round(max(MIN_SCORE, min(MAX_SCORE, score)), 4)
+
+
+def _aggregate_businesses(businesses: List[Dict]) -> Tuple[Optional[float], int]:
+    """
+    Average rating (None if unrated) and total reviews in one pass.
+    
+    Unrated businesses are excluded from the average; a missing or None
+    total_ratings counts as 0.
+    """
+    rating_sum = 0.0
+    rating_n = 0
+    review_sum = 0
+    for b in businesses:
+        rating = b.get("rating")
+        if rating is not None:
+            rating_sum += rating
+            rating_n += 1
+        review_sum += b.get("total_ratings", 0) or 0
+    
+    return (rating_sum / rating_n if rating_n else None), review_sum
+
+
+def _round4(values: np.ndarray) -> np.ndarray:
+    """
+    round(x, 4) per element.
+    
+    np.round() scales by 10**4 first and can land one unit off Python's
+    correctly rounded result; the vector path must match the scalar one.
+    """
+    return np.array([round(x, 4) for x in values.tolist()], dtype=np.float64)
+
+
+def _competition_strengths(
+    avg_ratings: np.ndarray,
+    total_reviews: np.ndarray,
+    inv_log_denom: float
+) -> np.ndarray:
+    """Vectorized _competition_strength() (avg_ratings already defaulted to 3.0)."""
+    rating_strength = np.clip((avg_ratings - 1.0) / 4.0, 0.0, 1.0)
+    review_strength = np.where(
+        total_reviews > 0,
+        np.minimum(1.0, np.log10(1 + total_reviews) * inv_log_denom),
+        0.0
+    )
+    return rating_strength * 0.6 + review_strength * 0.4
+
+
+def _opportunity_scores(
+    business_counts: np.ndarray,
+    max_business_count: int,
+    competition_strengths: np.ndarray,
+    density_weight: float,
+    competition_weight: float,
+    weight_boost: float
+) -> np.ndarray:
+    """Vectorized _opportunity_score()."""
+    density_inverse = 1.0 - business_counts / (max_business_count or 1)
+    scores = (
+        density_inverse * density_weight +
+        (1.0 - competition_strengths) * competition_weight
+    ) * weight_boost
+    scores = _round4(np.clip(scores, MIN_SCORE, MAX_SCORE))
+    return np.where(business_counts == 0, MAX_SCORE, scores)
+
+
+class _CategoryConstants(NamedTuple):
+    """
+    A category's precomputed scoring scalars.
+    
+    Attributes:
+        inv_log_denom: 1 / log10(1 + ideal_review_threshold * 10)
+        weight_boost: Category score multiplier
+    """
+    inv_log_denom: float
+    weight_boost: float
+
+
+def _category_constants(category: str, config: Dict) -> _CategoryConstants:
+    """
+    Precompute a category's scoring scalars.
+    
+    Raises:
+        ValueError: If ideal_review_threshold is not positive
+    """
+    review_threshold = config.get("ideal_review_threshold", 100)
+    if not review_threshold > 0:
+        raise ValueError(
+            f"ideal_review_threshold for {category} must be positive, got {review_threshold}"
+        )
+    return _CategoryConstants(
+        inv_log_denom=1.0 / math.log10(1 + review_threshold * 10),
+        weight_boost=config.get("weight_boost", 1.0),
+    )
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GridScoreResult:
     """
     Result of scoring a grid cell.
@@ -134,9 +294,18 @@ class RealDataScorer:
         Args:
             weights: Custom scoring weights (optional)
             category_config: Custom category configuration (optional)
+            
+        Raises:
+            ValueError: If a category's ideal_review_threshold is not positive
         """
         self.weights = weights or WEIGHTS.copy()
         self.category_config = category_config or CATEGORY_CONFIG.copy()
+        # Per-category scalars, computed once (unknown categories use Gym's)
+        self._cat_cache = {
+            category: _category_constants(category, config)
+            for category, config in self.category_config.items()
+        }
+        self._default_constants = _category_constants("Gym", CATEGORY_CONFIG["Gym"])
         self.logger = get_logger(__name__)
         
         self.logger.info(
@@ -177,52 +346,26 @@ class RealDataScorer:
         Returns:
             Opportunity score between 0 and 1
         """
-        # Get category config
-        config = self.category_config.get(category, CATEGORY_CONFIG["Gym"])
-        
-        # Handle edge case: no competitors = high opportunity
+        # No competitors = high opportunity (competition strength is moot)
         if business_count == 0:
             return MAX_SCORE
         
-        # Handle edge case: max is 0 (shouldn't happen)
-        if max_business_count == 0:
-            max_business_count = 1
-        
-        # 1. Calculate density inverse score
-        # Higher when fewer competitors
-        density_ratio = business_count / max_business_count
-        density_inverse = 1.0 - density_ratio
-        
-        # 2. Calculate competition strength
-        # Strong competition = high ratings + many reviews
-        competition_strength = self._calculate_competition_strength(
-            avg_rating=avg_rating,
-            total_reviews=total_reviews,
-            config=config
-        )
-        
-        # 3. Invert competition strength (weaker competition = better opportunity)
-        competition_weakness = 1.0 - competition_strength
-        
-        # 4. Combine with weights
-        score = (
-            density_inverse * self.weights["density_inverse"] +
-            competition_weakness * self.weights["competition_weakness"]
+        constants = self._constants(category)
+        competition_strength = _competition_strength(avg_rating, total_reviews, constants.inv_log_denom)
+        return _opportunity_score(
+            business_count,
+            max_business_count,
+            competition_strength,
+            self.weights["density_inverse"],
+            self.weights["competition_weakness"],
+            constants.weight_boost
         )
-        
-        # 5. Apply category boost if any
-        score *= config.get("weight_boost", 1.0)
-        
-        # 6. Clamp to valid range
-        score = max(MIN_SCORE, min(MAX_SCORE, score))
-        
-        return round(score, 4)
     
     def _calculate_competition_strength(
         self,
         avg_rating: Optional[float],
         total_reviews: int,
-        config: Dict
+        constants: _CategoryConstants
     ) -> float:
         """
         Calculate competition strength from ratings and reviews.
@@ -238,43 +381,24 @@ class RealDataScorer:
         Args:
             avg_rating: Average competitor rating
             total_reviews: Total reviews across competitors
-            config: Category configuration
+            constants: Category constants from _constants()
             
         Returns:
-            Competition strength between 0 and 1
+            Competition strength between 0 and 1 (unrounded)
         """
-        # Handle missing rating
-        if avg_rating is None:
-            avg_rating = 3.0  # Assume average if unknown
-        
-        # Normalize rating (0-1 scale)
-        # 5.0 rating = 1.0 strength, 1.0 rating = 0.0 strength
-        rating_strength = (avg_rating - 1.0) / 4.0
-        rating_strength = max(0.0, min(1.0, rating_strength))
-        
-        # Normalize reviews using logarithmic scale
-        # This prevents very high review counts from dominating
-        # 0 reviews = 0.0, 100 reviews = ~0.5, 1000 reviews = ~0.75
-        review_threshold = config.get("ideal_review_threshold", 100)
-        if total_reviews > 0:
-            # Log scale with threshold
-            review_strength = math.log10(1 + total_reviews) / math.log10(1 + review_threshold * 10)
-            review_strength = min(1.0, review_strength)
-        else:
-            review_strength = 0.0
-        
-        # Combine rating and review strength
-        # Weight rating slightly more than reviews
-        strength = (rating_strength * 0.6) + (review_strength * 0.4)
-        
-        return round(strength, 4)
+        return _competition_strength(avg_rating, total_reviews, constants.inv_log_denom)
+    
+    def _constants(self, category: str) -> _CategoryConstants:
+        """Precomputed scoring scalars for category (Gym's if unknown)."""
+        return self._cat_cache.get(category, self._default_constants)
     
     def score_grid(
         self,
         grid_id: str,
         businesses: List[Dict],
         category: str,
-        max_business_count: int
+        max_business_count: int,
+        calculated_at: str = ""
     ) -> GridScoreResult:
         """
         Score a grid cell based on its businesses.
@@ -284,35 +408,29 @@ class RealDataScorer:
             businesses: List of business dictionaries with rating and total_ratings
             category: Business category
             max_business_count: Maximum count for normalization
+            calculated_at: Timestamp to stamp the result with (now if empty)
             
         Returns:
             GridScoreResult with detailed scoring breakdown
         """
         # Calculate aggregate metrics
         business_count = len(businesses)
-        
-        if business_count > 0:
-            ratings = [b.get("rating") for b in businesses if b.get("rating") is not None]
-            avg_rating = sum(ratings) / len(ratings) if ratings else None
-            total_reviews = sum(b.get("total_ratings", 0) for b in businesses)
-        else:
-            avg_rating = None
-            total_reviews = 0
-        
-        # Calculate score
-        opportunity_score = self.calculate_opportunity_score(
-            business_count=business_count,
-            avg_rating=avg_rating,
-            total_reviews=total_reviews,
-            max_business_count=max_business_count,
-            category=category
+        avg_rating, total_reviews = _aggregate_businesses(businesses)
+        
+        # Competition strength feeds both the score and its breakdown
+        constants = self._constants(category)
+        competition_strength = _competition_strength(avg_rating, total_reviews, constants.inv_log_denom)
+        opportunity_score = _opportunity_score(
+            business_count,
+            max_business_count,
+            competition_strength,
+            self.weights["density_inverse"],
+            self.weights["competition_weakness"],
+            constants.weight_boost
         )
         
         # Calculate component scores for transparency
-        config = self.category_config.get(category, CATEGORY_CONFIG["Gym"])
-        
         density_score = 1.0 - (business_count / max_business_count) if max_business_count > 0 else 1.0
-        competition_strength = self._calculate_competition_strength(avg_rating, total_reviews, config)
         competition_score = 1.0 - competition_strength
         
         return GridScoreResult(
@@ -324,7 +442,8 @@ class RealDataScorer:
             business_count=business_count,
             avg_rating=round(avg_rating, 2) if avg_rating else None,
             total_reviews=total_reviews,
-            scoring_mode="real_data"
+            scoring_mode="real_data",
+            calculated_at=calculated_at
         )
     
     def score_all_grids(
@@ -351,15 +470,54 @@ class RealDataScorer:
         if max_count == 0:
             max_count = 1  # Avoid division by zero
         
-        results = []
-        for grid_id, businesses in grid_businesses.items():
-            result = self.score_grid(
+        # Per-grid aggregates (one Python pass), then the formula as array ops
+        counts = []
+        avg_ratings = []
+        total_reviews = []
+        for businesses in grid_businesses.values():
+            avg_rating, reviews = _aggregate_businesses(businesses)
+            counts.append(len(businesses))
+            avg_ratings.append(avg_rating)
+            total_reviews.append(reviews)
+        
+        constants = self._constants(category)
+        counts_np = np.array(counts, dtype=np.int64)
+        strengths = _competition_strengths(
+            np.array([3.0 if r is None else r for r in avg_ratings], dtype=np.float64),
+            np.array(total_reviews, dtype=np.int64),
+            constants.inv_log_denom
+        )
+        scores = _opportunity_scores(
+            counts_np,
+            max_count,
+            strengths,
+            self.weights["density_inverse"],
+            self.weights["competition_weakness"],
+            constants.weight_boost
+        )
+        density_scores = _round4(1.0 - counts_np / max_count)
+        competition_scores = _round4(1.0 - strengths)
+        
+        calculated_at = datetime.utcnow().isoformat()  # One timestamp per run
+        results = [
+            GridScoreResult(
                 grid_id=grid_id,
-                businesses=businesses,
                 category=category,
-                max_business_count=max_count
+                opportunity_score=score,
+                density_score=density_score,
+                competition_score=competition_score,
+                business_count=business_count,
+                avg_rating=round(avg_rating, 2) if avg_rating else None,
+                total_reviews=reviews,
+                scoring_mode="real_data",
+                calculated_at=calculated_at
+            )
+            for grid_id, score, density_score, competition_score, business_count, avg_rating, reviews
+            in zip(
+                grid_businesses, scores.tolist(), density_scores.tolist(),
+                competition_scores.tolist(), counts, avg_ratings, total_reviews
             )
-            results.append(result)
+        ]
         
         # Sort by opportunity score (highest first)
         results.sort(key=lambda r: r.opportunity_score, reverse=True)
@@ -21,11 +21,14 @@ Usage:
 import os
 import json
 import time
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+import asyncio
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from src.services.bev_generator import BEVGenerator, BusinessEnvironmentVector
 from src.services.rule_engine import RuleEngine, RuleEvaluationResult
 from src.services.llm_evaluator import LLMEvaluator, LLMEvaluationResult
@@ -40,6 +43,9 @@ from src.utils.logger import get_logger
 # Default search radius for BEV generation
 DEFAULT_RADIUS_METERS = 500
 
+# Max locations in flight at once in arecommend_batch (Places + Groq rate limits)
+PIPELINE_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "8"))
+
 # Pipeline modes
 class PipelineMode:
     FULL = "full"           # BEV + Rule + LLM
@@ -155,6 +161,10 @@ class RecommendationPipeline:
         self.llm_evaluator = None  # Lazy initialization
         self.score_combiner = ScoreCombiner(rule_weight, llm_weight)
         
+        # BEVs being generated by arecommend, keyed by (lat, lon, radius), so
+        # concurrent requests for one location share a single set of Places calls
+        self._bev_inflight: Dict[Tuple[float, float, int], asyncio.Future] = {}
+        
         self.logger.info("RecommendationPipeline initialized")
     
     def recommend(
@@ -207,57 +217,207 @@ class RecommendationPipeline:
         
         # ===== Step 2: Apply Rule Engine =====
         rule_start = time.time()
-        if mode != PipelineMode.LLM_ONLY:
-            rule_result = self.rule_engine.evaluate(bev)
-        else:
-            # Skip rule engine
-            rule_result = RuleEvaluationResult(
-                gym_score=0.5,
-                cafe_score=0.5,
-                gym_rules_applied={},
-                cafe_rules_applied={},
-                evaluated_at=datetime.utcnow().isoformat()
-            )
+        rule_result = self._evaluate_rules(bev, mode)
         rule_time = (time.time() - rule_start) * 1000
         
         # ===== Step 3: LLM Evaluation =====
         llm_start = time.time()
-        llm_result = None
         if mode != PipelineMode.FAST:
             try:
-                if self.llm_evaluator is None:
-                    self.llm_evaluator = LLMEvaluator(self.groq_api_key)
-                llm_result = self.llm_evaluator.evaluate(bev)
+                llm_result = self._get_llm_evaluator().evaluate(bev)
             except Exception as e:
                 self.logger.warning(f"LLM evaluation failed: {e}")
-                # Create fallback result
-                llm_result = LLMEvaluationResult(
-                    gym_probability=0.5,
-                    cafe_probability=0.5,
-                    gym_reasoning="LLM unavailable",
-                    cafe_reasoning="LLM unavailable",
-                    key_factors=["fallback"],
-                    risks=["LLM error"],
-                    recommendation="Using rule-based scoring only",
-                    model_used="fallback",
-                    tokens_used=0
-                )
+                llm_result = self._llm_fallback_result()
         else:
-            # Fast mode - no LLM, use rule scores as LLM probabilities
-            llm_result = LLMEvaluationResult(
-                gym_probability=rule_result.gym_score,
-                cafe_probability=rule_result.cafe_score,
-                gym_reasoning="Fast mode - using rule scores",
-                cafe_reasoning="Fast mode - using rule scores",
-                key_factors=["fast_mode"],
-                risks=[],
-                recommendation="Based on rule engine only",
-                model_used="none",
-                tokens_used=0
-            )
+            llm_result = self._fast_mode_llm_result(rule_result)
         llm_time = (time.time() - llm_start) * 1000
         
-        # ===== Step 4: Combine Scores =====
+        return self._finish(
+            grid_id, lat, lon, radius, mode, bev, rule_result, llm_result,
+            start_time, bev_time, rule_time, llm_time
+        )
+    
+    async def arecommend(
+        self,
+        lat: float,
+        lon: float,
+        grid_id: str = None,
+        radius_meters: int = None,
+        mode: str = PipelineMode.FULL,
+        use_cached_bev: BusinessEnvironmentVector = None
+    ) -> PipelineResult:
+        """
+        Generate recommendation for a location without blocking the event loop.
+        
+        Same steps and result as recommend(). The blocking Places calls run
+        in a worker thread, and in FULL/LLM_ONLY mode the rule engine runs
+        in a worker thread alongside the async LLM request.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            grid_id: Grid cell identifier (optional)
+            radius_meters: Search radius (optional)
+            mode: Pipeline mode (full, fast, llm_only)
+            use_cached_bev: Pre-computed BEV (optional)
+            
+        Returns:
+            PipelineResult with full recommendation
+        """
+        start_time = time.time()
+        radius = radius_meters or self.default_radius
+        grid_id = grid_id or f"custom-{lat:.4f}-{lon:.4f}"
+        
+        self.logger.info(
+            f"Starting recommendation pipeline (async)",
+            extra={"extra_fields": {
+                "lat": lat, "lon": lon, "grid_id": grid_id, "mode": mode
+            }}
+        )
+        
+        # ===== Step 1: Generate BEV (googlemaps is blocking: worker thread) =====
+        bev_start = time.time()
+        if use_cached_bev:
+            bev = use_cached_bev
+            self.logger.debug("Using cached BEV")
+        else:
+            bev = await self._agenerate_bev(lat, lon, radius, grid_id)
+        bev_time = (time.time() - bev_start) * 1000
+        
+        # ===== Steps 2-3: Rule Engine and LLM Evaluation =====
+        if mode == PipelineMode.FAST:
+            rule_start = time.time()
+            rule_result = self._evaluate_rules(bev, mode)
+            rule_time = (time.time() - rule_start) * 1000
+            
+            llm_start = time.time()
+            llm_result = self._fast_mode_llm_result(rule_result)
+            llm_time = (time.time() - llm_start) * 1000
+        else:
+            async def timed_llm():
+                llm_start = time.time()
+                try:
+                    result = await self._get_llm_evaluator().evaluate_async(bev)
+                except Exception as e:
+                    self.logger.warning(f"LLM evaluation failed: {e}")
+                    result = self._llm_fallback_result()
+                return result, (time.time() - llm_start) * 1000
+            
+            async def timed_rules():
+                rule_start = time.time()
+                result = await asyncio.to_thread(self._evaluate_rules, bev, mode)
+                return result, (time.time() - rule_start) * 1000
+            
+            (rule_result, rule_time), (llm_result, llm_time) = await asyncio.gather(
+                timed_rules(), timed_llm()
+            )
+        
+        return self._finish(
+            grid_id, lat, lon, radius, mode, bev, rule_result, llm_result,
+            start_time, bev_time, rule_time, llm_time
+        )
+    
+    async def _agenerate_bev(
+        self,
+        lat: float,
+        lon: float,
+        radius: int,
+        grid_id: str
+    ) -> BusinessEnvironmentVector:
+        """
+        Generate a BEV in a worker thread, joining an identical one in flight.
+        
+        Locations are matched to 5 decimals (~1m). Finished BEVs are not
+        kept: BEVGenerator already caches the Places responses behind them.
+        """
+        key = (round(lat, 5), round(lon, 5), radius)
+        pending = self._bev_inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(asyncio.to_thread(
+                self.bev_generator.generate_bev,
+                center_lat=lat,
+                center_lon=lon,
+                radius_meters=radius,
+                grid_id=grid_id
+            ))
+            self._bev_inflight[key] = pending
+            pending.add_done_callback(lambda _: self._bev_inflight.pop(key, None))
+        
+        bev = await asyncio.shield(pending)
+        if bev.grid_id != grid_id:
+            bev = replace(bev, grid_id=grid_id)
+        return bev
+    
+    def _evaluate_rules(
+        self,
+        bev: BusinessEnvironmentVector,
+        mode: str
+    ) -> RuleEvaluationResult:
+        """Rule engine step (neutral scores in LLM_ONLY mode)."""
+        if mode != PipelineMode.LLM_ONLY:
+            return self.rule_engine.evaluate(bev)
+        
+        # Skip rule engine
+        return RuleEvaluationResult(
+            gym_score=0.5,
+            cafe_score=0.5,
+            gym_rules_applied={},
+            cafe_rules_applied={},
+            evaluated_at=datetime.utcnow().isoformat()
+        )
+    
+    def _get_llm_evaluator(self) -> LLMEvaluator:
+        """LLM evaluator, created on first use."""
+        if self.llm_evaluator is None:
+            self.llm_evaluator = LLMEvaluator(self.groq_api_key)
+        return self.llm_evaluator
+    
+    @staticmethod
+    def _llm_fallback_result() -> LLMEvaluationResult:
+        """Neutral LLM result used when the LLM step fails."""
+        return LLMEvaluationResult(
+            gym_probability=0.5,
+            cafe_probability=0.5,
+            gym_reasoning="LLM unavailable",
+            cafe_reasoning="LLM unavailable",
+            key_factors=["fallback"],
+            risks=["LLM error"],
+            recommendation="Using rule-based scoring only",
+            model_used="fallback",
+            tokens_used=0
+        )
+    
+    @staticmethod
+    def _fast_mode_llm_result(rule_result: RuleEvaluationResult) -> LLMEvaluationResult:
+        """Fast mode - no LLM, use rule scores as LLM probabilities."""
+        return LLMEvaluationResult(
+            gym_probability=rule_result.gym_score,
+            cafe_probability=rule_result.cafe_score,
+            gym_reasoning="Fast mode - using rule scores",
+            cafe_reasoning="Fast mode - using rule scores",
+            key_factors=["fast_mode"],
+            risks=[],
+            recommendation="Based on rule engine only",
+            model_used="none",
+            tokens_used=0
+        )
+    
+    def _finish(
+        self,
+        grid_id: str,
+        lat: float,
+        lon: float,
+        radius: int,
+        mode: str,
+        bev: BusinessEnvironmentVector,
+        rule_result: RuleEvaluationResult,
+        llm_result: LLMEvaluationResult,
+        start_time: float,
+        bev_time: float,
+        rule_time: float,
+        llm_time: float
+    ) -> PipelineResult:
+        """Combine scores (step 4) and assemble the PipelineResult."""
         combine_start = time.time()
         combined = self.score_combiner.combine(
             grid_id=grid_id,
@@ -338,6 +498,55 @@ class RecommendationPipeline:
         
         return results
     
+    async def arecommend_batch(
+        self,
+        locations: List[Dict[str, Any]],
+        mode: str = PipelineMode.FAST,  # Default to fast for batch
+        concurrency: int = None
+    ) -> List[PipelineResult]:
+        """
+        Generate recommendations for multiple locations concurrently.
+        
+        Same contract as recommend_batch(): results keep input order and
+        failed locations are logged and dropped.
+        
+        Args:
+            locations: List of dicts with lat, lon, grid_id
+            mode: Pipeline mode
+            concurrency: Max locations in flight (default PIPELINE_CONCURRENCY)
+            
+        Returns:
+            List of PipelineResult
+        """
+        total = len(locations)
+        sem = asyncio.Semaphore(max(1, concurrency or PIPELINE_CONCURRENCY))
+        
+        self.logger.info(f"Starting async batch recommendation for {total} locations")
+        
+        async def one(loc: Dict[str, Any]) -> PipelineResult:
+            async with sem:
+                return await self.arecommend(
+                    lat=loc["lat"],
+                    lon=loc["lon"],
+                    grid_id=loc.get("grid_id"),
+                    radius_meters=loc.get("radius_meters"),
+                    mode=mode
+                )
+        
+        outcomes = await asyncio.gather(
+            *[one(loc) for loc in locations], return_exceptions=True
+        )
+        
+        results = []
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"Error processing location {i}: {outcome}")
+            else:
+                results.append(outcome)
+        
+        self.logger.info(f"Processed {len(results)}/{total} locations")
+        return results
+    
     def recommend_from_grid_file(
         self,
         grid_file: str,
@@ -355,8 +564,7 @@ class RecommendationPipeline:
         Returns:
             List of PipelineResult
         """
-        with open(grid_file, 'r') as f:
-            grids = json.load(f)
+        grids = orjson.loads(Path(grid_file).read_bytes())
         
         if limit:
             grids = grids[:limit]
@@ -17,12 +17,17 @@ Usage:
     scores = engine.evaluate(bev)
     print(f"Gym Score: {scores['gym_score']}")
     print(f"Cafe Score: {scores['cafe_score']}")
+    
+    # Many BEVs at once (scores only)
+    gym_scores, cafe_scores = engine.evaluate_batch(bevs)
 """
 
 from typing import Dict, List, Tuple, Any, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
 from src.services.bev_generator import BusinessEnvironmentVector
 from src.utils.logger import get_logger
 
@@ -42,6 +47,10 @@ class Rule:
         condition: Lambda function that takes BEV and returns bool
         score_delta: Score adjustment when condition is True
         explanation: Why this rule matters
+    
+    Conditions combine comparisons with & and | (not and/or, not chained
+    comparisons) so the same lambda also runs on BEVColumns, evaluating
+    the rule for a whole batch in one NumPy expression.
     """
     name: str
     category: str  # 'gym', 'cafe', or 'both'
@@ -51,6 +60,34 @@ class Rule:
     priority: int = 1  # Higher = more important
 
 
+class _FeatureColumns:
+    """One BEV feature group as lazily built per-field NumPy columns."""
+    
+    def __init__(self, groups: List[Any]):
+        self._groups = groups
+    
+    def __getattr__(self, name: str) -> np.ndarray:
+        column = np.array([getattr(group, name) for group in self._groups])
+        setattr(self, name, column)  # Built once per field
+        return column
+
+
+class BEVColumns:
+    """
+    Struct-of-arrays view over a list of BEVs.
+    
+    Mirrors the BEV attribute layout (columns.density.offices, ...), with
+    each field a NumPy array over the batch, so rule conditions can be
+    evaluated for every BEV at once.
+    """
+    
+    def __init__(self, bevs: List[BusinessEnvironmentVector]):
+        self.size = len(bevs)
+        self.density = _FeatureColumns([bev.density for bev in bevs])
+        self.distance = _FeatureColumns([bev.distance for bev in bevs])
+        self.economic = _FeatureColumns([bev.economic for bev in bevs])
+
+
 # ============================================================================
 # Gym Rules
 # ============================================================================
@@ -68,7 +105,7 @@ GYM_RULES = [
     Rule(
         name="moderate_offices",
         category="gym",
-        condition=lambda bev: 15 <= bev.density.offices <= 30,
+        condition=lambda bev: (bev.density.offices >= 15) & (bev.density.offices <= 30),
         score_delta=0.15,
         explanation="Moderate office presence provides good customer base",
         priority=2
@@ -84,9 +121,9 @@ GYM_RULES = [
     Rule(
         name="near_university",
         category="gym",
-        condition=lambda bev: bev.density.universities > 0 or 
-                              (bev.distance.distance_to_university >= 0 and 
-                               bev.distance.distance_to_university < 500),
+        condition=lambda bev: (bev.density.universities > 0) | 
+                              ((bev.distance.distance_to_university >= 0) & 
+                               (bev.distance.distance_to_university < 500)),
         score_delta=0.20,
         explanation="University students are key gym demographic",
         priority=3
@@ -94,8 +131,8 @@ GYM_RULES = [
     Rule(
         name="good_transit_access",
         category="gym",
-        condition=lambda bev: bev.distance.distance_to_transit >= 0 and 
-                              bev.distance.distance_to_transit < 300,
+        condition=lambda bev: (bev.distance.distance_to_transit >= 0) & 
+                              (bev.distance.distance_to_transit < 300),
         score_delta=0.15,
         explanation="Easy transit access increases catchment area",
         priority=2
@@ -135,8 +172,8 @@ GYM_RULES = [
     Rule(
         name="near_park",
         category="gym",
-        condition=lambda bev: bev.distance.distance_to_park >= 0 and 
-                              bev.distance.distance_to_park < 400,
+        condition=lambda bev: (bev.distance.distance_to_park >= 0) & 
+                              (bev.distance.distance_to_park < 400),
         score_delta=0.10,
         explanation="Park proximity attracts fitness-oriented customers",
         priority=1
@@ -154,7 +191,7 @@ GYM_RULES = [
     Rule(
         name="moderate_gym_competition",
         category="gym",
-        condition=lambda bev: 2 <= bev.density.gyms < 4,
+        condition=lambda bev: (bev.density.gyms >= 2) & (bev.density.gyms < 4),
         score_delta=-0.15,
         explanation="Moderate competition from existing gyms",
         priority=2
@@ -170,8 +207,8 @@ GYM_RULES = [
     Rule(
         name="poor_transit",
         category="gym",
-        condition=lambda bev: bev.distance.distance_to_transit < 0 or 
-                              bev.distance.distance_to_transit > 800,
+        condition=lambda bev: (bev.distance.distance_to_transit < 0) | 
+                              (bev.distance.distance_to_transit > 800),
         score_delta=-0.10,
         explanation="Poor transit access limits customer reach",
         priority=1
@@ -212,7 +249,7 @@ CAFE_RULES = [
     Rule(
         name="moderate_offices",
         category="cafe",
-        condition=lambda bev: 15 <= bev.density.offices <= 30,
+        condition=lambda bev: (bev.density.offices >= 15) & (bev.density.offices <= 30),
         score_delta=0.20,
         explanation="Moderate office presence provides steady customer flow",
         priority=2
@@ -220,9 +257,9 @@ CAFE_RULES = [
     Rule(
         name="near_university",
         category="cafe",
-        condition=lambda bev: bev.density.universities > 0 or 
-                              (bev.distance.distance_to_university >= 0 and 
-                               bev.distance.distance_to_university < 400),
+        condition=lambda bev: (bev.density.universities > 0) | 
+                              ((bev.distance.distance_to_university >= 0) & 
+                               (bev.distance.distance_to_university < 400)),
         score_delta=0.25,
         explanation="University students are frequent cafe visitors",
         priority=3
@@ -238,8 +275,8 @@ CAFE_RULES = [
     Rule(
         name="mall_proximity",
         category="cafe",
-        condition=lambda bev: bev.distance.distance_to_mall >= 0 and 
-                              bev.distance.distance_to_mall < 300,
+        condition=lambda bev: (bev.distance.distance_to_mall >= 0) & 
+                              (bev.distance.distance_to_mall < 300),
         score_delta=0.20,
         explanation="Mall proximity brings shopping traffic to cafes",
         priority=2
@@ -247,8 +284,8 @@ CAFE_RULES = [
     Rule(
         name="good_transit_access",
         category="cafe",
-        condition=lambda bev: bev.distance.distance_to_transit >= 0 and 
-                              bev.distance.distance_to_transit < 200,
+        condition=lambda bev: (bev.distance.distance_to_transit >= 0) & 
+                              (bev.distance.distance_to_transit < 200),
         score_delta=0.20,
         explanation="Transit stations create high foot traffic for cafes",
         priority=3
@@ -272,7 +309,7 @@ CAFE_RULES = [
     Rule(
         name="entertainment_zone",
         category="cafe",
-        condition=lambda bev: bev.density.cinemas > 0 or bev.density.bars > 2,
+        condition=lambda bev: (bev.density.cinemas > 0) | (bev.density.bars > 2),
         score_delta=0.15,
         explanation="Entertainment venues create cafe-friendly foot traffic",
         priority=2
@@ -288,8 +325,8 @@ CAFE_RULES = [
     Rule(
         name="park_adjacent",
         category="cafe",
-        condition=lambda bev: bev.distance.distance_to_park >= 0 and 
-                              bev.distance.distance_to_park < 200,
+        condition=lambda bev: (bev.distance.distance_to_park >= 0) & 
+                              (bev.distance.distance_to_park < 200),
         score_delta=0.10,
         explanation="Park proximity attracts leisure visitors",
         priority=1
@@ -307,7 +344,7 @@ CAFE_RULES = [
     Rule(
         name="moderate_cafe_competition",
         category="cafe",
-        condition=lambda bev: 3 <= bev.density.cafes < 6,
+        condition=lambda bev: (bev.density.cafes >= 3) & (bev.density.cafes < 6),
         score_delta=-0.10,
         explanation="Moderate competition from existing cafes",
         priority=2
@@ -323,8 +360,8 @@ CAFE_RULES = [
     Rule(
         name="poor_transit",
         category="cafe",
-        condition=lambda bev: bev.distance.distance_to_transit < 0 or 
-                              bev.distance.distance_to_transit > 600,
+        condition=lambda bev: (bev.distance.distance_to_transit < 0) | 
+                              (bev.distance.distance_to_transit > 600),
         score_delta=-0.10,
         explanation="Poor transit access limits customer flow",
         priority=1
@@ -492,6 +529,81 @@ class RuleEngine:
         
         return result
     
+    def evaluate_batch(
+        self,
+        bevs: List[BusinessEnvironmentVector]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score many BEVs at once (scores only, no applied-rule details).
+        
+        Each rule condition runs once over BEVColumns instead of once per
+        BEV. Scores match evaluate() exactly: deltas are added in the same
+        priority order, then clamped and rounded the same way.
+        
+        Args:
+            bevs: Business Environment Vectors to evaluate
+            
+        Returns:
+            Tuple of (gym_scores, cafe_scores) arrays, in input order
+        """
+        if not bevs:
+            return np.empty(0), np.empty(0)
+        
+        columns = BEVColumns(bevs)
+        gym_scores = self._score_columns(self.gym_rules, columns, bevs)
+        cafe_scores = self._score_columns(self.cafe_rules, columns, bevs)
+        
+        self.logger.info(
+            f"Batch rule evaluation complete",
+            extra={"extra_fields": {"bevs": len(bevs)}}
+        )
+        
+        return gym_scores, cafe_scores
+    
+    def _score_columns(
+        self,
+        rules: List[Rule],
+        columns: BEVColumns,
+        bevs: List[BusinessEnvironmentVector]
+    ) -> np.ndarray:
+        """Accumulate rule deltas over a batch, then normalize like evaluate()."""
+        scores = np.full(columns.size, self.base_score)
+        for rule in sorted(rules, key=lambda r: -r.priority):
+            mask = self._rule_mask(rule, columns, bevs)
+            scores += np.where(mask, rule.score_delta, 0.0)
+        
+        # Python round per value: np.round can differ in the last digit
+        return np.array(
+            [self._normalize_score(score) for score in scores.tolist()],
+            dtype=np.float64
+        )
+    
+    def _rule_mask(
+        self,
+        rule: Rule,
+        columns: BEVColumns,
+        bevs: List[BusinessEnvironmentVector]
+    ) -> np.ndarray:
+        """
+        Boolean mask of the BEVs a rule applies to.
+        
+        Conditions that cannot run on columns (e.g. custom rules using
+        and/or) fall back to a per-BEV loop with evaluate()'s error handling.
+        """
+        try:
+            mask = np.asarray(rule.condition(columns), dtype=bool)
+            return np.broadcast_to(mask, (columns.size,))
+        except Exception:
+            pass
+        
+        mask = np.zeros(columns.size, dtype=bool)
+        for i, bev in enumerate(bevs):
+            try:
+                mask[i] = bool(rule.condition(bev))
+            except Exception as e:
+                self.logger.warning(f"Error evaluating {rule.category} rule {rule.name}: {e}")
+        return mask
+    
     def _normalize_score(self, score: float) -> float:
         """Normalize score to [0, 1] range."""
         return round(max(0.0, min(1.0, score)), 3)
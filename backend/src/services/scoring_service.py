@@ -391,7 +391,8 @@ def get_competitors(grid_id: str, category: str, limit: int = 5) -> List[Dict]:
     try:
         # Import database components
         from src.database.connection import get_session
-        from src.database.models import BusinessModel, GridCellModel
+        from src.database.models import GridCellModel
+        from src.database.queries import BUSINESSES_BY_GRID_CAT
         
         with get_session() as session:
             # Get grid center coordinates
@@ -408,19 +409,11 @@ def get_competitors(grid_id: str, category: str, limit: int = 5) -> List[Dict]:
             grid_center_lat = float(grid.lat_center)
             grid_center_lon = float(grid.lon_center)
             
-            # Query businesses
-            businesses = (
-                session.query(BusinessModel)
-                .filter(
-                    BusinessModel.grid_id == grid_id,
-                    BusinessModel.category == category
-                )
-                .order_by(
-                    BusinessModel.rating.desc().nullslast()
-                )
-                .limit(limit)
-                .all()
-            )
+            # Query businesses (precompiled statement, best-rated first)
+            businesses = session.execute(
+                BUSINESSES_BY_GRID_CAT,
+                {"grid_id": grid_id, "category": category, "limit": limit}
+            ).scalars().all()
             
             # Calculate distances and build result
             result = []
@@ -457,7 +450,7 @@ def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> f
     
     Formula:
         a = sin²(Δlat/2) + cos(lat1) * cos(lat2) * sin²(Δlon/2)
-        c = 2 * atan2(√a, √(1−a))
+        c = 2 * asin(√a)
         distance = R * c
         
         where R = 6371 km (Earth's radius)
@@ -477,7 +470,7 @@ def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> f
     
     # Haversine formula
     a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    c = 2 * math.asin(math.sqrt(min(1.0, a)))  # Clamp FP overshoot at antipodes
     
     distance = R * c
     return distance
@@ -649,22 +642,22 @@ def score_all_grids(category: str) -> List[Dict]:
     Main scoring pipeline that processes all grids for a category.
     
     This is the primary entry point for Phase 2 scoring. It orchestrates:
-    1. Data aggregation from database
-    2. Metric normalization
-    3. GOS and confidence calculation
-    4. Explainability metadata (top posts, competitors, rationale)
-    5. Database persistence to grid_metrics table
+    1. Data aggregation and metric normalization (in SQL)
+    2. GOS and confidence calculation
+    3. Explainability metadata (top posts, competitors, rationale)
+    4. Database persistence to grid_metrics table
     
     Workflow:
-        1. Call aggregator.aggregate_all_grids(category)
-        2. Normalize all metrics using max values
-        3. For each grid:
+        1. Refresh the grid_category_metrics materialized view, then call
+           aggregator.aggregate_all_grids_normalized(category), which reads
+           and normalizes the view's counts
+        2. For each grid:
            - Calculate GOS and confidence
            - Fetch top posts and competitors
            - Generate rationale
            - Build GridMetrics record
-        4. Bulk insert into grid_metrics table
-        5. Return scored results
+        3. Bulk insert into grid_metrics table
+        4. Return scored results
     
     Args:
         category: Business category (e.g., "Gym", "Cafe")
@@ -706,9 +699,12 @@ def score_all_grids(category: str) -> List[Dict]:
     if str(backend_dir) not in sys.path:
         sys.path.insert(0, str(backend_dir))
     
-    from src.services.aggregator import aggregate_all_grids, normalize_metrics
-    from src.database.connection import get_session
+    from src.services.aggregator import (
+        aggregate_all_grids_normalized, NORMALIZED_KEYS
+    )
+    from src.database.connection import get_write_session
     from src.database.models import GridMetricsModel
+    from src.database.views import refresh_grid_category_metrics
     
     start_time = time.time()
     
@@ -716,9 +712,14 @@ def score_all_grids(category: str) -> List[Dict]:
     print(f"SCORING PIPELINE: {category}")
     print(f"{'='*70}\n")
     
-    # Step 1: Aggregate all grids
+    # Step 1: Aggregate and normalize all grids (normalization runs in SQL).
+    # The view is only as fresh as its last refresh, and businesses/posts may
+    # have been loaded since, so refresh it before reading.
     print("Step 1: Aggregating data from database...")
-    metrics_list, max_values = aggregate_all_grids(category)
+    with get_write_session() as session:
+        refresh_grid_category_metrics(session)
+        session.commit()
+    metrics_list, max_values = aggregate_all_grids_normalized(category)
     print(f"✓ Found {len(metrics_list)} grids to score")
     print(f"✓ Max values: business_count={max_values['max_business_count']}, "
           f"instagram={max_values['max_instagram_volume']}, "
@@ -730,9 +731,7 @@ def score_all_grids(category: str) -> List[Dict]:
     
     for raw_metrics in metrics_list:
         grid_id = raw_metrics["grid_id"]
-        
-        # Normalize metrics (already imported at top)
-        normalized = normalize_metrics(raw_metrics, max_values)
+        normalized = {key: raw_metrics[key] for key in NORMALIZED_KEYS}
         
         # Calculate GOS and confidence
         gos = calculate_gos(normalized)
@@ -765,7 +764,7 @@ def score_all_grids(category: str) -> List[Dict]:
     # Step 3: Persist to database
     print("\nStep 3: Persisting to grid_metrics table...")
     
-    with get_session() as session:
+    with get_write_session() as session:
         try:
             # Delete existing records for this category (upsert pattern)
             session.query(GridMetricsModel).filter_by(category=category).delete()
@@ -870,25 +869,18 @@ def get_top_recommendations(neighborhood: str, category: str, limit: int = 3) ->
         sys.path.insert(0, str(backend_dir))
     
     from src.database.connection import get_session
-    from src.database.models import GridMetricsModel, GridCellModel
+    from src.database.queries import TOP_METRICS_BY_NEIGHBORHOOD_CAT
     
     with get_session() as session:
-        # Query grid_metrics with JOIN to grid_cells
-        results = (
-            session.query(GridMetricsModel, GridCellModel)
-            .join(GridCellModel, GridMetricsModel.grid_id == GridCellModel.grid_id)
-            .filter(
-                GridCellModel.neighborhood == neighborhood,
-                GridMetricsModel.category == category
-            )
-            .order_by(GridMetricsModel.gos.desc())
-            .limit(limit)
-            .all()
-        )
+        # Query grid_metrics with JOIN to grid_cells (precompiled statement)
+        results = session.execute(
+            TOP_METRICS_BY_NEIGHBORHOOD_CAT,
+            {"neighborhood": neighborhood, "category": category, "limit": limit}
+        ).all()
         
         # Build recommendation dicts
         recommendations = []
-        for grid_metric, grid_cell in results:
+        for grid_cell, grid_metric in results:
             # Regenerate rationale from stored metrics
             rationale = generate_rationale(
                 {
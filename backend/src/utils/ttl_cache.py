@@ -0,0 +1,121 @@
+"""
+Bounded In-Process Caches with Expiry
+
+Shared by the services that keep API responses in memory in front of an
+on-disk cache (Places nearby searches, LLM evaluations). Entries expire
+after a TTL and the least recently used entry is evicted once the cache
+is full, so long-running API processes neither grow without bound nor
+serve stale data forever.
+
+Usage:
+    from src.utils.ttl_cache import TTLCache, cache_dir_from_env
+
+    cache = TTLCache(maxsize=1024, ttl_seconds=3600)
+    cache.put("key", value)
+    value = cache.get("key")  # None on miss or expiry
+"""
+
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after ttl_seconds.
+
+    Values are stored as given; callers that hand out mutable values are
+    responsible for copying them.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Args:
+            maxsize: Max entries kept (least recently used evicted first)
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any, age_seconds: float = 0.0) -> None:
+        """
+        Store value under key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            age_seconds: How old the value already is (e.g. a file read from
+                the disk cache), so it expires when the original would
+        """
+        expires_at = time.monotonic() + self.ttl_seconds - age_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cache_dir_from_env(env_var: str, name: str) -> Path:
+    """
+    Directory for an on-disk cache.
+
+    Uses the env var when set, else <system temp dir>/startsmart/<name>,
+    which is writable on serverless deployments and independent of the
+    working directory.
+    """
+    configured = os.getenv(env_var)
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "startsmart" / name
+
+
+def prune_expired_files(directory: Path, ttl_seconds: float) -> int:
+    """
+    Delete *.json cache files older than ttl_seconds.
+
+    Returns:
+        Number of files removed
+    """
+    cutoff = time.time() - ttl_seconds
+    removed = 0
+    try:
+        cache_files = list(directory.glob("*.json"))
+    except OSError:
+        return 0
+
+    for cache_file in cache_files:
+        try:
+            if cache_file.stat().st_mtime < cutoff:
+                cache_file.unlink()
+                removed += 1
+        except OSError:
+            pass  # Removed concurrently or unreadable: skip
+    return removed
@@ -105,6 +105,17 @@ def test_base_declarative_exists():
     assert hasattr(Base, 'metadata')
 
 
+def test_read_and_write_sessions_expire_policy():
+    """Test read sessions skip expire_on_commit while write sessions keep it"""
+    from src.database.connection import get_session, get_write_session
+
+    with get_session() as session:
+        assert session.expire_on_commit is False
+
+    with get_write_session() as session:
+        assert session.expire_on_commit is True
+
+
 # ========== Usage Examples (not actual tests) ==========
 
 def example_usage_context_manager():
@@ -23,12 +23,12 @@ def test_grid_cell_model_creation():
     grid = GridCellModel(
         grid_id="DHA-Phase2-Cell-07",
         neighborhood="DHA Phase 2",
-        lat_center=Decimal("24.8290"),
-        lon_center=Decimal("67.0610"),
-        lat_north=Decimal("24.8320"),
-        lat_south=Decimal("24.8260"),
-        lon_east=Decimal("67.0640"),
-        lon_west=Decimal("67.0580"),
+        lat_center=24.8290,
+        lon_center=67.0610,
+        lat_north=24.8320,
+        lat_south=24.8260,
+        lon_east=67.0640,
+        lon_west=67.0580,
         area_km2=Decimal("0.5"),
     )
     
@@ -42,6 +42,13 @@ def test_grid_cell_model_creation():
     assert grid_dict["lat_center"] == 24.8290
     assert isinstance(grid_dict["lat_center"], float)
 
+    # Reflects attribute changes made after an earlier call
+    grid.neighborhood = "Clifton"
+    grid.created_at = datetime(2025, 1, 1)
+    grid_dict = grid.to_dict()
+    assert grid_dict["neighborhood"] == "Clifton"
+    assert grid_dict["created_at"] == "2025-01-01T00:00:00"
+
 
 def test_business_model_creation():
     """Test BusinessModel instantiation"""
@@ -50,8 +57,8 @@ def test_business_model_creation():
     business = BusinessModel(
         business_id="gym-001",
         name="PowerHouse Gym",
-        lat=Decimal("24.8300"),
-        lon=Decimal("67.0600"),
+        lat=24.8300,
+        lon=67.0600,
         category="Gym",
         rating=Decimal("4.5"),
         review_count=120,
@@ -79,8 +86,8 @@ def test_social_post_model_creation():
         source="simulated",
         text="Looking for a good gym in DHA Phase 2",
         timestamp=datetime.utcnow(),
-        lat=Decimal("24.8300"),
-        lon=Decimal("67.0600"),
+        lat=24.8300,
+        lon=67.0600,
         grid_id="DHA-Phase2-Cell-07",
         post_type="demand",
         engagement_score=25,
@@ -123,6 +130,27 @@ def test_grid_metrics_model_creation():
     metrics_dict = metrics.to_dict()
     assert metrics_dict["gos"] == 0.825
     assert isinstance(metrics_dict["top_posts_json"], dict)
+    assert metrics_dict["top_post_1_text"] is None
+    assert metrics_dict["competitor_count"] == 0
+
+
+def test_grid_metrics_denormalized_json_columns():
+    """Test typed columns are populated from the JSONB payloads"""
+    from src.database.models import GridMetricsModel
+
+    metrics = GridMetricsModel(
+        grid_id="DHA-Phase2-Cell-07",
+        category="Gym",
+        top_posts_json=[{"text": "Need a gym", "source": "simulated"}],
+        competitors_json=[{"name": "Gym A"}, {"name": "Gym B"}],
+    )
+
+    assert metrics.top_post_1_text == "Need a gym"
+    assert metrics.competitor_count == 2
+
+    # Re-assigning the JSONB column keeps the typed columns in sync
+    metrics.competitors_json = {"businesses": [{"name": "Gym C"}]}
+    assert metrics.competitor_count == 1
 
 
 def test_user_feedback_model_creation():
@@ -168,8 +196,8 @@ def test_from_pydantic_grid_cell():
     orm_grid = GridCellModel.from_pydantic(pydantic_grid)
     
     assert orm_grid.grid_id == "DHA-Phase2-Cell-07"
-    assert float(orm_grid.lat_center) == 24.8290
-    assert isinstance(orm_grid.lat_center, Decimal)
+    assert orm_grid.lat_center == 24.8290
+    assert isinstance(orm_grid.lat_center, float)
 
 
 def test_from_pydantic_business():
@@ -227,6 +255,48 @@ def test_get_model_by_table_name():
     assert model is None
 
 
+def test_grid_metrics_gin_indexes_use_jsonb_path_ops():
+    """Test JSONB GIN indexes are declared with the jsonb_path_ops opclass"""
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+    from src.database.models import GridMetricsModel
+
+    indexes = {idx.name: idx for idx in GridMetricsModel.__table__.indexes}
+
+    for name in ('idx_metrics_top_posts', 'idx_metrics_competitors'):
+        ddl = str(CreateIndex(indexes[name]).compile(dialect=postgresql.dialect()))
+        assert "USING gin" in ddl
+        assert "jsonb_path_ops" in ddl
+
+
+def test_social_post_timestamp_index_is_brin():
+    """Test idx_post_timestamp is a BRIN index"""
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+    from src.database.models import SocialPostModel
+
+    index = next(i for i in SocialPostModel.__table__.indexes if i.name == 'idx_post_timestamp')
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert "USING brin" in ddl
+    assert "pages_per_range = 32" in ddl
+
+
+def test_aggregation_composite_indexes():
+    """Test composite indexes backing the grid aggregation filters"""
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+    from src.database.models import BusinessModel, SocialPostModel
+
+    business_idx = next(i for i in BusinessModel.__table__.indexes
+                        if i.name == 'idx_business_grid_category')
+    ddl = str(CreateIndex(business_idx).compile(dialect=postgresql.dialect()))
+    assert "(grid_id, category) INCLUDE (rating, review_count)" in ddl
+
+    social_idx = next(i for i in SocialPostModel.__table__.indexes
+                      if i.name == 'idx_social_grid_type')
+    assert [c.name for c in social_idx.columns] == ['grid_id', 'source', 'post_type']
+
 @pytest.mark.skipif(
     True,  # Skip by default (requires database)
     reason="Requires database connection for integration test"
@@ -250,12 +320,12 @@ def test_model_database_integration():
         grid = GridCellModel(
             grid_id="TEST-Grid-01",
             neighborhood="Test Area",
-            lat_center=Decimal("24.8290"),
-            lon_center=Decimal("67.0610"),
-            lat_north=Decimal("24.8320"),
-            lat_south=Decimal("24.8260"),
-            lon_east=Decimal("67.0640"),
-            lon_west=Decimal("67.0580"),
+            lat_center=24.8290,
+            lon_center=67.0610,
+            lat_north=24.8320,
+            lat_south=24.8260,
+            lon_east=67.0640,
+            lon_west=67.0580,
         )
         session.add(grid)
     
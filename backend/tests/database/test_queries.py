@@ -0,0 +1,32 @@
+"""
+Precompiled Query Tests
+
+Tests for module-level statements in src/database/queries.py
+
+Usage:
+    pytest tests/database/test_queries.py -v
+"""
+
+from sqlalchemy.dialects import postgresql
+
+
+def test_businesses_by_grid_cat_uses_bind_params():
+    """Test BUSINESSES_BY_GRID_CAT is parameterized, not literal"""
+    from src.database.queries import BUSINESSES_BY_GRID_CAT
+
+    compiled = BUSINESSES_BY_GRID_CAT.compile(dialect=postgresql.dialect())
+
+    assert set(compiled.params) == {"grid_id", "category", "limit"}
+    assert "FROM businesses" in str(compiled)
+
+
+def test_top_metrics_by_neighborhood_cat_uses_bind_params():
+    """Test TOP_METRICS_BY_NEIGHBORHOOD_CAT joins metrics and orders by GOS"""
+    from src.database.queries import TOP_METRICS_BY_NEIGHBORHOOD_CAT
+
+    compiled = TOP_METRICS_BY_NEIGHBORHOOD_CAT.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert set(compiled.params) == {"neighborhood", "category", "limit"}
+    assert "JOIN grid_metrics" in sql
+    assert "ORDER BY grid_metrics.gos DESC" in sql
@@ -0,0 +1,256 @@
+"""
+Unit Tests for Aggregator Service
+
+Tests grid × category aggregation against an in-memory SQLite database.
+
+Test Coverage:
+- Live bulk aggregation matches the grid_category_metrics view
+- Grids without businesses/posts default to zero
+- aggregate_all_grids() returns metrics and max values
+- Vectorized max/normalization matches the per-grid helpers
+- SQL window-function normalization matches the Python pipeline
+
+Usage:
+    pytest tests/services/test_aggregator.py -v
+"""
+
+import pytest
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import GridCellModel, BusinessModel, SocialPostModel
+from src.database.views import create_grid_category_metrics_view
+from src.services import aggregator
+from src.services.aggregator import (
+    aggregate_grid_metrics,
+    aggregate_all_grids,
+    aggregate_all_grids_bulk,
+    aggregate_all_grids_normalized,
+    compute_max_values,
+    normalize_metrics,
+    normalize_all,
+    NORMALIZED_KEYS,
+)
+
+
+# ============================================================================
+# Test Database Setup
+# ============================================================================
+
+TABLES = [GridCellModel.__table__, BusinessModel.__table__, SocialPostModel.__table__]
+
+
+def _grid(grid_id: str, lat: float) -> GridCellModel:
+    return GridCellModel(
+        grid_id=grid_id,
+        neighborhood="DHA Phase 2",
+        lat_center=lat,
+        lon_center=67.0595,
+        lat_north=lat + 0.003,
+        lat_south=lat - 0.003,
+        lon_east=67.0625,
+        lon_west=67.0565,
+        area_km2=Decimal("0.5"),
+    )
+
+
+def _business(business_id: str, grid_id: str, category: str = "Gym",
+              rating=None, review_count: int = 0) -> BusinessModel:
+    return BusinessModel(
+        business_id=business_id,
+        name=business_id,
+        lat=24.8278,
+        lon=67.0595,
+        category=category,
+        rating=Decimal(str(rating)) if rating is not None else None,
+        review_count=review_count,
+        grid_id=grid_id,
+    )
+
+
+def _post(post_id: str, grid_id: str, post_type: str, source: str = "simulated") -> SocialPostModel:
+    return SocialPostModel(
+        post_id=post_id,
+        source=source,
+        text="Looking for a gym",
+        timestamp=datetime(2025, 11, 1),
+        grid_id=grid_id,
+        post_type=post_type,
+        is_simulated=True,
+    )
+
+
+@pytest.fixture
+def populated_db():
+    """In-memory SQLite database with three grids of varying activity."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    for table in TABLES:
+        table.create(engine, checkfirst=True)
+    with engine.begin() as connection:
+        create_grid_category_metrics_view(connection)  # Plain VIEW on SQLite
+    SessionLocal = sessionmaker(bind=engine)
+
+    session = SessionLocal()
+    session.add_all([
+        _grid("Cell-01", 24.8278),
+        _grid("Cell-02", 24.8338),
+        _grid("Cell-03", 24.8398),  # No businesses, no posts
+        _business("gym-1", "Cell-01", rating=4.0, review_count=100),
+        _business("gym-2", "Cell-01", rating=5.0, review_count=50),
+        _business("gym-3", "Cell-01"),  # Unrated: counted, excluded from rating stats
+        _business("cafe-1", "Cell-01", category="Cafe", rating=3.0, review_count=10),
+        _business("gym-4", "Cell-02", rating=3.5, review_count=20),
+        _post("p1", "Cell-01", "mention"),
+        _post("p2", "Cell-01", "demand"),
+        _post("p3", "Cell-01", "complaint"),
+        _post("p4", "Cell-02", "mention"),
+        _post("p5", "Cell-02", "mention"),
+        _post("p6", "Cell-02", "demand", source="reddit"),  # Not simulated: ignored
+    ])
+    session.commit()
+    session.close()
+
+    try:
+        yield SessionLocal
+    finally:
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP VIEW IF EXISTS grid_category_metrics")
+        for table in reversed(TABLES):
+            table.drop(engine, checkfirst=True)
+        engine.dispose()
+
+
+def mock_get_session(SessionLocal):
+    """Create a get_session replacement bound to the test database."""
+    @contextmanager
+    def _get_session():
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    return _get_session
+
+
+# ============================================================================
+# Bulk Aggregation Tests
+# ============================================================================
+
+def test_bulk_aggregation_values(populated_db):
+    """Test bulk aggregation counts, ratings and zero-filled grids."""
+    with patch.object(aggregator, 'get_session', mock_get_session(populated_db)):
+        metrics = {m["grid_id"]: m for m in aggregate_all_grids_bulk("Gym")}
+
+    assert list(metrics) == ["Cell-01", "Cell-02", "Cell-03"]
+
+    cell_01 = metrics["Cell-01"]
+    assert cell_01["business_count"] == 3
+    assert cell_01["instagram_volume"] == 1
+    assert cell_01["reddit_mentions"] == 2
+    assert cell_01["avg_rating"] == pytest.approx(4.5)
+    assert cell_01["total_reviews"] == 150
+
+    assert metrics["Cell-02"]["instagram_volume"] == 2
+    assert metrics["Cell-02"]["reddit_mentions"] == 0
+
+    assert metrics["Cell-03"] == {
+        "grid_id": "Cell-03",
+        "category": "Gym",
+        "business_count": 0,
+        "instagram_volume": 0,
+        "reddit_mentions": 0,
+        "avg_rating": None,
+        "total_reviews": 0,
+    }
+
+
+def test_bulk_matches_per_grid_aggregation(populated_db):
+    """Test live bulk aggregation matches per-grid reads from the view."""
+    with patch.object(aggregator, 'get_session', mock_get_session(populated_db)):
+        for category in ("Gym", "Cafe"):
+            bulk = aggregate_all_grids_bulk(category)
+            per_grid = [aggregate_grid_metrics(m["grid_id"], category) for m in bulk]
+            assert bulk == per_grid
+
+
+def test_aggregate_all_grids_returns_max_values(populated_db):
+    """Test aggregate_all_grids() returns metrics plus normalization maxima."""
+    with patch.object(aggregator, 'get_session', mock_get_session(populated_db)):
+        metrics_list, max_values = aggregate_all_grids("Gym")
+        live_metrics = aggregate_all_grids_bulk("Gym")
+
+    assert metrics_list == live_metrics
+    assert max_values == {
+        "max_business_count": 3.0,
+        "max_instagram_volume": 2.0,
+        "max_reddit_mentions": 2.0,
+    }
+
+
+def test_view_queries_reuse_compiled_cache(populated_db):
+    """Test repeated per-grid reads are served from the aggregator's compiled cache."""
+    aggregator._COMPILED_CACHE.clear()
+    with patch.object(aggregator, 'get_session', mock_get_session(populated_db)):
+        aggregate_grid_metrics("Cell-01", "Gym")
+        cached_entries = len(aggregator._COMPILED_CACHE)
+        for grid_id in ("Cell-02", "Cell-03", "Cell-01"):
+            aggregate_grid_metrics(grid_id, "Cafe")
+
+    assert cached_entries > 0
+    assert len(aggregator._COMPILED_CACHE) == cached_entries
+
+
+# ============================================================================
+# Normalization Tests
+# ============================================================================
+
+def test_compute_max_values_zero_columns_default_to_one():
+    """Test all-zero counter columns fall back to 1.0."""
+    metrics_list = [
+        {"business_count": 0, "instagram_volume": 4, "reddit_mentions": 0},
+        {"business_count": 0, "instagram_volume": 9, "reddit_mentions": 0},
+    ]
+
+    assert compute_max_values(metrics_list) == {
+        "max_business_count": 1.0,
+        "max_instagram_volume": 9.0,
+        "max_reddit_mentions": 1.0,
+    }
+
+
+def test_normalize_all_matches_normalize_metrics():
+    """Test vectorized normalization matches per-grid normalize_metrics()."""
+    metrics_list = [
+        {"grid_id": "Cell-01", "business_count": 3, "instagram_volume": 1, "reddit_mentions": 2},
+        {"grid_id": "Cell-02", "business_count": 1, "instagram_volume": 2, "reddit_mentions": 0},
+        {"grid_id": "Cell-03", "business_count": 0, "instagram_volume": 0, "reddit_mentions": 0},
+    ]
+    max_values = compute_max_values(metrics_list)
+
+    normalized = normalize_all(metrics_list, max_values)
+
+    assert normalized.shape == (3, 3)
+    for metrics, row in zip(metrics_list, normalized.tolist()):
+        expected = normalize_metrics(metrics, max_values)
+        assert dict(zip(NORMALIZED_KEYS, row)) == pytest.approx(expected)
+
+
+def test_sql_normalization_matches_python_pipeline(populated_db):
+    """Test window-function normalization matches aggregate + normalize_metrics()."""
+    with patch.object(aggregator, 'get_session', mock_get_session(populated_db)):
+        for category in ("Gym", "Cafe"):
+            sql_metrics, sql_max_values = aggregate_all_grids_normalized(category)
+            metrics_list, max_values = aggregate_all_grids(category)
+
+            assert sql_max_values == max_values
+            assert len(sql_metrics) == len(metrics_list)
+            for sql_row, metrics in zip(sql_metrics, metrics_list):
+                expected = normalize_metrics(metrics, max_values)
+                assert {k: sql_row[k] for k in metrics} == metrics
+                assert {k: sql_row[k] for k in NORMALIZED_KEYS} == pytest.approx(expected)
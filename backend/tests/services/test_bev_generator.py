@@ -0,0 +1,292 @@
+"""
+Unit Tests for BEV Generator
+
+Tests BEV feature extraction against fixed place lists (no Google Places
+traffic; the googlemaps client is replaced by stubs).
+
+Test Coverage:
+- PlaceColumns parsing of Places API dicts
+- Density and distance features match a per-place haversine reference
+- Missing amenity types report -1
+- Page-token backoff, cached nearby searches and API call accounting
+
+Usage:
+    pytest tests/services/test_bev_generator.py -v
+"""
+
+import random
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from googlemaps.exceptions import ApiError
+
+from src.services import bev_generator
+from src.services.bev_generator import (
+    BEVGenerator,
+    DensityFeatures,
+    DistanceFeatures,
+    DENSITY_POI_TYPES,
+    PLACES_PAGE_TOKEN_DELAY,
+    PLACES_PAGE_TOKEN_RETRIES,
+    _nearest_per_type,
+    _places_to_columns,
+)
+
+
+CENTER = (24.8150, 67.0280)
+
+# Type mapping of the original per-place distance implementation
+REFERENCE_DISTANCE_TYPES = {
+    "shopping_mall": "distance_to_mall",
+    "movie_theater": "distance_to_cinema",
+    "university": "distance_to_university",
+    "hospital": "distance_to_hospital",
+    "transit_station": "distance_to_transit",
+    "bus_station": "distance_to_transit",
+    "subway_station": "distance_to_transit",
+    "park": "distance_to_park",
+}
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    """Generator with a dummy key and its disk cache in a temp dir."""
+    monkeypatch.setattr(bev_generator, "PLACES_CACHE_DIR", tmp_path)
+    return BEVGenerator(api_key="AIza-test")
+
+
+def _place(place_id, types, lat=None, lon=None, rating=None, reviews=None, price_level=None):
+    place = {"place_id": place_id, "types": list(types)}
+    if lat is not None:
+        place["geometry"] = {"location": {"lat": lat, "lng": lon}}
+    if rating is not None:
+        place["rating"] = rating
+    if reviews is not None:
+        place["user_ratings_total"] = reviews
+    if price_level is not None:
+        place["price_level"] = price_level
+    return place
+
+
+@pytest.fixture
+def places():
+    """Fixed pseudo-random places around CENTER, some without a location."""
+    rng = random.Random(7)
+    all_types = sorted(
+        {t for types in DENSITY_POI_TYPES.values() for t in types}
+        | set(REFERENCE_DISTANCE_TYPES)
+    )
+    result = []
+    for i in range(250):
+        located = rng.random() > 0.05
+        result.append(_place(
+            f"p{i}",
+            rng.sample(all_types, rng.randint(1, 3)),
+            lat=CENTER[0] + rng.uniform(-0.009, 0.009) if located else None,
+            lon=CENTER[1] + rng.uniform(-0.009, 0.009) if located else None,
+        ))
+    return result
+
+
+def _reference_density(places):
+    counts = dict.fromkeys(DENSITY_POI_TYPES, 0)
+    for place in places:
+        place_types = set(place.get("types", []))
+        for category, type_list in DENSITY_POI_TYPES.items():
+            if any(t in place_types for t in type_list):
+                counts[category] += 1
+    return DensityFeatures(**counts)
+
+
+def _reference_distance(generator, places):
+    nearest = {}
+    for place in places:
+        location = place.get("geometry", {}).get("location", {})
+        if not location:
+            continue
+        dist = generator._haversine_distance(CENTER[0], CENTER[1], location["lat"], location["lng"])
+        for poi_type, attr in REFERENCE_DISTANCE_TYPES.items():
+            if poi_type in place["types"] and (attr not in nearest or dist < nearest[attr]):
+                nearest[attr] = round(dist, 1)
+    if "distance_to_transit" in nearest:
+        nearest["distance_to_main_road"] = max(50, nearest["distance_to_transit"] - 50)
+    return DistanceFeatures(**nearest)
+
+
+# ============================================================================
+# Feature Tests
+# ============================================================================
+
+def test_places_to_columns_parses_missing_fields():
+    """Test missing location/rating/price map to NaN/NaN/-1 sentinels."""
+    columns = _places_to_columns([
+        _place("a", ["park"], lat=24.8, lon=67.0, rating=4.5, reviews=10, price_level=3),
+        _place("b", ["cafe"], rating=0),
+    ])
+
+    assert len(columns) == 2
+    assert columns.lats[0] == 24.8 and np.isnan(columns.lats[1])
+    assert columns.ratings[0] == 4.5 and np.isnan(columns.ratings[1])
+    assert columns.reviews.tolist() == [10, 0]
+    assert columns.price_levels.tolist() == [3, -1]
+    assert columns.types[1] == frozenset({"cafe"})
+
+
+def test_density_features_match_reference(generator, places):
+    """Test bucket counts match the per-place reference (one count per bucket)."""
+    density = generator._compute_density_features(_places_to_columns(places))
+
+    assert density == _reference_density(places)
+
+
+def test_distance_features_match_haversine_reference(generator, places):
+    """Test the bitset/equirectangular nearest search matches per-place haversine."""
+    distance = generator._compute_distance_features(
+        CENTER[0], CENTER[1], _places_to_columns(places), 500
+    )
+
+    assert distance == _reference_distance(generator, places)
+    assert min(distance.to_dict().values()) >= 0  # Every feature was exercised
+
+
+def test_missing_amenity_types_report_minus_one(generator):
+    """Test features without a matching (located) place stay at -1."""
+    columns = _places_to_columns([
+        _place("park", ["park"], lat=CENTER[0] + 0.001, lon=CENTER[1]),
+        _place("mall-no-location", ["shopping_mall"]),
+        _place("cafe", ["cafe"], lat=CENTER[0], lon=CENTER[1] + 0.001),
+    ])
+
+    distance = generator._compute_distance_features(CENTER[0], CENTER[1], columns, 500)
+
+    assert distance.distance_to_park == pytest.approx(111.2, abs=0.1)
+    assert distance.distance_to_mall == -1
+    assert distance.distance_to_transit == -1
+    assert distance.distance_to_main_road == -1  # Derived from transit
+    assert distance.distance_to_cinema == -1
+
+
+def test_no_located_places_gives_default_distances(generator):
+    """Test an all-unlocated place list yields the all -1 defaults."""
+    columns = _places_to_columns([_place("mall", ["shopping_mall"])])
+
+    assert generator._compute_distance_features(CENTER[0], CENTER[1], columns, 500) == DistanceFeatures()
+
+
+def test_nearest_per_type_omits_missing_features():
+    """Test _nearest_per_type only reports features some place matches."""
+    columns = _places_to_columns([
+        _place("far-park", ["park"], lat=CENTER[0] + 0.005, lon=CENTER[1]),
+        _place("near-park", ["park", "bus_station"], lat=CENTER[0] + 0.001, lon=CENTER[1]),
+    ])
+
+    nearest = _nearest_per_type(
+        CENTER[0], CENTER[1], columns.lats, columns.lons, columns.feature_bits
+    )
+
+    assert set(nearest) == {"distance_to_park", "distance_to_transit"}
+    assert nearest["distance_to_park"] == nearest["distance_to_transit"]
+
+
+# ============================================================================
+# Places Request Tests
+# ============================================================================
+
+class _StubPlaces:
+    """places_nearby stub returning (or raising) queued outcomes."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def places_nearby(self, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _use_stub(generator, monkeypatch, outcomes):
+    stub = _StubPlaces(outcomes)
+    monkeypatch.setattr(generator, "_client", lambda: stub)
+    return stub
+
+
+def test_fetch_next_page_retries_until_token_is_ready(generator, monkeypatch):
+    """Test INVALID_REQUEST is retried with doubling delays."""
+    page = {"results": [{"place_id": "p2"}]}
+    stub = _use_stub(generator, monkeypatch, [
+        ApiError("INVALID_REQUEST"), ApiError("INVALID_REQUEST"), page,
+    ])
+
+    with patch.object(bev_generator.time, "sleep") as sleep:
+        response, api_calls = generator._fetch_next_page("token")
+
+    assert response == page
+    assert api_calls == 3
+    assert stub.calls == [{"page_token": "token"}] * 3
+    assert [c.args[0] for c in sleep.call_args_list] == [
+        PLACES_PAGE_TOKEN_DELAY, PLACES_PAGE_TOKEN_DELAY * 2, PLACES_PAGE_TOKEN_DELAY * 4,
+    ]
+
+
+def test_fetch_next_page_gives_up_after_max_attempts(generator, monkeypatch):
+    """Test the token is abandoned after PLACES_PAGE_TOKEN_RETRIES attempts."""
+    stub = _use_stub(generator, monkeypatch, [ApiError("INVALID_REQUEST")] * 10)
+
+    with patch.object(bev_generator.time, "sleep"):
+        with pytest.raises(ApiError):
+            generator._fetch_next_page("token")
+
+    assert PLACES_PAGE_TOKEN_RETRIES == 4
+    assert len(stub.calls) == PLACES_PAGE_TOKEN_RETRIES
+
+
+def test_fetch_next_page_raises_other_errors_immediately(generator, monkeypatch):
+    """Test non-token errors are not retried."""
+    stub = _use_stub(generator, monkeypatch, [ApiError("OVER_QUERY_LIMIT")])
+
+    with patch.object(bev_generator.time, "sleep"):
+        with pytest.raises(ApiError):
+            generator._fetch_next_page("token")
+
+    assert len(stub.calls) == 1
+
+
+def test_nearby_search_counts_every_api_call(generator, monkeypatch):
+    """Test pagination and token retries are all counted as API calls."""
+    _use_stub(generator, monkeypatch, [
+        {"results": [{"place_id": "p1"}], "next_page_token": "t1"},
+        ApiError("INVALID_REQUEST"),
+        {"results": [{"place_id": "p2"}], "next_page_token": "t2"},
+        {"results": [{"place_id": "p3"}], "next_page_token": "t3"},  # Third page: stop
+    ])
+
+    with patch.object(bev_generator.time, "sleep"):
+        results, api_calls = generator._nearby_search(24.8, 67.0, 500, "cafe")
+
+    assert [p["place_id"] for p in results] == ["p1", "p2", "p3"]
+    assert api_calls == 4
+
+
+def test_cached_nearby_search_hits_and_misses(generator, monkeypatch, tmp_path):
+    """Test memory/disk cache hits make no API calls and empty results are not cached."""
+    stub = _use_stub(generator, monkeypatch, [
+        {"results": [{"place_id": "p1"}]},
+        {"results": []},
+        {"results": []},
+    ])
+
+    assert generator._cached_nearby_search(24.8, 67.0, 500, "cafe") == ([{"place_id": "p1"}], 1)
+    assert generator._cached_nearby_search(24.8, 67.0, 500, "cafe") == ([{"place_id": "p1"}], 0)
+
+    fresh = BEVGenerator(api_key="AIza-test")  # Empty memory: served from disk
+    monkeypatch.setattr(fresh, "_client", lambda: stub)
+    assert fresh._cached_nearby_search(24.8, 67.0, 500, "cafe") == ([{"place_id": "p1"}], 0)
+
+    assert generator._cached_nearby_search(24.8, 67.0, 500, "gym") == ([], 1)
+    assert generator._cached_nearby_search(24.8, 67.0, 500, "gym") == ([], 1)  # Not cached
+    assert len(stub.calls) == 3
+    assert len(list(tmp_path.glob("*.json"))) == 1
@@ -32,9 +32,12 @@ from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
+from src.services import geospatial_service
 from src.services.geospatial_service import (
     GeospatialService,
     KARACHI_BOUNDS,
+    get_geospatial_service,
+    init_geospatial_service,
 )
 from src.database.models import Base, GridCellModel
 
@@ -479,6 +482,18 @@ def test_list_grids_case_insensitive(populated_db):
         assert grids_lower == grids_upper == grids_mixed
 
 
+def test_count_grids_matches_list_grids(populated_db):
+    """Test cached per-neighborhood counts match list_grids()."""
+    with patch('src.services.geospatial_service.get_session', mock_get_session(populated_db)):
+        service = GeospatialService()
+        
+        for neighborhood in service.get_neighborhoods() + ["dha phase 2", "Unknown", None]:
+            assert service.count_grids(neighborhood) == len(service.list_grids(neighborhood))
+        
+        service.reload_grids()
+        assert service.count_grids("DHA Phase 2") == 2
+
+
 def test_get_neighborhoods(populated_db):
     """Test retrieving unique neighborhoods."""
     with patch('src.services.geospatial_service.get_session', mock_get_session(populated_db)):
@@ -545,6 +560,17 @@ def test_assign_grid_id_before_initialization():
         service.assign_grid_id(24.8278, 67.0595)
 
 
+def test_init_geospatial_service_preloads_singleton(populated_db):
+    """Test init_geospatial_service() builds the singleton get_geospatial_service() returns."""
+    with patch.object(geospatial_service, '_service_instance', None), \
+         patch('src.services.geospatial_service.get_session', mock_get_session(populated_db)):
+        service = init_geospatial_service()
+
+        assert service.is_initialized()
+        assert init_geospatial_service() is service
+        assert get_geospatial_service() is service
+
+
 def test_polygon_at_exact_corner(populated_db):
     """Test point at exact corner of grid."""
     with patch('src.services.geospatial_service.get_session', mock_get_session(populated_db)):
@@ -631,6 +657,70 @@ def test_assign_performance_multiple_calls(populated_db):
         assert duration < 0.1, f"100 assignments took {duration:.3f}s (should be < 0.1s)"
 
 
+
+def test_bbox_lookup_matches_linear_scan(populated_db):
+    """Test spatial-hash lookups agree with a first-match linear polygon scan."""
+    from shapely.geometry import Point
+
+    with patch('src.services.geospatial_service.get_session', mock_get_session(populated_db)):
+        service = GeospatialService()
+
+        for i in range(40):
+            for j in range(40):
+                lat = 24.8050 + i * 0.0009
+                lon = 67.0250 + j * 0.0011
+                point = Point(lon, lat)
+                expected = next(
+                    (grid_id for grid_id, polygon in service._grid_list if polygon.contains(point)),
+                    None
+                )
+                assert service.assign_grid_id(lat, lon) == expected
+
+
+
+def test_spatial_hash_finds_oversized_grid(populated_db):
+    """Test a grid spanning many hash cells is found from each of them."""
+    session = populated_db()
+    session.add(GridCellModel(
+        grid_id="Large-Cell",
+        neighborhood="Test Large",
+        lat_center=Decimal("24.8700"),
+        lon_center=Decimal("67.1000"),
+        lat_north=Decimal("24.9000"),
+        lat_south=Decimal("24.8400"),
+        lon_east=Decimal("67.1300"),
+        lon_west=Decimal("67.0700"),
+        area_km2=Decimal("50.0"),
+    ))
+    session.commit()
+    session.close()
+
+    with patch('src.services.geospatial_service.get_session', mock_get_session(populated_db)):
+        service = GeospatialService()
+
+        assert len(service._cells) > len(service.grids)
+        for lat, lon in [(24.8401, 67.0701), (24.8700, 67.1000), (24.8999, 67.1299)]:
+            assert service.assign_grid_id(lat, lon) == "Large-Cell"
+        assert service.assign_grid_id(24.9001, 67.1000) is None
+
+
+def test_assign_grid_ids_matches_single_lookups(populated_db):
+    """Test batch assignment agrees point-for-point with assign_grid_id()."""
+    lats = [24.8050 + i * 0.0009 for i in range(40) for _ in range(40)]
+    lons = [67.0250 + j * 0.0011 for _ in range(40) for j in range(40)]
+
+    with patch('src.services.geospatial_service.get_session', mock_get_session(populated_db)):
+        service = GeospatialService()
+
+        with patch('src.services.geospatial_service.ASSIGN_BATCH_SIZE', 7):  # Exercise chunking
+            batch = service.assign_grid_ids(lats, lons)
+
+        assert batch.tolist() == [service.assign_grid_id(lat, lon) for lat, lon in zip(lats, lons)]
+
+        with pytest.raises(ValueError):
+            service.assign_grid_ids([24.8, 91.0], [67.0, 67.0])
+
+
 # ============================================================================
 # Realistic Karachi Coordinates Tests
 # ============================================================================
@@ -0,0 +1,429 @@
+"""
+Unit Tests for LLM Evaluator
+
+Exercises LLMEvaluator against fake Groq clients (no network):
+
+Test Coverage:
+- Evaluation cache hands out independent copies (memory and disk hits)
+- Async cache lookups read the disk off the event loop
+- Rate limiter and evaluate_batch_async() request spacing and result slots
+- evaluate_stream_async(): partial result first, fallback model, salvaged text,
+  chunks without a usage attribute
+- Fallback-model and truncation retries in evaluate() and evaluate_async()
+
+Usage:
+    pytest tests/services/test_llm_evaluator.py -v
+"""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from groq import APITimeoutError, RateLimitError
+
+from src.services import llm_evaluator
+from src.services.bev_generator import BusinessEnvironmentVector
+from src.services.llm_evaluator import (
+    LLMEvaluator,
+    _AsyncRateLimiter,
+    DEFAULT_MODEL,
+    EXTRACTED_REASONING,
+    FALLBACK_MAX_TOKENS,
+    FALLBACK_MODEL,
+    TRUNCATION_RETRY_MAX_TOKENS,
+)
+
+
+# ============================================================================
+# Fake Groq Clients
+# ============================================================================
+
+def _completion(gym=0.7, cafe=0.4, finish_reason="stop", content=None):
+    """Chat completion shaped like the Groq SDK response."""
+    if content is None:
+        content = json.dumps({
+            "gym_probability": gym,
+            "cafe_probability": cafe,
+            "gym_reasoning": "Offices nearby",
+            "cafe_reasoning": "Busy street",
+            "key_factors": ["offices"],
+            "risks": ["competition"],
+            "recommendation": "Gym",
+        })
+    return SimpleNamespace(
+        choices=[SimpleNamespace(
+            message=SimpleNamespace(content=content),
+            finish_reason=finish_reason,
+        )],
+        usage=SimpleNamespace(
+            total_tokens=120, prompt_tokens=100, completion_tokens=20,
+            prompt_tokens_details=None,
+        ),
+    )
+
+
+class _FakeCompletions:
+    """Returns (or raises) queued outcomes and records every request."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def _next(self, kwargs):
+        self.requests.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def create(self, **kwargs):
+        return self._next(kwargs)
+
+
+class _FakeAsyncCompletions(_FakeCompletions):
+    async def create(self, **kwargs):
+        await asyncio.sleep(0)
+        return self._next(kwargs)
+
+
+def _stream(*pieces, total_tokens=150, usage_field=True):
+    """
+    Async iterator of streamed chunks; usage arrives on the last one.
+
+    usage_field=False mimics older SDK chunk models with no usage attribute.
+    """
+    async def chunks():
+        for i, piece in enumerate(pieces):
+            last = i == len(pieces) - 1
+            chunk = SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))],
+                x_groq=SimpleNamespace(usage=SimpleNamespace(total_tokens=total_tokens)) if last else None,
+            )
+            if usage_field:
+                chunk.usage = None
+            yield chunk
+    return chunks()
+
+
+_GROQ_REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+
+
+def _rate_limit_error():
+    return RateLimitError(
+        "rate limited", response=httpx.Response(429, request=_GROQ_REQUEST), body=None
+    )
+
+
+def _timeout_error():
+    return APITimeoutError(request=_GROQ_REQUEST)
+
+
+def _client(completions):
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+@pytest.fixture
+def evaluator(tmp_path, monkeypatch):
+    """Evaluator with its disk cache in a temp dir."""
+    monkeypatch.setattr(llm_evaluator, "LLM_CACHE_DIR", tmp_path)
+    return LLMEvaluator(api_key="test")
+
+
+@pytest.fixture
+def bev():
+    return BusinessEnvironmentVector(grid_id="grid-1", center_lat=24.8, center_lon=67.0)
+
+
+# ============================================================================
+# Cache Tests
+# ============================================================================
+
+def test_cache_hands_out_independent_copies(evaluator, bev):
+    """Test mutating a returned result never changes what the cache serves."""
+    evaluator.async_client = _client(_FakeAsyncCompletions([_completion()]))
+
+    first = asyncio.run(evaluator.evaluate_async(bev))
+    first.key_factors.append("mutated")
+    first.gym_probability = 0.0
+    second = asyncio.run(evaluator.evaluate_async(bev))
+    second.recommendation = "mutated"
+    third = asyncio.run(evaluator.evaluate_async(bev))
+
+    assert len(evaluator.async_client.chat.completions.requests) == 1
+    assert third.gym_probability == 0.7
+    assert third.recommendation == "Gym"
+    assert "mutated" not in third.key_factors
+
+
+def test_disk_cache_hit_returns_copy(evaluator, bev):
+    """Test disk hits are served to a fresh evaluator as independent copies."""
+    evaluator.client = _client(_FakeCompletions([_completion()]))
+    evaluator.evaluate(bev)
+
+    fresh = LLMEvaluator(api_key="test")
+    fresh.client = _client(_FakeCompletions([]))  # Any API call would fail
+    from_disk = fresh.evaluate(bev)
+    from_disk.gym_probability = 0.0
+
+    assert fresh.evaluate(bev).gym_probability == 0.7
+
+
+def test_async_disk_lookup_runs_off_event_loop(evaluator, bev, monkeypatch):
+    """Test evaluate_async() reads the disk cache in a worker thread."""
+    evaluator.client = _client(_FakeCompletions([_completion()]))
+    evaluator.evaluate(bev)
+    evaluator._memory_cache.clear()
+
+    threads = []
+    disk_cache_get = evaluator._disk_cache_get
+
+    def recording_disk_cache_get(key):
+        threads.append(threading.get_ident())
+        return disk_cache_get(key)
+
+    monkeypatch.setattr(evaluator, "_disk_cache_get", recording_disk_cache_get)
+    evaluator.async_client = _client(_FakeAsyncCompletions([]))
+
+    async def run():
+        return threading.get_ident(), await evaluator.evaluate_async(bev)
+
+    loop_thread, result = asyncio.run(run())
+
+    assert result.gym_probability == 0.7
+    assert threads and threads[0] != loop_thread
+
+
+# ============================================================================
+# Batch Evaluation Tests
+# ============================================================================
+
+def _bevs(count):
+    """BEVs with distinct prompts (the location is part of the prompt)."""
+    return [
+        BusinessEnvironmentVector(grid_id=f"grid-{i}", center_lat=24.1 + i / 10, center_lon=67.0)
+        for i in range(count)
+    ]
+
+
+def _prompt(request):
+    return request["messages"][-1]["content"]
+
+
+def test_rate_limiter_spaces_request_starts():
+    """Test concurrent waiters are released 60/qpm seconds apart."""
+    async def run():
+        limiter = _AsyncRateLimiter(qpm=1200)  # One start per 0.05s
+        released = []
+
+        async def waiter():
+            await limiter.wait()
+            released.append(asyncio.get_running_loop().time())
+
+        await asyncio.gather(*(waiter() for _ in range(4)))
+        return released
+
+    released = sorted(asyncio.run(run()))
+    gaps = [b - a for a, b in zip(released, released[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+
+
+def test_batch_spaces_requests_at_qpm(tmp_path, monkeypatch):
+    """Test evaluate_batch_async() starts requests no faster than qpm allows."""
+    monkeypatch.setattr(llm_evaluator, "LLM_CACHE_DIR", tmp_path)
+    evaluator = LLMEvaluator(api_key="test", use_cache=False)
+    started_at = []
+
+    async def create(**request):
+        started_at.append(time.monotonic())
+        return _completion()
+
+    evaluator.async_client = _client(SimpleNamespace(create=create))
+
+    results = asyncio.run(evaluator.evaluate_batch_async(_bevs(4), qpm=1200))
+
+    gaps = [b - a for a, b in zip(started_at, started_at[1:])]
+    assert len(results) == 4
+    assert all(gap >= 0.045 for gap in gaps)
+
+
+def test_batch_fallback_results_keep_their_slot(evaluator, monkeypatch):
+    """Test failed evaluations yield the fallback result in the failing BEV's slot."""
+    async def create(**request):
+        if "(24.200000" in _prompt(request):
+            raise RuntimeError("upstream exploded")
+        return _completion(gym=0.9)
+
+    evaluator.async_client = _client(SimpleNamespace(create=create))
+    bevs = _bevs(4)
+    evaluate_async = evaluator.evaluate_async
+
+    async def flaky_evaluate_async(bev, temperature=0.3):
+        if bev.grid_id == "grid-3":
+            raise ValueError("evaluate_async raised")
+        return await evaluate_async(bev, temperature)
+
+    monkeypatch.setattr(evaluator, "evaluate_async", flaky_evaluate_async)
+
+    results = asyncio.run(evaluator.evaluate_batch_async(bevs))
+
+    assert [r.gym_probability for r in results] == [0.9, 0.5, 0.9, 0.5]
+    assert results[1].key_factors == ["fallback_mode"]
+    assert "upstream exploded" in results[1].gym_reasoning
+    assert "evaluate_async raised" in results[3].gym_reasoning
+
+
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+def _collect(evaluator, bev):
+    async def run():
+        return [result async for result in evaluator.evaluate_stream_async(bev)]
+    return asyncio.run(run())
+
+
+def test_stream_yields_partial_before_complete(evaluator, bev):
+    """Test probabilities are yielded before the reasoning has streamed in."""
+    pieces = [
+        '{"gym_probability": 0.8',
+        ', "cafe_probability": 0.3',
+        ', "gym_reasoning": "Offices", "cafe_reasoning": "Quiet",',
+        ' "key_factors": ["offices"], "risks": [], "recommendation": "Gym"}',
+    ]
+    consumed = []
+
+    async def tracked_stream():
+        async for chunk in _stream(*pieces):
+            consumed.append(chunk)
+            yield chunk
+
+    evaluator.async_client = _client(_FakeAsyncCompletions([tracked_stream()]))
+
+    async def run():
+        seen = []
+        async for result in evaluator.evaluate_stream_async(bev):
+            seen.append((result, len(consumed)))
+        return seen
+
+    (partial, chunks_at_partial), (complete, _) = asyncio.run(run())
+
+    assert chunks_at_partial < len(pieces)
+    assert (partial.gym_probability, partial.cafe_probability) == (0.8, 0.3)
+    assert partial.gym_reasoning == "" and partial.key_factors == []
+    assert complete.gym_reasoning == "Offices"
+    assert complete.tokens_used == 150
+    assert evaluator.async_client.chat.completions.requests[0]["stream"] is True
+
+
+def test_stream_chunks_without_usage_attribute(evaluator, bev):
+    """Test chunks lacking .usage (older SDKs) still parse instead of degrading to fallback."""
+    evaluator.async_client = _client(_FakeAsyncCompletions([
+        _stream(_completion(gym=0.7).choices[0].message.content, usage_field=False),
+    ]))
+
+    results = _collect(evaluator, bev)
+
+    assert results[-1].gym_probability == 0.7
+    assert results[-1].model_used == DEFAULT_MODEL
+    assert results[-1].tokens_used == 150
+
+
+@pytest.mark.parametrize("error", [_rate_limit_error(), _timeout_error()])
+def test_stream_falls_back_to_smaller_model(evaluator, bev, error):
+    """Test a rate-limited/timed-out stream is answered once by FALLBACK_MODEL, uncached."""
+    completions = _FakeAsyncCompletions([error, _completion(gym=0.6)])
+    evaluator.async_client = _client(completions)
+
+    results = _collect(evaluator, bev)
+
+    first, second = completions.requests
+    assert first["model"] == DEFAULT_MODEL
+    assert second["model"] == FALLBACK_MODEL
+    assert second["max_tokens"] == FALLBACK_MAX_TOKENS
+    assert "stream" not in second
+    assert len(results) == 1
+    assert results[0].model_used == FALLBACK_MODEL
+    assert results[0].gym_probability == 0.6
+    assert len(evaluator._memory_cache) == 0
+
+
+def test_stream_does_not_cache_salvaged_text(evaluator, bev, tmp_path):
+    """Test non-JSON streamed answers are salvaged but never cached."""
+    evaluator.async_client = _client(_FakeAsyncCompletions([
+        _stream("Gym probability: 0.65, ", "cafe probability: 0.35 overall"),
+    ]))
+
+    results = _collect(evaluator, bev)
+
+    assert len(results) == 1  # No partial: the strict JSON pattern never matched
+    assert results[0].gym_reasoning == EXTRACTED_REASONING
+    assert (results[0].gym_probability, results[0].cafe_probability) == (0.65, 0.35)
+    assert len(evaluator._memory_cache) == 0
+    assert not list(tmp_path.glob("*.json"))
+
+
+# ============================================================================
+# Retry Tests (sync and async paths)
+# ============================================================================
+
+def _evaluate(evaluator, bev, outcomes, path):
+    """Run evaluate() or evaluate_async() against queued fake outcomes."""
+    if path == "sync":
+        completions = _FakeCompletions(outcomes)
+        evaluator.client = _client(completions)
+        result = evaluator.evaluate(bev, temperature=0.3)
+    else:
+        completions = _FakeAsyncCompletions(outcomes)
+        evaluator.async_client = _client(completions)
+        result = asyncio.run(evaluator.evaluate_async(bev, temperature=0.3))
+    return result, completions.requests
+
+
+@pytest.mark.parametrize("path", ["sync", "async"])
+@pytest.mark.parametrize("error", [_rate_limit_error(), _timeout_error()])
+def test_primary_failure_retries_on_fallback_model(evaluator, bev, tmp_path, path, error):
+    """Test rate limits/timeouts retry once on FALLBACK_MODEL and are not cached."""
+    result, requests = _evaluate(evaluator, bev, [error, _completion(gym=0.6)], path)
+
+    first, second = requests
+    assert first["model"] == DEFAULT_MODEL
+    assert second["model"] == FALLBACK_MODEL
+    assert second["max_tokens"] == FALLBACK_MAX_TOKENS
+    assert second["temperature"] == first["temperature"] == 0.3
+    assert second["messages"] == first["messages"]
+    assert result.model_used == FALLBACK_MODEL
+    assert result.gym_probability == 0.6
+    assert len(evaluator._memory_cache) == 0
+    assert not list(tmp_path.glob("*.json"))
+
+
+@pytest.mark.parametrize("path", ["sync", "async"])
+def test_fallback_model_failure_is_not_retried(tmp_path, monkeypatch, bev, path):
+    """Test an evaluator already on FALLBACK_MODEL returns the neutral result."""
+    monkeypatch.setattr(llm_evaluator, "LLM_CACHE_DIR", tmp_path)
+    evaluator = LLMEvaluator(api_key="test", model=FALLBACK_MODEL)
+
+    result, requests = _evaluate(evaluator, bev, [_rate_limit_error()], path)
+
+    assert len(requests) == 1
+    assert result.key_factors == ["fallback_mode"]
+
+
+@pytest.mark.parametrize("path", ["sync", "async"])
+def test_truncated_response_is_retried_with_larger_budget(evaluator, bev, path):
+    """Test finish_reason="length" retries once with more tokens, lower temperature."""
+    truncated = _completion(content='{"gym_probability": 0.2, "cafe_prob', finish_reason="length")
+
+    result, requests = _evaluate(evaluator, bev, [truncated, _completion(gym=0.75)], path)
+
+    first, second = requests
+    assert second["model"] == first["model"] == DEFAULT_MODEL
+    assert second["max_tokens"] == TRUNCATION_RETRY_MAX_TOKENS
+    assert second["temperature"] == pytest.approx(0.15)
+    assert result.gym_probability == 0.75
+    assert result.model_used == DEFAULT_MODEL
+    assert len(evaluator._memory_cache) == 1  # Primary-model answers are cached
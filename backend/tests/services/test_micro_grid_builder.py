@@ -0,0 +1,158 @@
+"""
+Unit Tests for Micro Grid Builder
+
+Test Coverage:
+- MicroGridTable iteration/indexing matches generate_grids_for_sector()
+- to_db_records() matches MicroGrid.to_db_dict()
+- iter_grids_for_sector() streams the same cells and validates eagerly
+- get_grid_summary() and calculate_coverage() accept a MicroGridTable
+- validate_no_overlap() detects an overlapping cell
+- Scalar helpers return JSON-serializable floats; arrays stay arrays
+
+Usage:
+    pytest tests/services/test_micro_grid_builder.py -v
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import orjson
+import pytest
+
+from src.services.micro_grid_builder import (
+    MicroGridBuilder,
+    MicroGridTable,
+    calculate_grid_area,
+    meters_to_lon_degrees,
+)
+
+
+SECTOR_ID = "Clifton-Block2"
+BOUNDS = {
+    "lat_north": 24.8220,
+    "lat_south": 24.8100,
+    "lon_east": 67.0360,
+    "lon_west": 67.0200,
+}
+
+
+@pytest.fixture
+def builder():
+    return MicroGridBuilder(cell_size_meters=100)
+
+
+def _without_timestamp(record: dict) -> dict:
+    """Drop created_at, which differs between separately generated grids."""
+    return {key: value for key, value in record.items() if key != "created_at"}
+
+
+# ============================================================================
+# MicroGridTable Tests
+# ============================================================================
+
+def test_table_matches_generated_grids(builder):
+    """Test iterating and indexing a table gives the same cells as the list API."""
+    grids = builder.generate_grids_for_sector(SECTOR_ID, BOUNDS)
+    table = builder.generate_table(SECTOR_ID, BOUNDS)
+
+    assert isinstance(table, MicroGridTable)
+    assert len(table) == len(grids) > 1
+    assert [_without_timestamp(g.to_dict()) for g in table] == [
+        _without_timestamp(g.to_dict()) for g in grids
+    ]
+    assert _without_timestamp(table[-1].to_dict()) == _without_timestamp(grids[-1].to_dict())
+
+
+def test_table_rejects_slices(builder):
+    """Test slicing a table raises TypeError instead of failing inside NumPy."""
+    table = builder.generate_table(SECTOR_ID, BOUNDS)
+
+    with pytest.raises(TypeError):
+        table[1:3]
+
+
+def test_to_db_records_matches_to_db_dict(builder):
+    """Test to_db_records() yields exactly the rows MicroGrid.to_db_dict() builds."""
+    grids = builder.generate_grids_for_sector(SECTOR_ID, BOUNDS)
+    table = builder.generate_table(SECTOR_ID, BOUNDS)
+
+    records = list(table.to_db_records())
+
+    assert [_without_timestamp(r) for r in records] == [
+        _without_timestamp(g.to_db_dict()) for g in grids
+    ]
+    assert records == [g.to_db_dict() for g in table]
+
+
+def test_summary_and_coverage_accept_table(builder):
+    """Test get_grid_summary() and calculate_coverage() agree for a table and a list."""
+    grids = builder.generate_grids_for_sector(SECTOR_ID, BOUNDS)
+    table = builder.generate_table(SECTOR_ID, BOUNDS)
+
+    list_summary = builder.get_grid_summary(grids)
+    table_summary = builder.get_grid_summary(table)
+
+    # Table areas are unrounded, so totals differ only in the last decimals
+    assert table_summary.pop("total_area_m2") == pytest.approx(list_summary.pop("total_area_m2"))
+    assert table_summary == list_summary
+    assert builder.calculate_coverage(table, BOUNDS) == pytest.approx(
+        builder.calculate_coverage(grids, BOUNDS), abs=0.01
+    )
+    assert builder.calculate_coverage(table, BOUNDS) >= 100
+
+
+def test_iter_grids_for_sector_matches_list(builder):
+    """Test iter_grids_for_sector() yields the list API's cells lazily, validating on call."""
+    grids = builder.generate_grids_for_sector(SECTOR_ID, BOUNDS)
+
+    cells = builder.iter_grids_for_sector(SECTOR_ID, BOUNDS)
+
+    assert not isinstance(cells, list)
+    assert [_without_timestamp(g.to_dict()) for g in cells] == [
+        _without_timestamp(g.to_dict()) for g in grids
+    ]
+    with pytest.raises(ValueError):
+        builder.iter_grids_for_sector(SECTOR_ID, {**BOUNDS, "lat_north": BOUNDS["lat_south"]})
+
+
+# ============================================================================
+# Overlap Validation Tests
+# ============================================================================
+
+def test_validate_no_overlap(builder):
+    """Test generated grids pass and a cell shifted half a step onto its neighbor fails."""
+    grids = builder.generate_grids_for_sector(SECTOR_ID, BOUNDS)
+    assert builder.validate_no_overlap(grids)
+
+    cell = grids[0]
+    half_lon = (cell.lon_east - cell.lon_west) / 2
+    shifted = replace(
+        cell,
+        grid_id=f"{SECTOR_ID}-overlap",
+        lon_west=cell.lon_west + half_lon,
+        lon_east=cell.lon_east + half_lon,
+    )
+
+    assert not builder.validate_no_overlap(grids + [shifted])
+
+
+# ============================================================================
+# Helper Function Tests
+# ============================================================================
+
+def test_scalar_helpers_return_plain_floats():
+    """Test scalar inputs give floats orjson can serialize, array inputs give arrays."""
+    lon_degrees = meters_to_lon_degrees(100, 24.8)
+    area = calculate_grid_area(
+        BOUNDS["lat_north"], BOUNDS["lat_south"], BOUNDS["lon_east"], BOUNDS["lon_west"]
+    )
+
+    assert type(lon_degrees) is float
+    assert type(area) is float
+    assert orjson.loads(orjson.dumps({"lon": lon_degrees, "area": area})) == {
+        "lon": lon_degrees, "area": area
+    }
+
+    lon_array = meters_to_lon_degrees(np.array([100.0, 200.0]), 24.8)
+    assert isinstance(lon_array, np.ndarray)
+    assert lon_array[1] == pytest.approx(2 * lon_degrees)
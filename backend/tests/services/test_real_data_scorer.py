@@ -0,0 +1,100 @@
+"""
+Unit Tests for Real Data Scorer
+
+Test Coverage:
+- Per-category constants are precomputed by name (unknown categories use Gym's)
+- Non-positive review thresholds are rejected at construction
+- Batch score_all_grids() matches per-grid score_grid() exactly
+
+Usage:
+    pytest tests/services/test_real_data_scorer.py -v
+"""
+
+import math
+import random
+
+import pytest
+
+from src.services.real_data_scorer import (
+    RealDataScorer,
+    CATEGORY_CONFIG,
+)
+
+
+@pytest.fixture
+def scorer():
+    return RealDataScorer()
+
+
+# ============================================================================
+# Category Constants Tests
+# ============================================================================
+
+def test_category_constants(scorer):
+    """Test constants match the category config and unknown categories fall back to Gym."""
+    cafe = scorer._constants("Cafe")
+
+    assert cafe.inv_log_denom == pytest.approx(
+        1.0 / math.log10(1 + CATEGORY_CONFIG["Cafe"]["ideal_review_threshold"] * 10)
+    )
+    assert cafe.weight_boost == CATEGORY_CONFIG["Cafe"]["weight_boost"]
+    assert scorer._constants("Bookstore") == scorer._constants("Gym")
+
+
+@pytest.mark.parametrize("threshold", [0, -10])
+def test_non_positive_review_threshold_rejected(threshold):
+    """Test a zero/negative ideal_review_threshold raises ValueError naming the category."""
+    config = {"Gym": {**CATEGORY_CONFIG["Gym"], "ideal_review_threshold": threshold}}
+
+    with pytest.raises(ValueError, match="ideal_review_threshold for Gym"):
+        RealDataScorer(category_config=config)
+
+
+# ============================================================================
+# Batch Scoring Tests
+# ============================================================================
+
+def _random_businesses(rng: random.Random) -> list:
+    """Businesses with missing, zero and extreme ratings/review counts."""
+    return [
+        {
+            "rating": rng.choice([None, 0.0, 1.0, 2.5, 3.7, 4.2, 5.0, rng.uniform(1, 5)]),
+            "total_ratings": rng.choice([None, 0, 1, 99, 1000, rng.randrange(10000)]),
+        }
+        if rng.random() < 0.9 else {}
+        for _ in range(rng.choice([0, 0, 1, 2, 3, 5, 8, 13]))
+    ]
+
+
+@pytest.mark.parametrize("category", ["Gym", "Cafe", "Bookstore"])
+def test_score_all_grids_matches_score_grid(scorer, category):
+    """Test the NumPy batch path gives score_grid()'s result for every grid."""
+    rng = random.Random(7)
+    grid_businesses = {f"grid-{i}": _random_businesses(rng) for i in range(300)}
+    grid_businesses["grid-empty"] = []
+    max_count = max(len(b) for b in grid_businesses.values())
+
+    results = scorer.score_all_grids(grid_businesses, category)
+
+    assert len(results) == len(grid_businesses)
+    scores = [r.opportunity_score for r in results]
+    assert scores == sorted(scores, reverse=True)
+    for result in results:
+        expected = scorer.score_grid(
+            result.grid_id, grid_businesses[result.grid_id], category, max_count,
+            calculated_at=result.calculated_at
+        )
+        assert result == expected
+
+
+def test_score_all_grids_without_businesses(scorer):
+    """Test grids with zero businesses everywhere all get the maximum score."""
+    grid_businesses = {"grid-1": [], "grid-2": []}
+
+    results = scorer.score_all_grids(grid_businesses, "Gym")
+
+    for result in results:
+        assert result.opportunity_score == 1.0
+        assert result == scorer.score_grid(
+            result.grid_id, [], "Gym", 1, calculated_at=result.calculated_at
+        )
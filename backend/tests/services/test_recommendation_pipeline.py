@@ -0,0 +1,149 @@
+"""
+Unit Tests for Recommendation Pipeline
+
+Tests the async pipeline orchestration with stubbed rule and LLM steps
+(no Google Places or Groq traffic).
+
+Test Coverage:
+- arecommend() runs the rule engine and the LLM request concurrently
+- arecommend_batch() caps concurrent Places calls and rate-limits Groq
+
+Usage:
+    pytest tests/services/test_recommendation_pipeline.py -v
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import bev_generator
+from src.services.bev_generator import (
+    BEVGenerator,
+    BusinessEnvironmentVector,
+    NEARBY_SEARCH_TYPES,
+    NEARBY_SEARCH_WORKERS,
+)
+from src.services.llm_evaluator import LLMEvaluator
+from src.services.recommendation_pipeline import RecommendationPipeline, PipelineMode
+from src.services.rule_engine import RuleEvaluationResult
+
+
+STEP_SECONDS = 0.1
+
+
+class _StubLLMEvaluator:
+    """Async LLM stub that records when each request starts."""
+
+    def __init__(self):
+        self.started_at = []
+
+    async def evaluate_async(self, bev):
+        self.started_at.append(time.perf_counter())
+        await asyncio.sleep(STEP_SECONDS)
+        return RecommendationPipeline._llm_fallback_result()
+
+
+@pytest.fixture
+def pipeline():
+    """Pipeline with dummy API keys and a stubbed LLM evaluator."""
+    pipeline = RecommendationPipeline(google_api_key="AIza-test", groq_api_key="test")
+    pipeline.llm_evaluator = _StubLLMEvaluator()
+    return pipeline
+
+
+def test_arecommend_overlaps_rules_and_llm(pipeline):
+    """Test the LLM request starts before the rule engine finishes."""
+    rule_window = {}
+
+    def slow_rules(bev, mode):
+        rule_window["start"] = time.perf_counter()
+        time.sleep(STEP_SECONDS)  # Blocking CPU-style work
+        rule_window["end"] = time.perf_counter()
+        return RuleEvaluationResult(
+            gym_score=0.5, cafe_score=0.5, gym_rules_applied=[], cafe_rules_applied=[]
+        )
+
+    pipeline._evaluate_rules = slow_rules
+
+    start = time.perf_counter()
+    result = asyncio.run(pipeline.arecommend(
+        24.8, 67.0, grid_id="grid-1", mode=PipelineMode.FULL,
+        use_cached_bev=BusinessEnvironmentVector(grid_id="grid-1")
+    ))
+    elapsed = time.perf_counter() - start
+
+    assert pipeline.llm_evaluator.started_at[0] < rule_window["end"]
+    assert elapsed < 1.8 * STEP_SECONDS
+    assert result.grid_id == "grid-1"
+
+
+class _ConcurrencyTrackingPlaces:
+    """places_nearby stub recording the peak number of concurrent calls."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def places_nearby(self, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.005)
+        with self.lock:
+            self.active -= 1
+        return {"results": [{"place_id": f"{kwargs['type']}-{self.calls}"}]}
+
+
+def test_batch_caps_concurrent_places_calls(tmp_path, monkeypatch):
+    """Test concurrent BEVs share one bounded pool of Places searches."""
+    monkeypatch.setattr(bev_generator, "PLACES_CACHE_DIR", tmp_path)
+    places = _ConcurrencyTrackingPlaces()
+    monkeypatch.setattr(BEVGenerator, "_client", lambda self: places)
+    pipeline = RecommendationPipeline(google_api_key="AIza-test", groq_api_key="test")
+    locations = [{"lat": 24.80 + i / 100, "lon": 67.0} for i in range(8)]
+
+    results = asyncio.run(pipeline.arecommend_batch(
+        locations, mode=PipelineMode.FAST, concurrency=8
+    ))
+
+    assert len(results) == 8
+    assert places.calls == 8 * len(NEARBY_SEARCH_TYPES)
+    assert places.peak <= NEARBY_SEARCH_WORKERS
+
+
+def test_batch_llm_requests_are_rate_limited(monkeypatch):
+    """Test FULL-mode batch requests to Groq are spaced by the evaluator qpm."""
+    started_at = []
+
+    async def create(**request):
+        started_at.append(time.monotonic())
+        raise RuntimeError("offline")  # Evaluator falls back; timing is what matters
+
+    pipeline = RecommendationPipeline(google_api_key="AIza-test", groq_api_key="test")
+    pipeline.llm_evaluator = LLMEvaluator(api_key="test", use_cache=False, qpm=600)
+    pipeline.llm_evaluator.async_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    locations = [{"lat": 24.80 + i / 100, "lon": 67.0} for i in range(3)]
+    monkeypatch.setattr(
+        pipeline, "_agenerate_bev",
+        lambda lat, lon, radius, grid_id: _as_coroutine(
+            BusinessEnvironmentVector(grid_id=grid_id, center_lat=lat, center_lon=lon)
+        ),
+    )
+
+    asyncio.run(pipeline.arecommend_batch(locations, mode=PipelineMode.FULL))
+
+    gaps = [b - a for a, b in zip(started_at, started_at[1:])]
+    assert len(started_at) == 3
+    assert all(gap >= 0.09 for gap in gaps)  # 600 qpm = one start per 0.1s
+
+
+async def _as_coroutine(value):
+    return value
@@ -13,6 +13,7 @@ from src.services.scoring_service import (
     calculate_gos,
     calculate_confidence,
     score_grid,
+    score_all_grids,
     generate_rationale,
     get_top_posts,
     get_competitors,
@@ -832,3 +833,29 @@ class TestExplainability:
         # Should be between 2-5 km
         assert 2.0 < distance < 5.0, f"Expected 2-5 km, got {distance} km"
 
+
+class TestScoreAllGrids:
+    """Test the score_all_grids batch pipeline."""
+    
+    def test_refreshes_view_before_aggregating(self):
+        """Test grid_category_metrics is refreshed before the normalized read."""
+        calls = MagicMock()
+        metrics = {
+            "grid_id": "Cell-01", "business_count": 1,
+            "instagram_volume": 10, "reddit_mentions": 5,
+            "supply_norm": 0.5, "demand_instagram_norm": 1.0, "demand_reddit_norm": 1.0,
+        }
+        calls.aggregate.return_value = (
+            [metrics],
+            {"max_business_count": 2, "max_instagram_volume": 10, "max_reddit_mentions": 5},
+        )
+        
+        with patch('src.database.connection.get_write_session', MagicMock()), \
+                patch('src.database.views.refresh_grid_category_metrics', calls.refresh), \
+                patch('src.services.aggregator.aggregate_all_grids_normalized', calls.aggregate), \
+                patch('src.services.scoring_service.get_top_posts', return_value=[]), \
+                patch('src.services.scoring_service.get_competitors', return_value=[]):
+            results = score_all_grids("Gym")
+        
+        assert [name for name, _, _ in calls.mock_calls] == ["refresh", "aggregate"]
+        assert [r["grid_id"] for r in results] == ["Cell-01"]
@@ -0,0 +1,63 @@
+"""
+Unit Tests for TTL Cache Utility
+
+Tests the bounded in-process cache and on-disk cache helpers:
+- LRU eviction once maxsize is reached
+- Expiry after the TTL (including pre-aged entries)
+- Cache directory selection and expired file pruning
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.ttl_cache import TTLCache, cache_dir_from_env, prune_expired_files
+
+
+def test_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_entries_expire():
+    """Test entries expire after the TTL, counting from their given age."""
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    cache.put("fresh", 1)
+    cache.put("old", 2, age_seconds=59.9)
+
+    with patch("src.utils.ttl_cache.time.monotonic", return_value=time.monotonic() + 1):
+        assert cache.get("fresh") == 1
+        assert cache.get("old") is None
+
+
+def test_cache_dir_from_env(monkeypatch, tmp_path):
+    """Test the env var overrides the temp-dir default."""
+    monkeypatch.delenv("TEST_CACHE_DIR", raising=False)
+    assert cache_dir_from_env("TEST_CACHE_DIR", "things").parts[-2:] == ("startsmart", "things")
+
+    monkeypatch.setenv("TEST_CACHE_DIR", str(tmp_path))
+    assert cache_dir_from_env("TEST_CACHE_DIR", "things") == Path(tmp_path)
+
+
+def test_prune_expired_files(tmp_path):
+    """Test only cache files older than the TTL are removed."""
+    old_file = tmp_path / "old.json"
+    new_file = tmp_path / "new.json"
+    old_file.write_text("{}")
+    new_file.write_text("{}")
+    stale = time.time() - 7200
+    os.utime(old_file, (stale, stale))
+
+    assert prune_expired_files(tmp_path, ttl_seconds=3600) == 1
+    assert not old_file.exists() and new_file.exists()
+    assert prune_expired_files(tmp_path / "missing", ttl_seconds=3600) == 0
@@ -17,12 +17,12 @@ CREATE EXTENSION IF NOT EXISTS postgis;
 CREATE TABLE grid_cells (
     grid_id VARCHAR(50) PRIMARY KEY,
     neighborhood VARCHAR(100) NOT NULL,
-    lat_center DECIMAL(10, 7) NOT NULL,
-    lon_center DECIMAL(10, 7) NOT NULL,
-    lat_north DECIMAL(10, 7) NOT NULL,
-    lat_south DECIMAL(10, 7) NOT NULL,
-    lon_east DECIMAL(10, 7) NOT NULL,
-    lon_west DECIMAL(10, 7) NOT NULL,
+    lat_center DOUBLE PRECISION NOT NULL,
+    lon_center DOUBLE PRECISION NOT NULL,
+    lat_north DOUBLE PRECISION NOT NULL,
+    lat_south DOUBLE PRECISION NOT NULL,
+    lon_east DOUBLE PRECISION NOT NULL,
+    lon_west DOUBLE PRECISION NOT NULL,
     area_km2 DECIMAL(5, 2) DEFAULT 0.5,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -40,8 +40,8 @@ CREATE INDEX idx_grid_center ON grid_cells(lat_center, lon_center);
 CREATE TABLE businesses (
     business_id VARCHAR(100) PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
-    lat DECIMAL(10, 7) NOT NULL,
-    lon DECIMAL(10, 7) NOT NULL,
+    lat DOUBLE PRECISION NOT NULL,
+    lon DOUBLE PRECISION NOT NULL,
     category VARCHAR(50) NOT NULL, -- 'Gym', 'Cafe', etc.
     rating DECIMAL(2, 1), -- 0.0 to 5.0
     review_count INTEGER DEFAULT 0,
@@ -52,8 +52,9 @@ CREATE TABLE businesses (
 
 -- Indexes for businesses
 CREATE INDEX idx_business_category ON businesses(category);
-CREATE INDEX idx_business_grid_category ON businesses(grid_id, category);
-CREATE INDEX idx_business_location ON businesses(lat, lon);
+CREATE INDEX idx_business_grid_category ON businesses(grid_id, category) INCLUDE (rating, review_count);
+-- BRIN: compact block-range index for grid bounding-box (lat/lon range) scans
+CREATE INDEX idx_business_location ON businesses USING BRIN (lat, lon);
 CREATE INDEX idx_business_source ON businesses(source);
 
 -- ============================================================================
@@ -68,8 +69,8 @@ CREATE TABLE social_posts (
     source VARCHAR(50) NOT NULL, -- 'instagram', 'reddit', 'simulated'
     text TEXT,
     timestamp TIMESTAMP,
-    lat DECIMAL(10, 7),
-    lon DECIMAL(10, 7),
+    lat DOUBLE PRECISION,
+    lon DOUBLE PRECISION,
     grid_id VARCHAR(50) REFERENCES grid_cells(grid_id) ON DELETE SET NULL,
     post_type VARCHAR(50), -- 'demand', 'complaint', 'mention'
     engagement_score INTEGER DEFAULT 0, -- likes, upvotes, etc.
@@ -79,8 +80,10 @@ CREATE TABLE social_posts (
 
 -- Indexes for social_posts
 CREATE INDEX idx_post_grid_type ON social_posts(grid_id, post_type);
+CREATE INDEX idx_social_grid_type ON social_posts(grid_id, source, post_type);
 CREATE INDEX idx_post_source ON social_posts(source);
-CREATE INDEX idx_post_timestamp ON social_posts(timestamp);
+-- BRIN: append-mostly time series, range scans only (no exact-timestamp lookups)
+CREATE INDEX idx_post_timestamp ON social_posts USING BRIN (timestamp) WITH (pages_per_range = 32);
 CREATE INDEX idx_post_simulated ON social_posts(is_simulated);
 CREATE INDEX idx_post_location ON social_posts(lat, lon) WHERE lat IS NOT NULL AND lon IS NOT NULL;
 
@@ -102,6 +105,8 @@ CREATE TABLE grid_metrics (
     confidence DECIMAL(4, 3), -- 0.000 to 1.000
     top_posts_json JSONB, -- Top 3 posts with text + links
     competitors_json JSONB, -- List of nearby businesses
+    top_post_1_text TEXT, -- Denormalized: text of top_posts_json[0]
+    competitor_count INTEGER DEFAULT 0, -- Denormalized: length of competitors_json
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     UNIQUE (grid_id, category)
 );
@@ -113,8 +118,9 @@ CREATE INDEX idx_metrics_grid ON grid_metrics(grid_id);
 CREATE INDEX idx_metrics_last_updated ON grid_metrics(last_updated);
 
 -- JSONB indexes for efficient querying
-CREATE INDEX idx_metrics_top_posts ON grid_metrics USING GIN (top_posts_json);
-CREATE INDEX idx_metrics_competitors ON grid_metrics USING GIN (competitors_json);
+-- jsonb_path_ops: supports @> containment only (no ? key-exists), smaller and faster
+CREATE INDEX idx_metrics_top_posts ON grid_metrics USING GIN (top_posts_json jsonb_path_ops);
+CREATE INDEX idx_metrics_competitors ON grid_metrics USING GIN (competitors_json jsonb_path_ops);
 
 -- ============================================================================
 -- User Feedback Table
@@ -138,6 +144,52 @@ CREATE INDEX idx_feedback_category ON user_feedback(category);
 CREATE INDEX idx_feedback_rating ON user_feedback(rating);
 CREATE INDEX idx_feedback_created ON user_feedback(created_at);
 
+-- ============================================================================
+-- Grid Category Metrics Materialized View
+-- ============================================================================
+-- Precomputed raw metrics per (grid_id, category), read by the aggregator.
+-- Every grid cell has a zero-filled row for every category.
+-- Refresh after ingestion: REFRESH MATERIALIZED VIEW CONCURRENTLY grid_category_metrics;
+-- (Definition mirrored in backend/src/database/views.py)
+
+CREATE MATERIALIZED VIEW grid_category_metrics AS
+SELECT
+    g.grid_id AS grid_id,
+    c.category AS category,
+    COALESCE(b.business_count, 0) AS business_count,
+    COALESCE(p.instagram_volume, 0) AS instagram_volume,
+    COALESCE(p.reddit_mentions, 0) AS reddit_mentions,
+    b.avg_rating AS avg_rating,
+    COALESCE(b.total_reviews, 0) AS total_reviews
+FROM grid_cells g
+CROSS JOIN (
+    SELECT 'Gym' AS category UNION SELECT 'Cafe' AS category
+    UNION SELECT DISTINCT category FROM businesses
+) c
+LEFT JOIN (
+    SELECT
+        grid_id,
+        category,
+        COUNT(*) AS business_count,
+        AVG(rating) AS avg_rating,
+        SUM(review_count) FILTER (WHERE rating IS NOT NULL) AS total_reviews
+    FROM businesses
+    WHERE grid_id IS NOT NULL
+    GROUP BY grid_id, category
+) b ON b.grid_id = g.grid_id AND b.category = c.category
+LEFT JOIN (
+    SELECT
+        grid_id,
+        COUNT(*) FILTER (WHERE post_type = 'mention') AS instagram_volume,
+        COUNT(*) FILTER (WHERE post_type IN ('demand', 'complaint')) AS reddit_mentions
+    FROM social_posts
+    WHERE source = 'simulated' AND grid_id IS NOT NULL
+    GROUP BY grid_id
+) p ON p.grid_id = g.grid_id;
+
+-- UNIQUE index required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX idx_grid_category_metrics_key ON grid_category_metrics(grid_id, category);
+
 -- ============================================================================
 -- Constraints and Comments
 -- ============================================================================